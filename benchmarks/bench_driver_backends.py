@@ -0,0 +1,73 @@
+"""Compare the chrome and chrome-cdp driver backends command by command.
+
+Launches one browser per backend and runs the same commands on the login page:
+
+    python -m benchmarks.bench_driver_backends --rounds 50
+
+Reports the launch time and the median time of every command, so the cost of
+the chromedriver HTTP hop can be read off per command.
+"""
+import argparse
+import statistics
+import time
+from selenium.webdriver.common.by import By
+from src.utils.config_reader import ConfigReader
+from src.utils.driver_factory import DriverFactory
+
+BACKENDS = ("chrome", "chrome-cdp")
+
+
+def time_calls(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def commands(driver):
+    """The commands the page objects send most, as (name, callable)"""
+    username = (By.NAME, "username")
+    return [
+        ('find_element', lambda: driver.find_element(*username)),
+        ('find_elements', lambda: driver.find_elements(By.TAG_NAME, "input")),
+        ('is_displayed', lambda: driver.find_element(*username).is_displayed()),
+        ('get_attribute', lambda: driver.find_element(*username).get_attribute("name")),
+        ('text', lambda: driver.find_element(By.TAG_NAME, "h5").text),
+        ('send_keys + clear', lambda: (driver.find_element(*username).send_keys("Admin"),
+                                       driver.find_element(*username).clear())),
+        ('execute_script', lambda: driver.execute_script("return document.readyState")),
+        ('get_cookies', lambda: driver.get_cookies()),
+        ('screenshot', lambda: driver.get_screenshot_as_png())
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    args = parser.parse_args(argv)
+
+    login_url = ConfigReader.get_base_url() + "/web/index.php/auth/login"
+    results = {}
+    for backend in args.backends:
+        started = time.perf_counter()
+        driver = DriverFactory.get_driver(backend, headless=True)
+        launch = (time.perf_counter() - started) * 1000
+        try:
+            navigate = time_calls(lambda: driver.get(login_url), max(args.rounds // 10, 3))
+            driver.find_element(By.NAME, "username")
+            results[backend] = [('launch', launch), ('get', navigate)] + [
+                (name, time_calls(func, args.rounds)) for name, func in commands(driver)
+            ]
+        finally:
+            DriverFactory.quit_driver(driver)
+
+    print(f"{'command':<20}" + "".join(f"{backend:>14}" for backend in args.backends))
+    for row, (name, _) in enumerate(results[args.backends[0]]):
+        print(f"{name:<20}" + "".join(f"{results[backend][row][1]:>12.2f}ms" for backend in args.backends))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare the registry locators of HomePage with the f-string XPaths they replaced.
+
+Runs against a real browser on the Admin > System Users page:
+
+    python -m benchmarks.bench_locators --rounds 50
+
+For every field it reports the time to build the locator and the time for
+one find_element round-trip, plus the total for a cached handle.
+"""
+import argparse
+import statistics
+import time
+from selenium.webdriver.common.by import By
+from src.pages.home_page import HomePage
+from src.utils.auth_cache import AuthCache
+from src.utils.driver_factory import DriverFactory
+
+
+def legacy_locators(label):
+    """The per-call f-string XPaths HomePage used before the locator registry"""
+    return {
+        'field_input': (By.XPATH, f"//label[text()='{label}']/ancestor::div[contains(@class, 'oxd-input-group')]//input"),
+        'field_dropdown': (By.XPATH, f"//label[text()='{label}']/ancestor::div[contains(@class, 'oxd-input-group')]//div[@tabindex='0']")
+    }
+
+
+def time_calls(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    driver = DriverFactory.get_driver(headless=True)
+    try:
+        AuthCache.inject_into_driver(driver, AuthCache.get_session())
+        home_page = HomePage(driver)
+        home_page.navigate_to_page("/web/index.php/admin/viewSystemUsers")
+        home_page.wait_for_app_idle()
+
+        cases = [('field_input', 'Username'), ('field_dropdown', 'User Role'), ('field_dropdown', 'Status')]
+        print(f"{'locator':<30}{'build old':>12}{'build new':>12}{'find old':>12}{'find new':>12}")
+        for name, label in cases:
+            old = legacy_locators(label)[name]
+            new = HomePage.LOCATORS.get(name, label=label)
+
+            build_old = time_calls(lambda: legacy_locators(label)[name], args.rounds)
+            build_new = time_calls(lambda: HomePage.LOCATORS.get(name, label=label), args.rounds)
+            find_old = time_calls(lambda: driver.find_element(*old), args.rounds)
+            find_new = time_calls(lambda: driver.find_element(*new), args.rounds)
+            print(f"{name + ' ' + label:<30}{build_old:>10.4f}ms{build_new:>10.4f}ms{find_old:>10.2f}ms{find_new:>10.2f}ms")
+
+        username_input = HomePage.LOCATORS.get('field_input', label='Username')
+        home_page.elements.clear()
+        uncached = time_calls(lambda: (home_page.elements.clear(), home_page.find_element(username_input)), args.rounds)
+        cached = time_calls(lambda: home_page.find_element(username_input), args.rounds)
+        print(f"\nfind_element Username: {uncached:.2f}ms uncached, {cached:.2f}ms from the element cache")
+    finally:
+        DriverFactory.quit_driver(driver)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,69 @@
 import pytest
 import allure
+import json
 import os
 from datetime import datetime
 from dotenv import load_dotenv
 from src.utils.driver_factory import DriverFactory
+from src.utils.driver_pool import DriverPool
 from src.utils.config_reader import ConfigReader
+from src.utils.api_helper import OrangeHRMApiHelper
+from src.utils.attachments import AttachmentPipeline
+from src.utils.auth_cache import AuthCache
+from src.utils.browser_contexts import BrowserHost
+from src.utils.bulk_api_helper import OrangeHRMBulkApiHelper
+from src.utils.cassettes import MODES as CASSETTE_MODES, Cassette
+from src.utils.data_sweeper import sweep_orphaned_users, format_summary as format_sweep_summary
+from src.utils.duration_scheduler import DurationRecorder, DurationScheduling, TimingDatabase
+from src.utils.failure_artifacts import FailureArtifacts
+from src.utils.local_orangehrm import LocalOrangeHRMServer, is_local_base_url
+from src.utils.network_policy import NetworkPolicy
+from src.utils.page_metrics import PageBudgets
+from src.utils.profiler import CommandProfiler, write_profile
+from src.utils.resource_allocator import ProfileDirAllocator, get_worker_index
+from src.utils.resource_governor import ResourceGovernor
+from src.utils.session_stats import SessionStats
+from src.utils.user_pool import UserPool
+from src.utils.verification import Verifier
+from src.utils.wait_engine import WaitRecorder
 
 # Load environment variables from .env file
 load_dotenv()
 
+def pytest_addoption(parser):
+    """Command line overrides for config.ini, the highest configuration layer"""
+    group = parser.getgroup("orangehrm")
+    group.addoption("--browser", action="store", default=None, help="Browser to run tests in (chrome/chrome-cdp/firefox)")
+    group.addoption("--headless", action="store_const", const=True, default=None, help="Run the browser headless")
+    group.addoption("--headed", dest="headless", action="store_const", const=False, help="Run the browser with a window")
+    group.addoption("--base-url", action="store", default=None, help="OrangeHRM base URL")
+    group.addoption("--sweep-orphans", action="store_const", const=True, default=None,
+                    help="Delete stale test users left by earlier runs before the session starts")
+    group.addoption("--run-load", action="store_true", default=False, help="Also run tests marked 'load'")
+    group.addoption("--cassette-mode", action="store", default=None, choices=CASSETTE_MODES,
+                    help="Record or replay API traffic per test (off/record/replay/strict)")
+
 def pytest_configure(config):
-    """Set up the Allure environment"""
+    """Set up the configuration layers and the Allure environment"""
+    ConfigReader.set_cli_overrides({
+        'Browsers': {
+            'browser': config.getoption("browser"),
+            'headless': config.getoption("headless")
+        },
+        'OrangeHRM': {
+            'base_url': config.getoption("base_url")
+        },
+        'Sweeper': {
+            'on_session_start': config.getoption("sweep_orphans")
+        },
+        'Cassettes': {
+            'mode': config.getoption("cassette_mode")
+        }
+    })
+    
+    if ConfigReader.get_profiler_config()['enabled']:
+        CommandProfiler.install()
+    
     if not os.path.exists('reports/allure-results'):
         os.makedirs('reports/allure-results')
     
@@ -27,27 +80,205 @@ def pytest_configure(config):
         f.write(f"Python.Version={pytest.__version__}\n")
         f.write(f"Timestamp={datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
+def pytest_collection_modifyitems(config, items):
+    """Load tests hammer the server for a while, so they only run on request"""
+    if config.getoption("run_load"):
+        return
+    skip_load = pytest.mark.skip(reason="load test, use --run-load to run it")
+    for item in items:
+        if "load" in item.keywords:
+            item.add_marker(skip_load)
+
+def pytest_sessionstart(session):
+    """Connect to the shared Chrome; sweep orphaned test users once per run, on the controller only"""
+    if hasattr(session.config, "workerinput") and 'browser_host' in session.config.workerinput:
+        BrowserHost.set_shared(BrowserHost.connect(session.config.workerinput['browser_host']))
+    if hasattr(session.config, "workerinput"):
+        return
+    if not ConfigReader.get_sweeper_config()['on_session_start']:
+        return
+    if is_local_base_url(ConfigReader.get_base_url()):
+        print("\n⚠️ Skipping orphaned user sweep: the local stand-in starts empty")
+        return
+    
+    try:
+        print(f"\n{format_sweep_summary(sweep_orphaned_users())}")
+    except Exception as e:
+        print(f"\n⚠️ Orphaned user sweep failed: {e}")
+
+def pytest_collection_finish(session):
+    """Pre-launch browsers once collection shows that some test will ask for a driver"""
+    if any('driver' in getattr(item, 'fixturenames', ()) for item in session.items):
+        _start_driver_prelaunch(session.config)
+
+def _start_driver_prelaunch(config):
+    """Launch browsers before the first test needs one, in xdist workers or a run without workers"""
+    prelaunch_config = ConfigReader.get_prelaunch_config()
+    if not prelaunch_config['enabled'] or config.option.collectonly:
+        return
+    if not hasattr(config, "workerinput") and getattr(config.option, "numprocesses", None):
+        return  # xdist controller, its workers launch their own
+    DriverFactory.start_prelaunch(
+        count=prelaunch_config['count'],
+        spares=prelaunch_config['spares'],
+        idle_timeout=prelaunch_config['idle_timeout']
+    )
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Size -n auto by available memory and measured browser RSS; None keeps xdist's CPU count"""
+    if os.environ.get("PYTEST_XDIST_AUTO_NUM_WORKERS"):
+        return None
+    # Runs before pytest_configure, so the --browser override is not in ConfigReader yet
+    browser = (config.getoption("browser") or ConfigReader.get_browser_config()['browser']).lower()
+    prelaunch_config = ConfigReader.get_prelaunch_config()
+    spares = prelaunch_config['spares'] if prelaunch_config['enabled'] else 0
+    contexts = ConfigReader.get_browser_contexts_config()['enabled']
+    return ResourceGovernor.from_config().auto_workers(browser, 1 + spares, contexts)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share one Chrome between all xdist workers when browser contexts are enabled"""
+    if _browser_contexts_wanted(node.config):
+        node.workerinput['browser_host'] = DriverFactory.start_browser_host().address
+
+def _browser_contexts_wanted(config):
+    return (ConfigReader.get_browser_config()['browser'].lower() == "chrome-cdp" and ConfigReader.get_browser_contexts_config()['enabled']
+            and not config.option.collectonly)
+
+def pytest_sessionfinish(session):
+    """Finish writing attachments, hand this worker's counters to the xdist controller
+    and, on the controller, store the test durations for the next run's schedule"""
+    DriverFactory.stop_prelaunch()
+    DriverFactory.stop_browser_host()
+    ProfileDirAllocator.cleanup()
+    AttachmentPipeline.shutdown()
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput['session_stats'] = SessionStats.snapshot()
+        return
+    
+    scheduling_config = ConfigReader.get_scheduling_config()
+    if scheduling_config['enabled']:
+        try:
+            DurationRecorder.save(TimingDatabase(scheduling_config['database'], scheduling_config['smoothing']))
+        except Exception as e:
+            print(f"\n⚠️ Could not store test durations: {e}")
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Longest-first work stealing from recorded durations; None keeps xdist's own scheduler"""
+    scheduling_config = ConfigReader.get_scheduling_config()
+    if not scheduling_config['enabled'] or config.getoption("dist") != "worksteal":
+        return None
+    durations = TimingDatabase(scheduling_config['database'], scheduling_config['smoothing']).load()
+    if not durations:
+        return None
+    return DurationScheduling(config, log, durations)
+
+def pytest_runtest_logreport(report):
+    """Add setup, call and teardown time to the test's recorded duration"""
+    DurationRecorder.add(report)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the counters of a finished xdist worker"""
+    SessionStats.merge(getattr(node, "workeroutput", {}).get('session_stats', {}))
+
+def pytest_terminal_summary(terminalreporter):
+    """Report where setup time went across all workers"""
+    lines = SessionStats.summary_lines()
+    if lines:
+        terminalreporter.section("performance summary")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    """Start recording WebDriver commands and HTTP calls, and replay the API cassette while fixtures set up"""
+    profiler_config = ConfigReader.get_profiler_config()
+    if profiler_config['enabled']:
+        CommandProfiler.start(item.nodeid, profiler_config['max_records'])
+    cassettes_config = ConfigReader.get_cassettes_config()
+    cassette = Cassette.for_test(item, cassettes_config['directory'], cassettes_config['mode'],
+                                 cassettes_config['max_age_days'])
+    if cassette is None:
+        yield
+        return
+    # Only setup traffic is replayed; the test body and teardown talk to the server
+    with cassette:
+        yield
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    """Write the test's command profile once its fixtures are torn down"""
+    yield
+    profile = CommandProfiler.stop()
+    if profile:
+        profiler_config = ConfigReader.get_profiler_config()
+        write_profile(profile, profiler_config['output_dir'], profiler_config['round_trip_warning'])
+        # Attached under the attachment policy, so it needs the outcome of the test
+        reports = [getattr(item, f"rep_{when}", None) for when in ("setup", "call")]
+        if any(report is not None and report.failed for report in reports):
+            AttachmentPipeline.on_test_failed()
+    AttachmentPipeline.end_test()
+
+@pytest.fixture(scope="session", autouse=True)
+def local_orangehrm():
+    """
+    In-memory OrangeHRM stand-in for this worker, started when base_url is 'local'
+    """
+    if not is_local_base_url(ConfigReader.get_base_url()):
+        yield None
+        return
+    
+    # A fixed port is offset per xdist worker, port 0 picks a free one
+    server_config = ConfigReader.get_local_server_config()
+    port = server_config['port'] + get_worker_index() if server_config['port'] else 0
+    server = LocalOrangeHRMServer(server_config['host'], port).start()
+    ConfigReader.set_cli_override('OrangeHRM', 'base_url', server.url)
+    
+    yield server
+    
+    server.stop()
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    Per-worker pool of warm WebDrivers shared by all tests in the session
+    """
+    pool_config = ConfigReader.get_driver_pool_config()
+    pool = DriverPool(max_reuse=pool_config['max_reuse'])
+    
+    yield pool
+    
+    pool.shutdown()
+
 @pytest.fixture(scope="function")
-def driver(request):
+def driver(request, driver_pool):
     """
     Set up and tear down the WebDriver
     """
     # Simplified browser configuration
     try:
-        config = ConfigReader.read_config()
+        config = ConfigReader.get_config()
         browser = config.get('Browsers', 'browser', fallback='chrome')
     except:
         browser = "chrome"
     
+    pool_enabled = ConfigReader.get_driver_pool_config()['enabled']
+    
     print(f"Creating driver with browser: {browser}")
     
-    # Set up the driver
-    driver = DriverFactory.get_driver(browser)
+    # Set up the driver, reusing a warm one from the pool when enabled
+    if pool_enabled:
+        driver = driver_pool.acquire(browser)
+    else:
+        driver = DriverFactory.get_driver(browser)
     
     print("Driver created successfully!")
     
     # Add allure environment info - using attach instead of environment
-    allure.attach(
+    AttachmentPipeline.attach(
         f"Browser: {browser}",
         name="environment-info",
         attachment_type=allure.attachment_type.TEXT
@@ -57,22 +288,105 @@ def driver(request):
     test_name = request.node.name
     allure.dynamic.title(test_name)
     
+    # Only time the waits of this test
+    WaitRecorder.drain()
+    
+    # Block assets the test never asserts on (Chrome only)
+    network_policy = None
+    if ConfigReader.get_network_config()['enabled']:
+        network_policy = NetworkPolicy.for_test(request.node)
+        network_policy.apply(driver)
+    
+    # Load-time budgets checked by navigate_to_page
+    PageBudgets.for_test(request.node).attach_to(driver)
+    
     # Return the driver to the test
     yield driver
     
-    # Take screenshot on test failure
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
+    # Attach blocked/allowed request counters
+    if network_policy:
         try:
-            allure.attach(
-                driver.get_screenshot_as_png(),
-                name=f"failure_{test_name}",
-                attachment_type=allure.attachment_type.PNG
-            )
-        except:
-            pass
+            network_policy.finish(driver)
+        except Exception as e:
+            print(f"⚠️ Could not collect network policy counters: {e}")
+    
+    # Attach how long each wait took against its timeout, for tuning
+    wait_records = WaitRecorder.drain()
+    if wait_records:
+        AttachmentPipeline.attach(
+            json.dumps(wait_records, indent=2),
+            name="wait-timings",
+            attachment_type=allure.attachment_type.JSON
+        )
     
-    # Tear down the driver
-    driver.quit()
+    # Collect screenshot, DOM, console, network log and cookies on test failure;
+    # they are compressed and written in the background
+    test_failed = hasattr(request.node, "rep_call") and request.node.rep_call.failed
+    if test_failed and ConfigReader.get_failure_artifacts_config()['enabled']:
+        FailureArtifacts.from_config().capture(driver, test_name)
+    
+    # Return the driver to the pool, or tear it down
+    if pool_enabled:
+        driver_pool.release(driver, discard=test_failed)
+    else:
+        DriverFactory.quit_driver(driver)
+
+@pytest.fixture(scope="function")
+def auth_session():
+    """
+    Cached admin session, logged in once per worker
+    """
+    return AuthCache.get_session()
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, auth_session):
+    """
+    WebDriver that is already logged in as admin, without going through the login form
+    """
+    AuthCache.inject_into_driver(driver, auth_session)
+    return driver
+
+@pytest.fixture(scope="function")
+def api_helper(auth_session):
+    """
+    API helper authenticated with the cached admin session
+    """
+    return AuthCache.apply_to_api_helper(OrangeHRMApiHelper(base_url=auth_session.base_url), auth_session)
+
+@pytest.fixture(scope="function")
+def verifier(api_helper):
+    """
+    Checks backend state through the API before confirming it in the UI
+    """
+    return Verifier.from_config(api_helper)
+
+@pytest.fixture(scope="session")
+def user_pool():
+    """
+    Per-worker pool of pre-created users, deleted in batches at session end
+    """
+    pool_config = ConfigReader.get_user_pool_config()
+    refresh_auth = lambda helper: AuthCache.apply_to_api_helper(helper, AuthCache.get_session())
+    
+    pool = UserPool(
+        refresh_auth(OrangeHRMBulkApiHelper()),
+        target_size=pool_config['size'],
+        prefix=pool_config['prefix'],
+        lease_timeout=pool_config['lease_timeout'],
+        authenticate=refresh_auth
+    ).start()
+    
+    yield pool
+    
+    pool.shutdown()
+    pool.api_helper.close()
+
+@pytest.fixture(scope="function")
+def test_user(user_pool):
+    """
+    A system user leased from the pool, created ahead of time
+    """
+    return user_pool.lease()
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -81,4 +395,8 @@ def pytest_runtest_makereport(item, call):
     """
     outcome = yield
     rep = outcome.get_result()
-    setattr(item, f"rep_{rep.when}", rep)
\ No newline at end of file
+    setattr(item, f"rep_{rep.when}", rep)
+    
+    # Attachments kept for failures are attached to the failing test
+    if rep.failed:
+        AttachmentPipeline.on_test_failed()
\ No newline at end of file
@@ -1,7 +1,95 @@
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException,
+    StaleElementReferenceException, TimeoutException, WebDriverException
+)
 from src.utils.config_reader import ConfigReader
+from src.utils.locators import ElementCache, xpath_literal
+from src.utils.page_metrics import PageMetrics
+from src.utils.profiler import profiled_action
+from src.utils.wait_engine import WaitEngine
+
+
+# translate() arguments for case-insensitive matching, as XPath 1.0 has no lower-case()
+UPPERCASE = "'ABCDEFGHIJKLMNOPQRSTUVWXYZ'"
+LOWERCASE = "'abcdefghijklmnopqrstuvwxyz'"
+
+# A cached handle that hits one of these is dropped and the element looked up again
+CACHED_ELEMENT_ERRORS = (
+    StaleElementReferenceException, ElementClickInterceptedException, ElementNotInteractableException
+)
+
+
+# Resolves every form field by its label in one round-trip and fills the plain
+# text inputs right away. Returns null (so the caller keeps waiting) until all
+# labels are rendered, otherwise the controls of the fields still to be handled.
+RESOLVE_AND_FILL_FORM = """
+    var fields = arguments[0];
+    var groups = document.querySelectorAll('.oxd-input-group');
+    var byLabel = {};
+    for (var i = 0; i < groups.length; i++) {
+        var label = groups[i].querySelector('label');
+        if (label) { byLabel[label.textContent.trim()] = groups[i]; }
+    }
+    var controls = [];
+    for (var j = 0; j < fields.length; j++) {
+        var group = byLabel[fields[j].label];
+        if (!group) { return null; }
+        var control = fields[j].kind === 'select'
+            ? group.querySelector('.oxd-select-text')
+            : group.querySelector('input');
+        if (!control) { return null; }
+        controls.push(control);
+    }
+    var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (var k = 0; k < fields.length; k++) {
+        if (fields[k].kind === 'text') {
+            setValue.call(controls[k], fields[k].value);
+            controls[k].dispatchEvent(new Event('input', {bubbles: true}));
+            controls[k].dispatchEvent(new Event('change', {bubbles: true}));
+        }
+    }
+    return controls;
+"""
+
+# Opens each oxd dropdown and picks the option in the page, one frame at a
+# time. Resolves with the option texts that could not be selected.
+SELECT_OPTIONS = """
+    var done = arguments[arguments.length - 1];
+    var items = arguments[0], timeoutMs = arguments[1];
+    var failures = [];
+    function findOption(text) {
+        var options = document.querySelectorAll('div[role="listbox"] div[role="option"]');
+        for (var i = 0; i < options.length; i++) {
+            if (options[i].textContent.trim() === text) { return options[i]; }
+        }
+        return null;
+    }
+    function next(index) {
+        if (index >= items.length) { return done(failures); }
+        var control = items[index][0], text = items[index][1];
+        var started = Date.now();
+        control.click();
+        (function poll() {
+            var option = findOption(text);
+            if (option) {
+                option.dispatchEvent(new MouseEvent('mousedown', {bubbles: true}));
+                option.click();
+                return requestAnimationFrame(function () {
+                    if (control.textContent.trim() !== text) { failures.push(text); }
+                    next(index + 1);
+                });
+            }
+            if (Date.now() - started > timeoutMs) {
+                failures.push(text);
+                return next(index + 1);
+            }
+            requestAnimationFrame(poll);
+        })();
+    }
+    next(0);
+"""
 
 
 class BasePage:
@@ -9,81 +97,203 @@ class BasePage:
         self.driver = driver
         self.wait_timeout = ConfigReader.get_wait_times()['explicit_wait']
         self.base_url = ConfigReader.get_base_url()
+        self.waits = WaitEngine(driver, **ConfigReader.get_wait_engine_config())
+        self.elements = ElementCache.for_driver(driver)
 
+    @profiled_action
     def find_element(self, locator, timeout=None):
         """Find and return a visible element"""
+        element = self._cached_visible_element(locator)
+        if element is not None:
+            return element
+
         timeout = timeout or self.wait_timeout
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
+        element = self.waits.until(EC.visibility_of_element_located(locator), timeout)
+        self.elements.put(locator, element)
+        return element
 
+    @profiled_action
     def find_elements(self, locator, timeout=None):
         """Find and return all elements that are present"""
         timeout = timeout or self.wait_timeout
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_all_elements_located(locator)
-        )
+        return self.waits.until(EC.presence_of_all_elements_located(locator), timeout)
 
+    @profiled_action
     def click(self, locator, timeout=None):
         """Click on an element"""
+        # A cached handle is clicked directly: one round-trip instead of a wait
+        element = self.elements.get(locator)
+        if element is not None:
+            try:
+                element.click()
+                return
+            except CACHED_ELEMENT_ERRORS:
+                self.elements.discard(locator)
+
         timeout = timeout or self.wait_timeout
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
-        )
+        element = self.waits.until(EC.element_to_be_clickable(locator), timeout)
+        self.elements.put(locator, element)
         element.click()
 
+    @profiled_action
     def type_text(self, locator, text, clear_first=True, timeout=None):
         """Type text into an element"""
+        element = self.elements.get(locator)
+        if element is not None:
+            try:
+                self._type_into(element, text, clear_first)
+                return
+            except CACHED_ELEMENT_ERRORS:
+                self.elements.discard(locator)
+
         timeout = timeout or self.wait_timeout
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
-        
+        element = self.waits.until(EC.visibility_of_element_located(locator), timeout)
+        self.elements.put(locator, element)
+        self._type_into(element, text, clear_first)
+
+    @profiled_action
     def navigate_to_page(self, path=""):
         """Navigate to a specific path on the site"""
-        self.driver.get(f"{self.base_url}{path}")
-            
+        self.elements.clear()
+        url = f"{self.base_url}{path}"
+        self.driver.get(url)
+        
+        metrics_config = ConfigReader.get_page_metrics_config()
+        if metrics_config['enabled']:
+            self._record_page_metrics(url, metrics_config['budget_metric'])
+
+    def _record_page_metrics(self, url, budget_metric):
+        """Measure the page just loaded; raises PageBudgetExceeded in budget fail mode"""
+        try:
+            if budget_metric == 'app_ready':
+                self.waits.until_app_idle(self.wait_timeout)
+            metrics = PageMetrics.capture(self.driver)
+        except (TimeoutException, WebDriverException) as e:
+            print(f"⚠️ Could not capture page metrics for {url}: {e}")
+            return
+        PageMetrics.record(self.driver, url, metrics)
+
+    @profiled_action
     def wait_for_element_visible(self, locator, timeout=None):
         """Wait for an element to be visible"""
         timeout = timeout or self.wait_timeout
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
-        
+        return self.waits.until(EC.visibility_of_element_located(locator), timeout)
+
+    @profiled_action
     def wait_for_element_clickable(self, locator, timeout=None):
         """Wait for an element to be clickable"""
         timeout = timeout or self.wait_timeout
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
+        return self.waits.until(EC.element_to_be_clickable(locator), timeout)
+
+    @profiled_action
+    def wait_for_app_idle(self, timeout=None):
+        """Wait until OrangeHRM has finished loading or searching"""
+        timeout = timeout or self.wait_timeout
+        return self.waits.until_app_idle(timeout)
+
+    @profiled_action
+    def fill_form(self, fields, timeout=None):
+        """Fill a form in as few round-trips as possible.
+
+        ``fields`` maps a field label to a value, or to a ``(kind, value)``
+        tuple where kind is ``text`` (default), ``select`` for oxd dropdowns or
+        ``autocomplete``. Text fields are set in the same script that locates
+        every field, dropdowns are picked in a single browser-side script, and
+        only autocompletes (which need real key events) and dropdowns the
+        script could not handle fall back to per-field interaction.
+        """
+        if not fields:
+            return
+
+        timeout = timeout or self.wait_timeout
+        specs = []
+        for label, value in fields.items():
+            kind, value = value if isinstance(value, tuple) else ('text', value)
+            specs.append({'label': label, 'kind': kind, 'value': value})
+
+        controls = self.waits.until(
+            lambda driver: driver.execute_script(RESOLVE_AND_FILL_FORM, specs),
+            timeout, f"form fields {list(fields)}"
         )
-        
+
+        selects = [[control, spec['value']] for spec, control in zip(specs, controls) if spec['kind'] == 'select']
+        if selects:
+            failed = self.waits.run_async(
+                "form dropdowns", timeout, SELECT_OPTIONS, selects, 1000
+            )
+            # None means the script timed out, so every dropdown is picked by hand
+            for spec in specs:
+                if spec['kind'] == 'select' and (failed is None or spec['value'] in failed):
+                    self._select_oxd_option(spec['label'], spec['value'])
+
+        for spec, control in zip(specs, controls):
+            if spec['kind'] == 'autocomplete':
+                self._fill_autocomplete(control, spec['value'])
+
+    def _cached_visible_element(self, locator):
+        """Return the cached handle for a locator if it is still attached and visible"""
+        element = self.elements.get(locator)
+        if element is None:
+            return None
+        try:
+            if element.is_displayed():
+                return element
+        except StaleElementReferenceException:
+            pass
+        self.elements.discard(locator)
+        return None
+
+    @staticmethod
+    def _type_into(element, text, clear_first):
+        if clear_first:
+            element.clear()
+        element.send_keys(text)
+
+    def _select_oxd_option(self, label, option_text):
+        """Pick an oxd dropdown option with real clicks"""
+        group = f"//div[contains(@class, 'oxd-input-group')][.//label[normalize-space()={xpath_literal(label)}]]"
+        self.click((By.XPATH, f"{group}//div[contains(@class, 'oxd-select-text')]"))
+        self.click((By.XPATH, f"//div[@role='listbox']//div[@role='option'][normalize-space()={xpath_literal(option_text)}]"))
+
+    def _fill_autocomplete(self, input_element, text):
+        """Type into an autocomplete with real key events and pick the first suggestion that matches it.
+
+        The listbox shows a "Searching...." placeholder option until the
+        search returns, so waiting for any first option could click that.
+        """
+        input_element.clear()
+        input_element.send_keys(text)
+        typed = xpath_literal(" ".join(text.split()).lower())
+        suggestion = (f"//div[@role='listbox']//div[@role='option']"
+                      f"[contains(translate(normalize-space(), {UPPERCASE}, {LOWERCASE}), {typed})]"
+                      f"[not(starts-with(normalize-space(), 'Searching'))]")
+        self.click((By.XPATH, f"({suggestion})[1]"))
+
+    @profiled_action
     def get_text(self, locator, timeout=None):
         """Get text from an element"""
         return self.find_element(locator, timeout).text
-        
+
+    @profiled_action
     def get_attribute(self, locator, attribute, timeout=None):
         """Get attribute value from an element"""
         return self.find_element(locator, timeout).get_attribute(attribute)
-    
+
+    @profiled_action
     def is_element_visible(self, locator, timeout=5):
         """Check if an element is visible"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self.waits.until(EC.visibility_of_element_located(locator), timeout)
             return True
         except TimeoutException:
             return False
-    
+
+    @profiled_action
     def is_element_present(self, locator, timeout=5):
         """Check if an element is present in the DOM"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self.waits.until(EC.presence_of_element_located(locator), timeout)
             return True
         except TimeoutException:
-            return False
\ No newline at end of file
+            return False
+
@@ -1,15 +1,31 @@
-from selenium.webdriver.common.by import By
 from src.pages.base_page import BasePage
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from src.utils.locators import Locator, LocatorRegistry
 
 
 class HomePage(BasePage):
-    # Locators
-    PROFILE_IMAGE = (By.XPATH, '//img[@alt="profile picture" and @class="oxd-userdropdown-img"]')
-    ADMIN_NAVIGATION_BUTTON = (By.XPATH, "//span[text()='Admin']")
-    SEARCH_BUTTON = (By.XPATH, "//button[@type='submit' and contains(., 'Search')]")
+    # Locators. Form fields are anchored on their label and step to the
+    # sibling input wrapper instead of scanning ancestors and descendants.
+    LOCATORS = LocatorRegistry([
+        Locator("profile_image", css="img.oxd-userdropdown-img[alt='profile picture']"),
+        Locator("admin_navigation", xpath="//span[text()='Admin']"),
+        Locator("search_button", xpath="//button[@type='submit'][contains(., 'Search')]"),
+        Locator("field_input", xpath="//label[text()={label}]/../following-sibling::div[1]//input"),
+        Locator("field_dropdown", xpath="//label[text()={label}]/../following-sibling::div[1]//div[@tabindex='0']"),
+        Locator("listbox_option", cacheable=False,
+                xpath="//div[@role='listbox']/div[@role='option']/span[text()={option}]"),
+        Locator("first_listbox_option", cacheable=False, css="div[role='listbox'] > div[role='option']"),
+        Locator("table_rows", cacheable=False, css="div.oxd-table-body div[role='row']"),
+        Locator("delete_user_button", cacheable=False,
+                xpath="//div[@role='row'][div[@role='cell']/div[normalize-space()={username}]]"
+                      "//button[i[contains(@class, 'bi-trash')]]"),
+        Locator("confirm_delete_button", xpath="//button[contains(., 'Yes, Delete')]"),
+        Locator("no_records_message", xpath="//span[text()='No Records Found']")
+    ])
+    PROFILE_IMAGE = LOCATORS.get("profile_image")
+    ADMIN_NAVIGATION_BUTTON = LOCATORS.get("admin_navigation")
+    SEARCH_BUTTON = LOCATORS.get("search_button")
    
     def __init__(self, driver):
         super().__init__(driver)
@@ -22,46 +38,47 @@ class HomePage(BasePage):
     def select_dropdown(self, label: str, option_text: str):
         """Select an option from dropdown by label"""
         # Click dropdown
-        dropdown_locator = (By.XPATH, 
-            f"//label[text()='{label}']/ancestor::div[contains(@class, 'oxd-input-group')]//div[@tabindex='0']"
-        )
-        self.click(dropdown_locator)
+        self.click(self.LOCATORS.get("field_dropdown", label=label))
         print(f"✅ Clicked {label} dropdown")
 
         # Select option from listbox
-        option_locator = (By.XPATH, 
-            f"//div[@role='listbox']//div[@role='option']//span[text()='{option_text}']"
-        )
-        self.click(option_locator)
+        self.click(self.LOCATORS.get("listbox_option", option=option_text))
         print(f"✅ Selected '{option_text}' from {label} dropdown")
 
     def type_in_employee_name(self, employee_name):
         """Type employee name and select from autocomplete"""
         # Type in employee name field
-        employee_input_locator = (By.XPATH,
-            "//label[text()='Employee Name']/ancestor::div[contains(@class, 'oxd-input-group')]//input[@placeholder='Type for hints...']"
-        )
-        self.type_text(employee_input_locator, employee_name)
+        self.type_text(self.LOCATORS.get("field_input", label="Employee Name"), employee_name)
         print(f"✅ Typed '{employee_name}' in Employee Name field")
 
         # Wait for searching to complete
-        WebDriverWait(self.driver, 10).until_not(
-            EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "Searching...")
-        )
+        self.wait_for_app_idle(timeout=10)
 
         # Click first option from autocomplete
-        first_option_locator = (By.XPATH, "//div[@role='listbox']//div[@role='option'][1]")
-        self.click(first_option_locator)
+        self.click(self.LOCATORS.get("first_listbox_option"))
         print("✅ Selected employee from autocomplete")
 
     def type_in_username(self, username):
         """Type username in the username field"""
-        username_input_locator = (By.XPATH,
-            "//label[text()='Username']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
-        )
-        self.type_text(username_input_locator, username)
+        self.type_text(self.LOCATORS.get("field_input", label="Username"), username)
         print(f"✅ Typed username '{username}'")
     
+    def search_users(self, username=None, user_role=None, employee_name=None, status=None):
+        """Fill the System Users search form in as few round-trips as possible and search"""
+        fields = {}
+        if username is not None:
+            fields['Username'] = username
+        if user_role is not None:
+            fields['User Role'] = ('select', user_role)
+        if employee_name is not None:
+            fields['Employee Name'] = ('autocomplete', employee_name)
+        if status is not None:
+            fields['Status'] = ('select', status)
+        
+        self.fill_form(fields)
+        print(f"✅ Filled user search form: {', '.join(fields)}")
+        self.click_search_button()
+    
     def click_search_button(self):
         """Click the search button"""
         self.click(self.SEARCH_BUTTON)
@@ -74,15 +91,10 @@ class HomePage(BasePage):
         for attempt in range(max_retries):
             try:
                 # Wait for search results
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH, "//div[@role='row']"))
-                )
+                self.waits.until(EC.presence_of_element_located(self.LOCATORS.get("table_rows")), 10)
                 
                 # Find and click delete button
-                delete_button_locator = (By.XPATH, 
-                    f"//div[@role='row'][.//div[contains(text(), '{username}')]]//button[.//i[contains(@class, 'bi-trash')]]"
-                )
-                self.click(delete_button_locator)
+                self.click(self.LOCATORS.get("delete_user_button", username=username))
                 print(f"✅ Clicked delete button for user: {username}")
                 return
                 
@@ -98,18 +110,20 @@ class HomePage(BasePage):
 
     def confirm_delete(self):
         """Click the delete confirmation button"""
-        confirm_button_locator = (By.XPATH, "//button[contains(., 'Yes, Delete')]")
-        self.click(confirm_button_locator)
+        self.click(self.LOCATORS.get("confirm_delete_button"))
         print("✅ Confirmed deletion")
 
-    def verify_no_records_found(self):
+    def verify_no_records_found(self, timeout=10):
         """Verify that 'No Records Found' message is displayed"""
-        no_records_locator = (By.XPATH, "//span[text()='No Records Found']")
-        
         try:
-            self.wait_for_element_visible(no_records_locator, timeout=10)
+            self.wait_for_element_visible(self.LOCATORS.get("no_records_message"), timeout=timeout)
             print("✅ 'No Records Found' message is displayed")
             return True
         except TimeoutException:
             print("❌ 'No Records Found' message not found")
-            return False
\ No newline at end of file
+            return False
+
+    def search_shows_no_records(self, timeout=10):
+        """Search again and verify that the results are empty"""
+        self.click_search_button()
+        return self.verify_no_records_found(timeout)
@@ -1,8 +1,7 @@
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from src.pages.base_page import BasePage
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import logging
 
 
@@ -44,6 +43,16 @@ class LoginPage(BasePage):
             self.logger.info("Dashboard not found - login failed")
             return False
     
+    def wait_for_login_outcome(self, timeout=10):
+        """Wait until either the dashboard or an error message is shown"""
+        try:
+            self.waits.until(EC.any_of(
+                EC.visibility_of_element_located(self.DASHBOARD_ELEMENT),
+                EC.visibility_of_element_located(self.ERROR_MESSAGE)
+            ), timeout, "dashboard or login error")
+        except TimeoutException:
+            self.logger.info("Neither dashboard nor error message appeared")
+    
     def get_error_message(self, timeout=5):
         """Get error message if login failed"""
         self.logger.debug("Checking for error message")
@@ -64,11 +73,14 @@ class LoginPage(BasePage):
         self.enter_password(password)
         self.click_login_button()
         
+        # Wait for whichever outcome shows first, not for the dashboard to time out
+        self.wait_for_login_outcome()
+        
         # Check result and log
-        if self.is_login_successful():
+        if self.is_login_successful(timeout=0.1):
             self.logger.info("✅ Login successful")
             return True
         else:
-            error_msg = self.get_error_message() or "Unknown error"
+            error_msg = self.get_error_message(timeout=0.1) or "Unknown error"
             self.logger.warning(f"❌ Login failed: {error_msg}")
             return False
\ No newline at end of file
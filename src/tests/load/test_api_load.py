@@ -0,0 +1,29 @@
+import allure
+import pytest
+from src.utils.config_reader import ConfigReader
+from src.utils.load_runner import attach_report, format_report, run_load
+
+
+
+@allure.epic("OrangeHRM User Management")
+@allure.feature("Capacity")
+@allure.story("Concurrent user lifecycle journeys via API")
+@allure.description("""
+This test replays the create → search → delete user journey from concurrent
+virtual users with the [Load] settings and checks the error rate.
+Run it with --run-load, ideally against your own deployment.
+""")
+@pytest.mark.load
+def test_user_lifecycle_under_load():
+    load_config = ConfigReader.get_load_config()
+    
+    with allure.step("Replay the journey from concurrent virtual users"):
+        report = run_load(journey="user_lifecycle")
+        attach_report(report, report['files'])
+        print(format_report(report))
+        
+    with allure.step("Verify the error rate"):
+        journey = next(row for row in report['endpoints'] if row['name'] == "journey user_lifecycle")
+        assert journey['count'] > 0, "No journey completed"
+        assert journey['error_rate'] <= load_config['max_error_rate'], \
+            f"Journey error rate {journey['error_rate']:.1%} is above {load_config['max_error_rate']:.1%}"
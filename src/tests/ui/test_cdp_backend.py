@@ -0,0 +1,104 @@
+import allure
+import pytest
+from selenium.common.exceptions import WebDriverException
+from src.pages.login_page import LoginPage
+from src.utils.api_helper import get_api_helper_with_auth
+from src.utils.cdp_driver import find_chrome_binary
+from src.utils.config_reader import ConfigReader
+from src.utils.driver_factory import DriverFactory
+from src.utils.local_orangehrm import LocalOrangeHRMServer
+
+
+
+@pytest.fixture(scope="module")
+def local_server():
+    """
+    A local OrangeHRM stand-in for this module, used as base_url while it runs
+    """
+    server = LocalOrangeHRMServer().start()
+    previous_base_url = ConfigReader.get_base_url()
+    ConfigReader.set_cli_override('OrangeHRM', 'base_url', server.url)
+
+    yield server
+
+    ConfigReader.set_cli_override('OrangeHRM', 'base_url', previous_base_url)
+    server.stop()
+
+@pytest.fixture
+def cdp_driver(local_server):
+    """
+    A headless chrome-cdp driver, skipping the test where Chrome cannot run
+    """
+    try:
+        find_chrome_binary()
+        driver = DriverFactory.get_driver("chrome-cdp", headless=True)
+    except WebDriverException as e:
+        pytest.skip(f"Chrome is not available: {e.msg}")
+
+    yield driver
+
+    DriverFactory.quit_driver(driver)
+
+
+@allure.epic("Test Framework")
+@allure.feature("chrome-cdp backend")
+@allure.description("""
+This test drives the login form of the local stand-in over the DevTools protocol:
+1. Open the login page
+2. Login with the admin credentials
+3. Verify the dashboard is displayed
+""")
+def test_login_over_devtools(cdp_driver):
+    with allure.step("Login with admin credentials"):
+        login_page = LoginPage(cdp_driver)
+        login_page.navigate_to_page()
+        orangehrm_config = ConfigReader.get_orangehrm_config()
+        logged_in = login_page.login(orangehrm_config['admin_username'], orangehrm_config['admin_password'])
+
+    with allure.step("Verify the dashboard is displayed"):
+        assert logged_in == True, "Login over DevTools failed"
+        assert cdp_driver.current_url.endswith("/dashboard/index")
+
+
+@allure.epic("Test Framework")
+@allure.feature("chrome-cdp backend")
+@allure.description("""
+This test checks that a rejected login shows the error message:
+1. Login with an invalid password
+2. Verify the error message is displayed
+""")
+def test_invalid_login_over_devtools(cdp_driver):
+    with allure.step("Login with an invalid password"):
+        login_page = LoginPage(cdp_driver)
+        login_page.navigate_to_page()
+        logged_in = login_page.login(ConfigReader.get_orangehrm_config()['admin_username'], "invalid-password")
+
+    with allure.step("Verify the error message is displayed"):
+        assert logged_in == False, "Login with an invalid password succeeded"
+        assert login_page.get_error_message() == "Invalid credentials"
+
+
+@allure.epic("Test Framework")
+@allure.feature("chrome-cdp backend")
+@allure.description("""
+This test checks that the session cookie read over DevTools authenticates API calls:
+1. Login through the UI
+2. Create and delete a user with the browser's session cookie
+3. Verify deleting the same user again is rejected
+""")
+def test_session_cookie_authenticates_api_calls(cdp_driver):
+    with allure.step("Login through the UI"):
+        login_page = LoginPage(cdp_driver)
+        login_page.navigate_to_page()
+        orangehrm_config = ConfigReader.get_orangehrm_config()
+        assert login_page.login(orangehrm_config['admin_username'], orangehrm_config['admin_password'])
+
+    with allure.step("Create and delete a user with the session cookie"):
+        api_helper = get_api_helper_with_auth(cdp_driver)
+        user = api_helper.create_unique_user()
+        assert api_helper.get_user_by_username(user['username'])['id'] == user['id']
+        assert api_helper.delete_user_by_id(user['id'])
+
+    with allure.step("Verify deleting the same user again is rejected"):
+        assert api_helper.get_user_by_username(user['username']) is None
+        assert not api_helper.delete_user_by_id(user['id'])
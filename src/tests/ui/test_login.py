@@ -0,0 +1,49 @@
+import allure
+from src.pages.login_page import LoginPage
+from src.utils.config_reader import ConfigReader
+
+
+
+@allure.epic("OrangeHRM User Management")
+@allure.feature("Authentication")
+@allure.story("Login through the UI")
+@allure.description("""
+This test verifies the login form:
+1. Open the OrangeHRM login page
+2. Login with the admin credentials
+3. Verify the dashboard is displayed
+""")
+def test_login_with_valid_credentials(driver):
+    with allure.step("Navigate to login page"):
+        login_page = LoginPage(driver)
+        login_page.navigate_to_page()
+
+    with allure.step("Login with admin credentials"):
+        orangehrm_config = ConfigReader.get_orangehrm_config()
+        logged_in = login_page.login(orangehrm_config['admin_username'], orangehrm_config['admin_password'])
+
+    with allure.step("Verify the dashboard is displayed"):
+        assert logged_in == True, "Login with valid credentials failed"
+
+
+@allure.epic("OrangeHRM User Management")
+@allure.feature("Authentication")
+@allure.story("Login through the UI")
+@allure.description("""
+This test verifies that the login form rejects a wrong password:
+1. Open the OrangeHRM login page
+2. Login with an invalid password
+3. Verify the error message is displayed
+""")
+def test_login_with_invalid_password(driver):
+    with allure.step("Navigate to login page"):
+        login_page = LoginPage(driver)
+        login_page.navigate_to_page()
+
+    with allure.step("Login with an invalid password"):
+        orangehrm_config = ConfigReader.get_orangehrm_config()
+        logged_in = login_page.login(orangehrm_config['admin_username'], "invalid-password")
+
+    with allure.step("Verify the error message is displayed"):
+        assert logged_in == False, "Login with an invalid password succeeded"
+        assert login_page.get_error_message() == "Invalid credentials", "Unexpected login error message"
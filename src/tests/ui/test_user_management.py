@@ -1,8 +1,5 @@
 import allure
 from src.pages.home_page import HomePage
-from src.pages.login_page import LoginPage
-from src.utils.api_helper import get_api_helper_with_auth
-from src.utils.config_reader import ConfigReader
 
 
 
@@ -11,32 +8,21 @@ from src.utils.config_reader import ConfigReader
 @allure.story("Create and Delete System Users")
 @allure.description("""
 This test verifies the user management functionality:
-1. Login to OrangeHRM system
-2. Create a new system user via API
+1. Start from a logged-in OrangeHRM session
+2. Lease a system user created ahead of time via API
 3. Verify the user was created successfully
 4. Delete the created user via UI
 5. Verify the user was deleted successfully
 """)
 
 
-def test_user_management_lifecycle(driver):
+def test_user_management_lifecycle(logged_in_driver, test_user, verifier):
     with allure.step("Initialize page objects"):
-        login_page = LoginPage(driver)
-        home_page = HomePage(driver)
+        home_page = HomePage(logged_in_driver)
         
-    with allure.step("Login to OrangeHRM system"):
-        login_page.navigate_to_page()
-        
-        # Use config for login credentials
-        orangehrm_config = ConfigReader.get_orangehrm_config()
-        login_page.login(orangehrm_config['admin_username'], orangehrm_config['admin_password'])
-        
-    with allure.step("Setup API helper with authentication"):
-        api_helper = get_api_helper_with_auth(driver)
-        
-    with allure.step("Create a new system user via API"):
-        # API helper now uses config automatically
-        user_data = api_helper.create_unique_user(prefix="autotest")
+    with allure.step("Lease a system user created via API"):
+        # The user pool creates users in the background ahead of demand
+        user_data = test_user
         print(f"✅ User created successfully: {user_data['username']}")
         
         
@@ -45,17 +31,18 @@ def test_user_management_lifecycle(driver):
         home_page.click_on_admin_navigation()
         
     with allure.step("Search for the created user"):
-        home_page.type_in_username(user_data['username'])
-        home_page.select_dropdown('User Role', user_data['user_role'])
-        home_page.type_in_employee_name(user_data['employee_name'])
-        home_page.select_dropdown('Status', user_data['status'])
-        home_page.click_search_button()
+        home_page.search_users(
+            username=user_data['username'],
+            user_role=user_data['user_role'],
+            employee_name=user_data['employee_name'],
+            status=user_data['status']
+        )
         
     with allure.step("Delete the user via UI"):
         home_page.delete_user_by_username(user_data['username'])
         home_page.confirm_delete()
         
-    with allure.step("Verify user deletion"):
-        home_page.click_search_button()
-        assert home_page.verify_no_records_found() == True, "User was not deleted"
-        print(f"✅ User deletion completed: {user_data['username']}")
\ No newline at end of file
+    # The API confirms the deletion first, then a single re-search checks the UI
+    assert verifier.user_deleted(user_data['username'], ui_check=home_page.search_shows_no_records), \
+        "User was not deleted"
+    print(f"✅ User deletion completed: {user_data['username']}")
\ No newline at end of file
@@ -0,0 +1,76 @@
+import threading
+import allure
+import pytest
+from src.utils import attachments
+from src.utils.attachments import AttachmentPipeline
+
+
+@pytest.fixture
+def registered(monkeypatch):
+    """Names of the attachments the pipeline registers, instead of writing them to the report"""
+    names = []
+    monkeypatch.setattr(AttachmentPipeline, "_register",
+                        classmethod(lambda cls, body, name, attachment_type, limits: names.append(name)))
+    AttachmentPipeline._pending.clear()
+    yield names
+    AttachmentPipeline._pending.clear()
+
+
+@allure.epic("Test Framework")
+@allure.feature("Attachments")
+def test_always_attaches_right_away(registered):
+    AttachmentPipeline.attach("body", "always", policy='always')
+
+    assert registered == ["always"]
+
+
+@allure.epic("Test Framework")
+@allure.feature("Attachments")
+def test_failure_attachments_wait_for_the_outcome(registered):
+    AttachmentPipeline.attach("body", "kept", policy='failure')
+    assert registered == []
+
+    AttachmentPipeline.on_test_failed()
+    assert registered == ["kept"]
+
+
+@allure.epic("Test Framework")
+@allure.feature("Attachments")
+def test_failure_attachments_of_passing_tests_are_never_built(registered):
+    AttachmentPipeline.attach(lambda: pytest.fail("body built for a passing test"), "dropped", policy='failure')
+    AttachmentPipeline.end_test()
+    AttachmentPipeline.on_test_failed()
+
+    assert registered == []
+
+
+@allure.epic("Test Framework")
+@allure.feature("Attachments")
+def test_sample_attaches_picked_tests_and_keeps_the_rest_for_failures(registered, monkeypatch):
+    monkeypatch.setattr(attachments.random, "random", lambda: 0.0)
+    AttachmentPipeline.attach("body", "picked", policy='sample')
+    monkeypatch.setattr(attachments.random, "random", lambda: 0.99)
+    AttachmentPipeline.attach("body", "not picked", policy='sample')
+    assert registered == ["picked"]
+
+    AttachmentPipeline.on_test_failed()
+    assert registered == ["picked", "not picked"]
+
+
+@allure.epic("Test Framework")
+@allure.feature("Attachments")
+def test_never_and_background_threads_attach_nothing(registered):
+    AttachmentPipeline.attach("body", "never", policy='never')
+    worker = threading.Thread(target=AttachmentPipeline.attach, args=("body", "background"), kwargs={'policy': 'always'})
+    worker.start()
+    worker.join()
+    AttachmentPipeline.on_test_failed()
+
+    assert registered == []
+
+
+@allure.epic("Test Framework")
+@allure.feature("Attachments")
+def test_unknown_policy_is_rejected(registered):
+    with pytest.raises(ValueError, match="Unknown attachment policy"):
+        AttachmentPipeline.attach("body", "typo", policy='sometimes')
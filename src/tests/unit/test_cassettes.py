@@ -0,0 +1,65 @@
+import allure
+import pytest
+import requests
+from src.utils.cassettes import Cassette, CassetteMiss, request_key
+
+USERS_URL = "https://hrm.example.com/web/index.php/api/v2/admin/users"
+
+
+def _response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body.encode()
+    return response
+
+
+@allure.epic("Test Framework")
+@allure.feature("API cassettes")
+def test_request_key_sorts_the_query_and_merges_params():
+    key = request_key("get", f"{USERS_URL}?limit=50&offset=0", params={'username': "Admin"})
+
+    assert key == "GET /web/index.php/api/v2/admin/users?limit=50&offset=0&username=Admin"
+
+
+@allure.epic("Test Framework")
+@allure.feature("API cassettes")
+def test_request_key_uses_a_canonical_json_body():
+    first = request_key("POST", USERS_URL, json_body={'username': "a", 'status': True})
+    second = request_key("POST", USERS_URL, json_body={'status': True, 'username': "a"})
+
+    assert first == second
+    assert first.endswith(' {"status":true,"username":"a"}')
+
+
+@allure.epic("Test Framework")
+@allure.feature("API cassettes")
+def test_request_key_reduces_unique_usernames_to_their_prefix():
+    first = request_key("GET", USERS_URL, params={'username': "autotest_1760000000_gw0_ab12_3"})
+    second = request_key("GET", USERS_URL, params={'username': "autotest_1760099999_main_9f00_41"})
+
+    assert first == second == "GET /web/index.php/api/v2/admin/users?username=autotest_<unique>"
+
+
+@allure.epic("Test Framework")
+@allure.feature("API cassettes")
+def test_replay_serves_recorded_reads_in_order(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    with Cassette(path, "record") as cassette:
+        cassette.play("GET", USERS_URL, {}, lambda: _response("first"))
+        cassette.play("GET", USERS_URL, {}, lambda: _response("second"))
+
+    replay = Cassette(path, "strict")
+    assert replay.play("GET", USERS_URL, {}, pytest.fail).text == "first"
+    assert replay.play("GET", USERS_URL, {}, pytest.fail).text == "second"
+    with pytest.raises(CassetteMiss):
+        replay.play("GET", USERS_URL, {}, pytest.fail)
+
+
+@allure.epic("Test Framework")
+@allure.feature("API cassettes")
+@pytest.mark.parametrize("mode, method", [("strict", "POST"), ("strict", "DELETE"), ("passthrough", "GET")])
+def test_writes_and_passthrough_always_reach_the_server(tmp_path, mode, method):
+    cassette = Cassette(str(tmp_path / "cassette.json"), mode)
+
+    assert cassette.play(method, USERS_URL, {}, lambda: _response("live")).text == "live"
+    assert cassette.interactions == {}
@@ -0,0 +1,100 @@
+import allure
+import pytest
+from src.utils.config_reader import ConfigReader
+
+CONFIG_INI = """
+[Browsers]
+browser = chrome
+headless = false
+
+[Test]
+explicit_wait = 20
+
+[Load]
+ramp_up = 5.0
+
+[OrangeHRM]
+base_url = https://opensource-demo.orangehrmlive.com
+admin_password = 123456
+"""
+
+
+@pytest.fixture
+def layers(tmp_path, monkeypatch):
+    """Point ConfigReader at a temporary config.ini and .env with no environment or CLI layer"""
+    config_path, dotenv_path = tmp_path / "config.ini", tmp_path / ".env"
+    config_path.write_text(CONFIG_INI)
+    dotenv_path.write_text("")
+    monkeypatch.setattr(ConfigReader, "get_config_path", staticmethod(lambda: str(config_path)))
+    monkeypatch.setattr(ConfigReader, "get_dotenv_path", staticmethod(lambda: str(dotenv_path)))
+    monkeypatch.setattr(ConfigReader, "_cli_overrides", {})
+    for name in ("HEADLESS", "BROWSER", "ORANGEHRM_BROWSER", "ORANGEHRM_BASE_URL", "ORANGEHRM_TEST_EXPLICIT_WAIT"):
+        monkeypatch.delenv(name, raising=False)
+    return dotenv_path
+
+
+@allure.epic("Test Framework")
+@allure.feature("Configuration")
+def test_typed_getters_convert_config_ini_values(layers):
+    settings = ConfigReader._build()
+
+    assert settings.getboolean('Browsers', 'headless') is False
+    assert settings.getint('Test', 'explicit_wait') == 20
+    assert settings.getfloat('Load', 'ramp_up') == 5.0
+    assert settings.get('OrangeHRM', 'base_url') == "https://opensource-demo.orangehrmlive.com"
+
+
+@allure.epic("Test Framework")
+@allure.feature("Configuration")
+def test_later_layers_win(layers, monkeypatch):
+    layers.write_text("ORANGEHRM_TEST_EXPLICIT_WAIT=30\nHEADLESS=yes\nORANGEHRM_BROWSER=firefox\n")
+    monkeypatch.setenv("ORANGEHRM_TEST_EXPLICIT_WAIT", "40")
+    monkeypatch.setattr(ConfigReader, "_cli_overrides", {'Browsers': {'browser': "chrome-cdp"}})
+
+    settings = ConfigReader._build()
+
+    assert settings.getint('Test', 'explicit_wait') == 40
+    assert settings.getboolean('Browsers', 'headless') is True
+    assert settings.get('Browsers', 'browser') == "chrome-cdp"
+
+
+@allure.epic("Test Framework")
+@allure.feature("Configuration")
+def test_only_prefixed_browser_variable_selects_the_browser(layers, monkeypatch):
+    monkeypatch.setenv("BROWSER", "firefox")
+    assert ConfigReader._build().get('Browsers', 'browser') == "chrome"
+
+    monkeypatch.setenv("ORANGEHRM_BROWSER", "firefox")
+    assert ConfigReader._build().get('Browsers', 'browser') == "firefox"
+
+
+@allure.epic("Test Framework")
+@allure.feature("Configuration")
+def test_settings_are_read_only_and_report_missing_options(layers):
+    settings = ConfigReader._build()
+
+    with pytest.raises(TypeError):
+        settings.section('Test')['explicit_wait'] = 1
+    assert settings.getint('Test', 'missing', fallback=7) == 7
+    with pytest.raises(Exception, match="missing"):
+        settings.get('Test', 'missing')
+
+
+@allure.epic("Test Framework")
+@allure.feature("Configuration")
+def test_free_text_values_are_never_converted(layers, monkeypatch):
+    monkeypatch.setenv("ORANGEHRM_ORANGEHRM_ADMIN_PASSWORD", "hunter2")
+    assert ConfigReader._build().get('OrangeHRM', 'admin_password') == "hunter2"
+
+    monkeypatch.delenv("ORANGEHRM_ORANGEHRM_ADMIN_PASSWORD")
+    assert ConfigReader._build().get('OrangeHRM', 'admin_password') == "123456"
+
+
+@allure.epic("Test Framework")
+@allure.feature("Configuration")
+def test_invalid_boolean_is_rejected_when_read(layers, monkeypatch):
+    monkeypatch.setenv("HEADLESS", "maybe")
+    settings = ConfigReader._build()
+
+    with pytest.raises(ValueError, match="Not a boolean"):
+        settings.getboolean('Browsers', 'headless')
@@ -0,0 +1,34 @@
+import allure
+import pytest
+from src.utils.duration_scheduler import TimingDatabase, lpt_partition
+
+
+
+@allure.epic("Test Framework")
+@allure.feature("Duration-based scheduling")
+def test_lpt_partition_gives_each_test_to_the_least_loaded_bin():
+    assignment, loads = lpt_partition({0: 5.0, 1: 4.0, 2: 3.0, 3: 3.0, 4: 1.0}, 2)
+
+    assert assignment == [[0, 3], [1, 2, 4]]
+    assert loads == [8.0, 8.0]
+
+
+@allure.epic("Test Framework")
+@allure.feature("Duration-based scheduling")
+def test_lpt_partition_leaves_spare_bins_empty():
+    assignment, loads = lpt_partition({0: 2.0}, 3)
+
+    assert assignment == [[0], [], []]
+    assert loads == [2.0, 0.0, 0.0]
+
+
+@allure.epic("Test Framework")
+@allure.feature("Duration-based scheduling")
+def test_timing_database_folds_runs_into_a_moving_average(tmp_path):
+    database = TimingDatabase(str(tmp_path / "durations.sqlite"), smoothing=0.5)
+    assert database.load() == {}
+
+    database.update({"test_a": 10.0})
+    database.update({"test_a": 20.0, "test_b": 4.0})
+
+    assert database.load() == pytest.approx({"test_a": 15.0, "test_b": 4.0})
@@ -0,0 +1,53 @@
+import allure
+import pytest
+from src.utils.load_runner import LatencyHistogram
+
+
+
+@allure.epic("Test Framework")
+@allure.feature("Load testing")
+def test_percentiles_are_within_one_percent():
+    histogram = LatencyHistogram()
+    for millisecond in range(1, 1001):
+        histogram.record(millisecond / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+    assert histogram.percentile(100) == pytest.approx(1.0)
+
+
+@allure.epic("Test Framework")
+@allure.feature("Load testing")
+def test_percentile_never_exceeds_the_recorded_maximum():
+    histogram = LatencyHistogram()
+    histogram.record(0.123457)
+
+    assert histogram.percentile(99) == 0.123457
+
+
+@allure.epic("Test Framework")
+@allure.feature("Load testing")
+def test_merge_combines_counts_and_extremes():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.010)
+    second.record(0.002)
+    second.record(0.050)
+
+    first.merge(second)
+    summary = first.summary()
+
+    assert summary['count'] == 3
+    assert summary['min'] == 0.002
+    assert summary['max'] == 0.05
+    assert summary['mean'] == pytest.approx(0.0207, abs=0.0001)
+
+
+@allure.epic("Test Framework")
+@allure.feature("Load testing")
+def test_empty_histogram_reports_zeros():
+    summary = LatencyHistogram().summary()
+
+    assert summary['count'] == 0
+    assert summary['p99'] == 0.0
+    assert summary['mean'] == 0.0
@@ -0,0 +1,61 @@
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+from src.utils.locators import Locator, xpath_literal
+
+
+
+@allure.epic("Test Framework")
+@allure.feature("Locators")
+def test_xpath_literal_picks_a_quote_the_value_does_not_contain():
+    assert xpath_literal("Admin") == "'Admin'"
+    assert xpath_literal("O'Brien") == '"O\'Brien"'
+    assert xpath_literal('say "hi"') == "'say \"hi\"'"
+
+
+@allure.epic("Test Framework")
+@allure.feature("Locators")
+def test_xpath_literal_concatenates_values_with_both_quotes():
+    assert xpath_literal("it's \"x\"") == "concat('it', \"'\", 's \"x\"')"
+
+
+@allure.epic("Test Framework")
+@allure.feature("Locators")
+def test_locator_quotes_parameters_for_its_selector_language():
+    by_label = Locator("field", xpath="//label[text()={label}]")
+    by_name = Locator("input", css="input[name={name}]")
+
+    assert by_label(label="O'Brien") == (By.XPATH, "//label[text()=\"O'Brien\"]")
+    assert by_name(name='a"b') == (By.CSS_SELECTOR, 'input[name="a\\"b"]')
+
+
+@allure.epic("Test Framework")
+@allure.feature("Locators")
+def test_locator_memoizes_built_locators_and_keeps_cacheable_flag():
+    row = Locator("row", xpath="//div[@role='row'][contains(., {text})]", cacheable=False)
+
+    built = row(text="Admin")
+    assert row(text="Admin") is built
+    assert built.cacheable is False
+
+
+@allure.epic("Test Framework")
+@allure.feature("Locators")
+def test_locator_rejects_wrong_parameters():
+    field = Locator("field", xpath="//label[text()={label}]")
+
+    with pytest.raises(ValueError, match="expects parameters"):
+        field(name="Username")
+
+
+@allure.epic("Test Framework")
+@allure.feature("Locators")
+@pytest.mark.parametrize("kwargs, message", [
+    ({}, "exactly one of css or xpath"),
+    ({'css': "input", 'xpath': "//input"}, "exactly one of css or xpath"),
+    ({'xpath': "//div[@id='a'"}, "unbalanced"),
+    ({'xpath': "div[@id='a']"}, "must be anchored"),
+])
+def test_locator_rejects_malformed_templates(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        Locator("broken", **kwargs)
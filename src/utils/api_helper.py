@@ -1,23 +1,51 @@
+import itertools
 import json
+import os
 import time
+import uuid
 import requests
 import allure
 from typing import Dict, Any, Optional
+from src.utils.attachments import AttachmentPipeline
+from src.utils.cassettes import Cassette
 from src.utils.config_reader import ConfigReader
+from src.utils.profiler import CommandProfiler
+
+
+# Random per-process token so concurrent runs against one server never clash
+_RUN_TOKEN = uuid.uuid4().hex[:4]
+_username_counter = itertools.count(1)
+
+
+def unique_username(prefix: str = "autotest") -> str:
+    """Generate a username unique across xdist workers, processes and runs.
+
+    Format: <prefix>_<unix time>_<worker id>_<run token>_<counter>. The
+    creation time comes right after the prefix so stale users can be
+    recognised by age.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return f"{prefix}_{int(time.time())}_{worker_id}_{_RUN_TOKEN}_{next(_username_counter)}"
 
 
 class OrangeHRMApiHelper:
     """Helper class for OrangeHRM API operations"""
     
+    # Set to False for high-volume callers such as load runs
+    attach_to_report = True
+    
     def __init__(self, base_url: Optional[str] = None):
         self.config = ConfigReader.get_orangehrm_config()
+        self.api_config = ConfigReader.get_api_config()
         self.base_url = base_url or self.config['base_url']
+        self.users_url = f"{self.base_url}/web/index.php/api/v2/admin/users"
         
         self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        CommandProfiler.instrument_session(self.session)
     
     def set_auth_cookie(self, cookie_value: str):
         """Set authentication cookie for API requests"""
@@ -27,18 +55,9 @@ class OrangeHRMApiHelper:
                    user_role_id: int = 1, emp_number: int = 7, 
                    status: bool = True) -> Dict[str, Any]:
         """Create a new system user"""
-        password = password or self.config['default_password']
-        url = f"{self.base_url}/web/index.php/api/v2/admin/users"
-        
-        payload = {
-            "username": username,
-            "password": password,
-            "status": status,
-            "userRoleId": user_role_id,
-            "empNumber": emp_number
-        }
+        payload = self._user_payload(username, password, user_role_id, emp_number, status)
         
-        response = self.session.post(url, json=payload)
+        response = self._request("POST", self.users_url, json=payload)
         self._log_response(response, "Create User")
         
         if response.status_code != 200:
@@ -47,37 +66,58 @@ class OrangeHRMApiHelper:
         response_data = response.json()
         user_data = self._extract_user_data(response_data)
         
-        allure.attach(json.dumps(user_data, indent=2), "Created User Data", allure.attachment_type.JSON)
+        self._attach(lambda: json.dumps(user_data, indent=2), "Created User Data", allure.attachment_type.JSON)
         return user_data
     
     def create_unique_user(self, prefix: str = "autotest", **kwargs) -> Dict[str, Any]:
         """Create a user with auto-generated unique username"""
-        unique_username = f"{prefix}_{int(time.time())}"
-        return self.create_user(username=unique_username, **kwargs)
+        return self.create_user(username=unique_username(prefix), **kwargs)
     
     def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
-        """Get user information by username"""
-        url = f"{self.base_url}/web/index.php/api/v2/admin/users"
-        response = self.session.get(url, params={"username": username})
+        """Get user information by username; None only when the server answered and found no such user"""
+        response = self._request("GET", self.users_url, params={"username": username})
         
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('data') and len(data['data']) > 0:
-                return data['data'][0]
+        # An expired session or a server error says nothing about whether the user exists
+        if response.status_code != 200:
+            raise requests.HTTPError(f"Failed to look up user '{username}'. Status: {response.status_code}",
+                                     response=response)
+        
+        data = response.json()
+        if data.get('data') and len(data['data']) > 0:
+            return data['data'][0]
         return None
     
     def delete_user_by_id(self, user_id: int) -> bool:
         """Delete user by ID via API"""
-        url = f"{self.base_url}/web/index.php/api/v2/admin/users"
-        response = self.session.delete(url, json={"ids": [user_id]})
+        response = self._request("DELETE", self.users_url, json={"ids": [user_id]})
         
         self._log_response(response, "Delete User")
         return response.status_code == 200
     
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the shared session with the configured timeout, through the test's cassette if any"""
+        kwargs.setdefault('timeout', self.api_config['timeout'])
+        cassette = Cassette.current()
+        if cassette is not None:
+            return cassette.play(method, url, kwargs, lambda: self.session.request(method, url, **kwargs))
+        return self.session.request(method, url, **kwargs)
+    
+    def _user_payload(self, username: str, password: Optional[str], user_role_id: int,
+                      emp_number: int, status: bool) -> Dict[str, Any]:
+        """Build the request body for creating a user"""
+        return {
+            "username": username,
+            "password": password or self.config['default_password'],
+            "status": status,
+            "userRoleId": user_role_id,
+            "empNumber": emp_number
+        }
+    
     def _extract_user_data(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract and format user data from API response"""
         data = response_data['data']
         return {
+            'id': data['id'],
             'username': data['userName'],
             'user_role': data['userRole']['name'],
             'employee_name': self._format_employee_name(data['employee']),
@@ -96,12 +136,17 @@ class OrangeHRMApiHelper:
     
     def _log_response(self, response: requests.Response, operation: str):
         """Log API response for debugging"""
-        allure.attach(
+        self._attach(
             f"{operation} - Status: {response.status_code}", 
             "API Response Status", 
             allure.attachment_type.TEXT
         )
-        allure.attach(response.text, f"{operation} Response", allure.attachment_type.JSON)
+        self._attach(lambda: response.text, f"{operation} Response", allure.attachment_type.JSON)
+    
+    def _attach(self, body, name: str, attachment_type):
+        """Attach through the attachment pipeline unless reporting is switched off for this helper"""
+        if self.attach_to_report:
+            AttachmentPipeline.attach(body, name, attachment_type)
 
 
 def get_api_helper_with_auth(driver) -> OrangeHRMApiHelper:
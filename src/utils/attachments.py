@@ -0,0 +1,201 @@
+import gzip
+import hashlib
+import queue
+import random
+import threading
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union
+import allure_commons
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment, ExecutableItem
+from allure_commons.reporter import AllureReporter
+from allure_commons.types import AttachmentType
+from src.utils.config_reader import ConfigReader
+from src.utils.session_stats import SessionStats
+
+
+POLICIES = ('always', 'failure', 'sample', 'never')
+
+Body = Union[str, bytes, Callable[[], Union[str, bytes]]]
+
+
+@SessionStats.register_summary
+def _attachments_summary(values):
+    if not any(key.startswith('attachments.') for key in values):
+        return []
+    return [f"Attachments: {int(values.get('attachments.written', 0))} written "
+            f"({values.get('attachments.bytes', 0) / 1048576:.1f} MB), "
+            f"{int(values.get('attachments.deduplicated', 0))} deduplicated, "
+            f"{int(values.get('attachments.skipped', 0))} skipped by policy"]
+
+
+class AttachmentPipeline:
+    """Policy-driven Allure attachments, written to disk by a background thread.
+
+    ``attach`` decides per the [Attachments] policy whether a body is
+    attached now (``always``, or ``sample`` when picked), kept pending until
+    the test fails (``failure``, and ``sample`` when not picked), or dropped.
+    Attachment metadata is registered on the calling test thread, so it lands
+    on the right test or step; only the file write is deferred. Bodies over
+    ``max_bytes`` are truncated, or gzipped by the writer thread, and
+    identical bodies within a test are written once and shared by content
+    hash.
+
+    Bodies may be callables, evaluated only when the attachment is actually
+    registered, so pending attachments of passing tests cost nothing.
+    """
+
+    _queue: "queue.Queue[Optional[Tuple[bytes, str, bool]]]" = queue.Queue()
+    _writer: Optional[threading.Thread] = None
+    _pending: Deque[Tuple[Body, str, Any, Dict[str, Any]]] = deque()
+    _written: Dict[str, str] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def attach(cls, body: Body, name: str, attachment_type: Any = AttachmentType.TEXT,
+               policy: Optional[str] = None, max_bytes: Optional[int] = None, oversize: Optional[str] = None):
+        """Attach a body to the current test according to the policy.
+
+        ``max_bytes`` and ``oversize`` override the configured size handling
+        for this attachment.
+        """
+        config = ConfigReader.get_attachments_config()
+        policy = policy or config['policy']
+        limits = {'max_bytes': max_bytes or config['max_bytes'], 'oversize': oversize or config['oversize'],
+                  'dedupe': config['dedupe']}
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown attachment policy '{policy}', choose from {POLICIES}")
+
+        # Background threads have no test to attach to
+        if threading.current_thread() is not threading.main_thread() or policy == 'never':
+            SessionStats.add('attachments.skipped')
+            return
+
+        if policy == 'always' or (policy == 'sample' and random.random() < config['sample_rate']):
+            cls._register(body, name, attachment_type, limits)
+            return
+
+        with cls._lock:
+            if len(cls._pending) >= config['max_pending']:
+                cls._pending.popleft()
+                SessionStats.add('attachments.skipped')
+            cls._pending.append((body, name, attachment_type, limits))
+
+    @classmethod
+    def on_test_failed(cls):
+        """Attach everything kept pending for the current test"""
+        with cls._lock:
+            pending, cls._pending = cls._pending, deque()
+        for body, name, attachment_type, limits in pending:
+            cls._register(body, name, attachment_type, limits)
+
+    @classmethod
+    def end_test(cls):
+        """Drop attachments nobody asked for and wait until this test's files are written"""
+        with cls._lock:
+            SessionStats.add('attachments.skipped', len(cls._pending))
+            cls._pending.clear()
+            # Dedupe within a test only, so a long session does not keep a hash per attachment
+            cls._written.clear()
+        cls.flush()
+
+    @classmethod
+    def flush(cls):
+        """Block until every queued attachment file is written"""
+        if cls._writer is not None:
+            cls._queue.join()
+
+    @classmethod
+    def shutdown(cls):
+        """Flush and stop the writer thread"""
+        if cls._writer is not None:
+            cls._queue.put(None)
+            cls._writer.join(timeout=30)
+            cls._writer = None
+
+    @classmethod
+    def _register(cls, body: Body, name: str, attachment_type: Any, limits: Dict[str, Any]):
+        reporter = _allure_reporter()
+        parent = reporter.get_last_item(ExecutableItem) if reporter else None
+        if parent is None:
+            return
+
+        if callable(body):
+            body = body()
+        payload = body.encode('utf-8') if isinstance(body, str) else body
+        mime_type, extension = _type_and_extension(attachment_type)
+
+        compress = False
+        if len(payload) > limits['max_bytes']:
+            if limits['oversize'] == 'gzip':
+                # Compressed by the writer thread, off the test's critical path
+                compress = True
+                mime_type, extension = 'application/gzip', f"{extension}.gz"
+                name = f"{name} (gzip)"
+            else:
+                omitted = len(payload) - limits['max_bytes']
+                payload = payload[:limits['max_bytes']] + f"\n... [truncated {omitted} bytes]".encode()
+                mime_type, extension = 'text/plain', 'txt'
+
+        digest = hashlib.sha1(payload).hexdigest() if limits['dedupe'] else None
+        with cls._lock:
+            file_name = cls._written.get(digest) if digest else None
+            duplicate = file_name is not None
+            if not duplicate:
+                file_name = ATTACHMENT_PATTERN.format(prefix=uuid.uuid4(), ext=extension)
+                if digest:
+                    cls._written[digest] = file_name
+
+        parent.attachments.append(Attachment(source=file_name, name=name, type=mime_type))
+        if duplicate:
+            SessionStats.add('attachments.deduplicated')
+            return
+
+        SessionStats.add('attachments.written')
+        SessionStats.add('attachments.bytes', len(payload))
+        cls._ensure_writer()
+        cls._queue.put((payload, file_name, compress))
+
+    @classmethod
+    def _ensure_writer(cls):
+        with cls._lock:
+            if cls._writer is None:
+                cls._writer = threading.Thread(target=cls._write_loop, name="allure-attachment-writer", daemon=True)
+                cls._writer.start()
+
+    @classmethod
+    def _write_loop(cls):
+        while True:
+            item = cls._queue.get()
+            try:
+                if item is None:
+                    return
+                payload, file_name, compress = item
+                if compress:
+                    payload = gzip.compress(payload, compresslevel=6)
+                allure_commons.plugin_manager.hook.report_attached_data(body=payload, file_name=file_name)
+            except Exception as e:
+                print(f"⚠️ Could not write attachment: {e}")
+            finally:
+                cls._queue.task_done()
+
+
+def attach(body: Body, name: str, attachment_type: Any = AttachmentType.TEXT, policy: Optional[str] = None,
+           **limits):
+    """Shortcut for AttachmentPipeline.attach"""
+    AttachmentPipeline.attach(body, name, attachment_type, policy, **limits)
+
+
+def _allure_reporter() -> Optional[AllureReporter]:
+    """The reporter of the allure-pytest plugin, None when Allure reporting is off"""
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if isinstance(reporter, AllureReporter):
+            return reporter
+    return None
+
+
+def _type_and_extension(attachment_type: Any) -> Tuple[str, str]:
+    if isinstance(attachment_type, AttachmentType):
+        return attachment_type.mime_type, attachment_type.extension
+    return attachment_type, 'attach'
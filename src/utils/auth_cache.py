@@ -0,0 +1,183 @@
+import re
+import threading
+import time
+import requests
+from typing import Dict, Optional, Tuple
+from src.utils.api_helper import OrangeHRMApiHelper
+from src.utils.config_reader import ConfigReader
+
+
+AUTH_COOKIE_NAME = "orangehrm"
+LOGIN_PATH = "/web/index.php/auth/login"
+VALIDATE_PATH = "/web/index.php/auth/validate"
+DASHBOARD_PATH = "/web/index.php/dashboard/index"
+
+# The login page embeds the CSRF token as a Vue prop: :token="&quot;...&quot;"
+_CSRF_TOKEN_PATTERN = re.compile(r':token="(?:&quot;)?(.*?)(?:&quot;)?"')
+
+
+class AuthState:
+    """An authenticated OrangeHRM session cookie and its lifetime"""
+
+    def __init__(self, base_url: str, username: str, role: str, cookie: Dict, ttl: float):
+        self.base_url = base_url
+        self.username = username
+        self.role = role
+        self.cookie = cookie
+        self.created_at = time.monotonic()
+        self.validated_at = self.created_at
+        self.ttl = ttl
+
+    @property
+    def value(self) -> str:
+        return self.cookie['value']
+
+    def is_expired(self) -> bool:
+        return time.monotonic() - self.created_at >= self.ttl
+
+
+class AuthCache:
+    """Process-wide cache of logged-in sessions keyed by (base_url, username, role).
+
+    Logging in through the UI costs a page load, three interactions and a wait
+    for the dashboard. Only the ``orangehrm`` session cookie is needed to be
+    logged in, so it is obtained once per worker and injected into every
+    driver and API helper that needs it.
+    """
+
+    _states: Dict[Tuple[str, str, str], AuthState] = {}
+    _lock = threading.Lock()
+    logins = 0
+    hits = 0
+
+    @classmethod
+    def get_session(cls, username: Optional[str] = None, password: Optional[str] = None,
+                    role: str = "Admin", base_url: Optional[str] = None, driver=None) -> AuthState:
+        """Return a valid session, logging in only if none is cached or it has expired"""
+        orangehrm_config = ConfigReader.get_orangehrm_config()
+        auth_config = ConfigReader.get_auth_config()
+        base_url = base_url or orangehrm_config['base_url']
+        username = username or orangehrm_config['admin_username']
+        password = password or orangehrm_config['admin_password']
+        key = (base_url, username, role)
+
+        with cls._lock:
+            state = cls._states.get(key)
+            if state and not state.is_expired() and cls._is_still_valid(state, auth_config['validate_interval']):
+                cls.hits += 1
+                return state
+
+            if auth_config['login_via'] == 'ui' and driver is not None:
+                cookie = cls._login_via_ui(driver, username, password)
+            else:
+                cookie = cls._login_via_api(base_url, username, password)
+
+            state = AuthState(base_url, username, role, cookie, auth_config['cookie_ttl'])
+            cls._states[key] = state
+            cls.logins += 1
+            return state
+
+    @classmethod
+    def invalidate(cls, username: Optional[str] = None, role: str = "Admin", base_url: Optional[str] = None):
+        """Forget a cached session, e.g. after a test logged it out"""
+        orangehrm_config = ConfigReader.get_orangehrm_config()
+        key = (base_url or orangehrm_config['base_url'], username or orangehrm_config['admin_username'], role)
+        with cls._lock:
+            cls._states.pop(key, None)
+
+    @staticmethod
+    def inject_into_driver(driver, state: AuthState):
+        """Add the session cookie to a browser so it starts out logged in"""
+        cookie = {
+            'name': AUTH_COOKIE_NAME,
+            'value': state.value,
+            'path': state.cookie.get('path', '/'),
+            'secure': state.cookie.get('secure', False),
+            'httpOnly': True
+        }
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            # CDP can set a cookie for any origin without loading a page first
+            driver.execute_cdp_cmd("Network.setCookie", dict(cookie, url=state.base_url))
+            return
+
+        # WebDriver only accepts cookies for the current origin; any cheap
+        # same-origin URL will do, even one that returns 404
+        driver.get(f"{state.base_url}/favicon.ico")
+        driver.add_cookie(cookie)
+
+    @staticmethod
+    def apply_to_api_helper(api_helper: OrangeHRMApiHelper, state: AuthState) -> OrangeHRMApiHelper:
+        """Authenticate an API helper with a cached session"""
+        api_helper.set_auth_cookie(state.value)
+        return api_helper
+
+    @staticmethod
+    def _is_still_valid(state: AuthState, validate_interval: float) -> bool:
+        """Ask the server whether the cookie is still logged in, at most once per interval"""
+        if time.monotonic() - state.validated_at < validate_interval:
+            return True
+
+        try:
+            response = requests.get(
+                f"{state.base_url}{DASHBOARD_PATH}",
+                cookies={AUTH_COOKIE_NAME: state.value},
+                allow_redirects=False,
+                timeout=10
+            )
+        except requests.RequestException:
+            return False
+
+        # An expired session is redirected back to the login page
+        if response.status_code != 200:
+            return False
+
+        state.validated_at = time.monotonic()
+        return True
+
+    @staticmethod
+    def _login_via_api(base_url: str, username: str, password: str) -> Dict:
+        """Log in by posting the login form directly, without a browser"""
+        session = requests.Session()
+
+        login_page = session.get(f"{base_url}{LOGIN_PATH}", timeout=30)
+        match = _CSRF_TOKEN_PATTERN.search(login_page.text)
+        if not match:
+            raise Exception("Could not find the CSRF token on the OrangeHRM login page")
+
+        response = session.post(
+            f"{base_url}{VALIDATE_PATH}",
+            data={'_token': match.group(1), 'username': username, 'password': password},
+            allow_redirects=False,
+            timeout=30
+        )
+
+        if response.status_code not in (301, 302) or LOGIN_PATH in response.headers.get('Location', ''):
+            raise Exception(f"API login failed for user '{username}'. Status: {response.status_code}")
+
+        for cookie in session.cookies:
+            if cookie.name == AUTH_COOKIE_NAME:
+                return {'name': cookie.name, 'value': cookie.value, 'path': cookie.path, 'secure': cookie.secure}
+
+        raise Exception(f"No {AUTH_COOKIE_NAME} cookie returned after logging in as '{username}'")
+
+    @staticmethod
+    def _login_via_ui(driver, username: str, password: str) -> Dict:
+        """Log in through the login form and take the cookie from the browser"""
+        from src.pages.login_page import LoginPage
+
+        login_page = LoginPage(driver)
+        login_page.navigate_to_page()
+        if not login_page.login(username, password):
+            raise Exception(f"UI login failed for user '{username}'")
+
+        cookie = driver.get_cookie(AUTH_COOKIE_NAME)
+        if not cookie:
+            raise Exception("No orangehrm cookie found in browser session")
+        return cookie
+
+
+def get_api_helper_with_cached_auth(role: str = "Admin", **kwargs) -> OrangeHRMApiHelper:
+    """Get API helper authenticated with a cached session"""
+    state = AuthCache.get_session(role=role, **kwargs)
+    return AuthCache.apply_to_api_helper(OrangeHRMApiHelper(base_url=state.base_url), state)
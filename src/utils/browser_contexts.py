@@ -0,0 +1,182 @@
+import itertools
+import json
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+import websocket
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from src.utils.cdp_driver import CdpDriver, start_chrome
+from src.utils.resource_governor import machine_lock, process_tree_rss
+from src.utils.session_stats import SessionStats
+
+
+@SessionStats.register_summary
+def _browser_contexts_summary(values):
+    if not values.get('contexts.created'):
+        return []
+    samples = values.get('contexts.heap_samples', 0)
+    heap = f"{values.get('contexts.heap_mb', 0) / samples:.1f}MB avg JS heap per context" if samples else "no heap samples"
+    lines = [f"Browser contexts: {int(values['contexts.created'])} created, "
+             f"peak {int(values.get('contexts.per_process.max', 0))} per Chrome process, "
+             f"{int(values.get('contexts.overflow', 0))} overflowed to their own Chrome; {heap} "
+             f"(max {values.get('contexts.heap_mb.max', 0):.1f}MB)"]
+    if values.get('contexts.rss_mb.max'):
+        lines.append(f"Shared Chrome memory: peak {values['contexts.rss_mb.max']:.0f}MB RSS")
+    return lines
+
+
+class BrowserHost:
+    """One Chrome process that hands out isolated browser contexts as drivers.
+
+    Each context from ``Target.createBrowserContext`` has its own cookies,
+    storage and cache, like an incognito window, but shares the browser
+    process, GPU process and caches with the others. A context is driven by
+    a regular CdpDriver connected to its page, so tests cannot tell it from a
+    browser of its own. With xdist the controller launches the host and the
+    workers connect to it through ``websocket_url``, so all workers share one
+    Chrome.
+
+    ``max_contexts`` is checked against the contexts the browser reports,
+    counted and created under a machine-wide lock so two workers can never
+    both take the last one. Browser commands fail with a TimeoutException
+    when Chrome does not answer within ``command_timeout`` seconds.
+    """
+
+    _shared: Optional["BrowserHost"] = None
+
+    def __init__(self, websocket_url: str, process: Optional[subprocess.Popen] = None, pid: Optional[int] = None,
+                 browser_version: str = "", baseline_mb: float = 0.0, command_timeout: float = 30):
+        self.websocket_url = websocket_url
+        self.process = process
+        self.pid = pid if pid is not None else (process.pid if process else None)
+        self.browser_version = browser_version
+        # RSS of the Chrome with no context open, to tell one context's share
+        self.baseline_mb = baseline_mb
+        self.debug_port: Optional[int] = None
+        self.profile_dir: Optional[str] = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.command_timeout = command_timeout
+        self._socket = websocket.create_connection(websocket_url, suppress_origin=True, timeout=command_timeout)
+
+    @classmethod
+    def launch(cls, arguments: List[str], debug_port: int, binary: Optional[str] = None) -> "BrowserHost":
+        process, version, _ = start_chrome(arguments, debug_port, binary)
+        host = cls(version['webSocketDebuggerUrl'], process, browser_version=version.get('Browser', ''))
+        host.debug_port = debug_port
+        return host
+
+    @classmethod
+    def shared(cls) -> Optional["BrowserHost"]:
+        return cls._shared
+
+    @classmethod
+    def set_shared(cls, host: Optional["BrowserHost"]):
+        cls._shared = host
+
+    @property
+    def address(self) -> str:
+        """What a worker needs to connect: the browser WebSocket URL, the Chrome pid and its baseline RSS"""
+        return json.dumps({'websocket_url': self.websocket_url, 'pid': self.pid,
+                           'browser_version': self.browser_version, 'baseline_mb': self.baseline_mb})
+
+    @classmethod
+    def connect(cls, address: str) -> "BrowserHost":
+        details = json.loads(address)
+        return cls(details['websocket_url'], pid=details.get('pid'), browser_version=details.get('browser_version', ''),
+                   baseline_mb=details.get('baseline_mb', 0.0))
+
+    def new_context(self, max_contexts: int) -> Optional[CdpDriver]:
+        """A driver in a fresh context, or None when this Chrome already has ``max_contexts``"""
+        # Every worker connected to this Chrome counts and creates under the same lock
+        with machine_lock(f"browser-contexts-{urlsplit(self.websocket_url).port}"):
+            open_contexts = self.open_contexts()
+            if open_contexts >= max_contexts:
+                return None
+            context_id = self.execute('Target.createBrowserContext', {'disposeOnDetach': False})['browserContextId']
+        try:
+            target_id = self.execute('Target.createTarget',
+                                     {'url': 'about:blank', 'browserContextId': context_id})['targetId']
+            page_url = self.websocket_url.split('/devtools/')[0] + f"/devtools/page/{target_id}"
+            driver = CdpDriver(page_url, target_id=target_id, browser_version=self.browser_version)
+        except WebDriverException:
+            self._dispose(context_id)
+            raise
+
+        driver.browser_host = self
+        driver.browser_context_id = context_id
+        SessionStats.add('contexts.created')
+        SessionStats.set_max('contexts.per_process.max', open_contexts + 1)
+        self._sample_rss()
+        return driver
+
+    def open_contexts(self) -> int:
+        """Contexts open in this Chrome, across all workers"""
+        return len(self.execute('Target.getBrowserContexts').get('browserContextIds', []))
+
+    def close_context(self, driver: CdpDriver):
+        """Record the context's JS heap, then quit its driver and dispose of the context"""
+        try:
+            heap_mb = driver.execute('Runtime.getHeapUsage', {})['usedSize'] / 1048576
+            SessionStats.add('contexts.heap_mb', heap_mb)
+            SessionStats.add('contexts.heap_samples')
+            SessionStats.set_max('contexts.heap_mb.max', heap_mb)
+        except (WebDriverException, KeyError):
+            pass
+        self._sample_rss()
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            print(f"⚠️ Error while quitting context driver: {e}")
+        self._dispose(driver.browser_context_id)
+
+    def execute(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a browser-level command; the connection subscribes to no events, so replies come in order"""
+        with self._lock:
+            command_id = next(self._ids)
+            try:
+                self._socket.send(json.dumps({'id': command_id, 'method': method, 'params': params or {}}))
+                while True:
+                    message = json.loads(self._socket.recv())
+                    if message.get('id') == command_id:
+                        break
+            except websocket.WebSocketTimeoutException:
+                # A late reply is skipped by the id check of the next command
+                raise TimeoutException(f"No response to {method} from the shared Chrome within {self.command_timeout}s")
+            except (websocket.WebSocketException, OSError) as e:
+                raise WebDriverException(f"Shared Chrome connection lost: {e}")
+        if 'error' in message:
+            raise WebDriverException(f"{method} failed: {message['error'].get('message')}")
+        return message.get('result', {})
+
+    def shutdown(self):
+        """Disconnect, and quit Chrome when this host launched it"""
+        if self.process is not None:
+            try:
+                self.execute('Browser.close')
+            except WebDriverException:
+                pass
+        try:
+            self._socket.close()
+        except (websocket.WebSocketException, OSError):
+            pass
+        if self.process is not None and self.process.poll() is None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait(timeout=5)
+
+    def _dispose(self, context_id: str):
+        try:
+            self.execute('Target.disposeBrowserContext', {'browserContextId': context_id})
+        except WebDriverException as e:
+            print(f"⚠️ Could not dispose of browser context {context_id}: {e}")
+
+    def _sample_rss(self):
+        if self.pid is None:
+            return
+        rss_mb = process_tree_rss(self.pid) / 1048576
+        if rss_mb:
+            SessionStats.set_max('contexts.rss_mb.max', rss_mb)
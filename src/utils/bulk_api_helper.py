@@ -0,0 +1,213 @@
+import json
+import random
+import threading
+import time
+import allure
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from src.utils.api_helper import OrangeHRMApiHelper, unique_username
+from src.utils.attachments import AttachmentPipeline
+
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Safe to send twice. A POST is only retried when the server cannot have
+# seen it: the connection was never made, or it answered 429.
+IDEMPOTENT_METHODS = ('GET', 'DELETE')
+
+
+class BulkLookupError(Exception):
+    """Some users could not be looked up, so whether they exist is unknown"""
+
+    def __init__(self, failed: Dict[str, Exception], found: Dict[str, Optional[Dict[str, Any]]]):
+        super().__init__(f"Could not look up {len(failed)} of {len(failed) + len(found)} users: "
+                         f"{next(iter(failed.values()))}")
+        self.failed = failed
+        self.found = found
+
+
+class OrangeHRMBulkApiHelper(OrangeHRMApiHelper):
+    """Thread-pooled API helper for seeding and cleaning up many users at once.
+
+    Requests run on a worker pool bounded by ``max_concurrency`` over a
+    connection pool sized to match. Every request has a timeout. GET and
+    DELETE are retried with exponential backoff on 429/5xx, timeouts and
+    connection errors; POST only on 429 and failed connection attempts, so a
+    create the server already saved is never sent again. Individual calls
+    are not attached to Allure; each bulk operation attaches one summary.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, max_concurrency: Optional[int] = None):
+        super().__init__(base_url)
+        self.max_concurrency = max_concurrency or self.api_config['max_concurrency']
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+
+        pool_size = max(self.api_config['pool_maxsize'], self.max_concurrency)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def create_users_bulk(self, count: int, prefix: str = "autotest", strict: bool = True,
+                          **kwargs) -> List[Dict[str, Any]]:
+        """Create ``count`` users concurrently and return their data.
+
+        With ``strict`` a partial failure deletes the users that were created
+        and raises; otherwise whatever was created is returned. A create that
+        failed without a clear answer, e.g. a timeout, may still have saved
+        the user, so failed usernames are looked up before deciding.
+        """
+        usernames = [unique_username(prefix) for _ in range(count)]
+
+        started = time.monotonic()
+        results = self._map(lambda username: self._create_user_quietly(username, **kwargs), usernames)
+        created = [user for user in results if user is not None]
+        failed = [username for username, user in zip(usernames, results) if user is None]
+        if failed:
+            try:
+                existing = self.get_users_bulk(failed)
+            except BulkLookupError as e:
+                existing = e.found
+                print(f"⚠️ {len(e.failed)} users may have been created but could not be looked up: {e}")
+            created.extend(self._extract_user_data({'data': user}) for user in existing.values() if user is not None)
+        self._attach_summary("Create Users Bulk", count, len(created), started)
+
+        if strict and len(created) != count:
+            self.delete_users([user['id'] for user in created])
+            raise Exception(f"Created only {len(created)} of {count} users")
+        return created
+
+    def get_users_bulk(self, usernames: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Look up many users concurrently; missing users map to None.
+
+        Raises BulkLookupError when any lookup fails, carrying the answers that
+        did come back, since a failed lookup says nothing about the user.
+        """
+        usernames = list(usernames)
+
+        started = time.monotonic()
+        results = self._map(self._lookup, usernames)
+        found = {username: user for username, (user, error) in zip(usernames, results) if error is None}
+        failed = {username: error for username, (user, error) in zip(usernames, results) if error is not None}
+        self._attach_summary("Get Users Bulk", len(usernames),
+                             sum(1 for user in found.values() if user is not None), started)
+        if failed:
+            raise BulkLookupError(failed, found)
+        return found
+
+    def delete_users(self, user_ids: Iterable[int], batch_size: Optional[int] = None) -> bool:
+        """Delete users in batches, one DELETE request per batch of ids"""
+        user_ids = list(user_ids)
+        batch_size = batch_size or self.api_config['batch_size']
+        batches = [user_ids[i:i + batch_size] for i in range(0, len(user_ids), batch_size)]
+
+        started = time.monotonic()
+        results = self._map(self._delete_batch, batches)
+        deleted = sum(len(batch) for batch, ok in zip(batches, results) if ok)
+        self._attach_summary("Delete Users Bulk", len(user_ids), deleted, started)
+        return deleted == len(user_ids)
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with bounded concurrency, retrying with exponential backoff where that is safe"""
+        kwargs.setdefault('timeout', self.api_config['timeout'])
+        max_retries = self.api_config['max_retries']
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(max_retries + 1):
+            try:
+                with self._semaphore:
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == max_retries or not (idempotent or _never_sent(e)):
+                    raise
+            else:
+                retryable = response.status_code in RETRYABLE_STATUS_CODES and (idempotent or response.status_code == 429)
+                if not retryable or attempt == max_retries:
+                    return response
+                retry_after = response.headers.get('Retry-After')
+                if retry_after and retry_after.isdigit():
+                    # A server asking for minutes would stall the whole pool; wait at most the longest backoff
+                    time.sleep(min(int(retry_after), self._max_backoff()))
+                    continue
+
+            time.sleep(self._backoff(attempt))
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter so retrying threads do not synchronize"""
+        delay = self.api_config['backoff_factor'] * (2 ** attempt)
+        return delay * random.uniform(0.5, 1.5)
+
+    def _max_backoff(self) -> float:
+        return self.api_config['backoff_factor'] * (2 ** self.api_config['max_retries'])
+
+    def _map(self, func, items: List) -> List:
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _create_user_quietly(self, username: str, password: Optional[str] = None,
+                             user_role_id: int = 1, emp_number: int = 7,
+                             status: bool = True) -> Optional[Dict[str, Any]]:
+        payload = self._user_payload(username, password, user_role_id, emp_number, status)
+        try:
+            response = self._request("POST", self.users_url, json=payload)
+        except requests.RequestException as e:
+            print(f"❌ Failed to create user '{username}': {e}")
+            return None
+        if response.status_code != 200:
+            print(f"❌ Failed to create user '{username}'. Status: {response.status_code}")
+            return None
+        return self._extract_user_data(response.json())
+
+    def _get_user_quietly(self, username: str) -> Optional[Dict[str, Any]]:
+        """The user, or None only when the server answered and found no such user"""
+        response = self._request("GET", self.users_url, params={"username": username})
+        if response.status_code != 200:
+            raise requests.HTTPError(f"Failed to look up user '{username}'. Status: {response.status_code}",
+                                     response=response)
+        data = response.json()
+        if data.get('data'):
+            return data['data'][0]
+        return None
+
+    def _lookup(self, username: str):
+        try:
+            return self._get_user_quietly(username), None
+        except (requests.RequestException, ValueError) as e:
+            return None, e
+
+    def _delete_batch(self, user_ids: List[int]) -> bool:
+        try:
+            response = self._request("DELETE", self.users_url, json={"ids": user_ids})
+        except requests.RequestException as e:
+            print(f"❌ Failed to delete {len(user_ids)} users: {e}")
+            return False
+        if response.status_code != 200:
+            print(f"❌ Failed to delete {len(user_ids)} users. Status: {response.status_code}")
+            return False
+        return True
+
+    def _attach_summary(self, operation: str, requested: int, succeeded: int, started: float):
+        summary = {
+            'operation': operation,
+            'requested': requested,
+            'succeeded': succeeded,
+            'duration_seconds': round(time.monotonic() - started, 3),
+            'max_concurrency': self.max_concurrency
+        }
+        AttachmentPipeline.attach(json.dumps(summary, indent=2), f"{operation} Summary", allure.attachment_type.JSON)
+
+
+def _never_sent(error: Exception) -> bool:
+    """True when the request failed before reaching the server, so even a POST can be sent again"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(error, requests.ConnectionError) and isinstance(reason, NewConnectionError)
@@ -0,0 +1,224 @@
+import argparse
+import fnmatch
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import requests
+from requests.structures import CaseInsensitiveDict
+from src.utils.config_reader import ConfigReader
+from src.utils.session_stats import SessionStats
+
+
+MODES = ('off', 'record', 'replay', 'strict', 'passthrough')
+
+# Requests that change server state. The browser reads that state too, so by
+# default they always reach the server instead of being replayed.
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+CASSETTE_VERSION = 1
+
+# Usernames from unique_username differ on every run; the key keeps only the prefix
+UNIQUE_USERNAME = re.compile(r"_\d{9,11}_(?:main|gw\d+)_[0-9a-f]{4}_\d+")
+
+
+@SessionStats.register_summary
+def _cassette_summary(values):
+    if not any(key.startswith('cassettes.') for key in values):
+        return []
+    return [f"Cassettes: {int(values.get('cassettes.replayed', 0))} requests replayed, "
+            f"{int(values.get('cassettes.recorded', 0))} recorded, "
+            f"{int(values.get('cassettes.missed', 0))} missed, "
+            f"{int(values.get('cassettes.passed_through', 0))} passed through"]
+
+
+class CassetteMiss(Exception):
+    """A strict cassette has no recorded response for a request"""
+
+
+class Cassette:
+    """Recorded API request/response pairs of one test.
+
+    Requests are keyed by method, path, sorted query and canonical JSON body,
+    with unique usernames reduced to their prefix. A key may be recorded
+    several times, e.g. two users created by one test, and is replayed in
+    recording order.
+
+    Modes: ``record`` always calls the server and rewrites the cassette,
+    ``replay`` replays what it has and sends other requests to the server,
+    recording them, ``strict`` replays only and raises CassetteMiss for
+    anything unrecorded, and ``passthrough`` sends everything to the server
+    without recording. Cassettes older than ``max_age_days`` or written by
+    another CASSETTE_VERSION are ignored, as if missing.
+
+    Writes (WRITE_METHODS) always go to the server and are not recorded,
+    because a replayed create would hand the test a user the browser cannot
+    see. API-only tests can opt in with ``replay_writes``.
+    """
+
+    _current: Optional["Cassette"] = None
+
+    def __init__(self, path: str, mode: str = "replay", max_age_days: float = 7, replay_writes: bool = False):
+        if mode not in MODES or mode == 'off':
+            raise ValueError(f"Cassette mode must be one of {MODES[1:]}, got '{mode}'")
+        self.path = path
+        self.mode = mode
+        self.max_age_days = max_age_days
+        self.replay_writes = replay_writes
+        self.interactions: Dict[str, List[Dict[str, Any]]] = {} if mode in ('record', 'passthrough') else self._load()
+        self._played: Dict[str, int] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_test(cls, node, directory: str, mode: str, max_age_days: float) -> Optional["Cassette"]:
+        """The cassette of a test; ``@pytest.mark.cassette(name, mode=..., replay_writes=...)`` shares or overrides it"""
+        marker = node.get_closest_marker("cassette")
+        name = node.nodeid
+        replay_writes = False
+        if marker is not None:
+            name = marker.args[0] if marker.args else marker.kwargs.get('name', name)
+            mode = marker.kwargs.get('mode', mode)
+            replay_writes = marker.kwargs.get('replay_writes', False)
+        if mode == 'off':
+            return None
+        file_name = re.sub(r"[^\w.-]+", "_", name).strip("_")[:180] + ".json"
+        return cls(os.path.join(directory, file_name), mode, max_age_days, replay_writes)
+
+    @classmethod
+    def current(cls) -> Optional["Cassette"]:
+        """The active cassette; only the test's own thread uses it, so background refills stay live"""
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        return cls._current
+
+    @classmethod
+    @contextmanager
+    def suspended(cls):
+        """Send requests to the server while inside, e.g. for checks of the real backend state"""
+        current, cls._current = cls._current, None
+        try:
+            yield
+        finally:
+            cls._current = current
+
+    def __enter__(self) -> "Cassette":
+        Cassette._current = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        Cassette._current = None
+        self.save()
+
+    def play(self, method: str, url: str, kwargs: Dict[str, Any],
+             send: Callable[[], requests.Response]) -> requests.Response:
+        """Replay the recorded response to a request, or send it and record the response"""
+        if self.mode == 'passthrough' or (method.upper() in WRITE_METHODS and not self.replay_writes):
+            SessionStats.add('cassettes.passed_through')
+            return send()
+
+        key = request_key(method, url, kwargs.get('params'), kwargs.get('json'), kwargs.get('data'))
+        if self.mode != 'record':
+            with self._lock:
+                recorded = self.interactions.get(key, [])
+                index = self._played.get(key, 0)
+                if index < len(recorded):
+                    self._played[key] = index + 1
+                    SessionStats.add('cassettes.replayed')
+                    return _to_response(recorded[index], url)
+
+            SessionStats.add('cassettes.missed')
+            if self.mode == 'strict':
+                raise CassetteMiss(f"No recorded response for '{key}' in {self.path}")
+
+        response = send()
+        with self._lock:
+            self.interactions.setdefault(key, []).append(_from_response(response))
+            self._played[key] = self._played.get(key, 0) + 1
+            self._dirty = True
+        SessionStats.add('cassettes.recorded')
+        return response
+
+    def save(self):
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'version': CASSETTE_VERSION, 'recorded': time.time(), 'interactions': self.interactions},
+                      f, separators=(',', ':'))
+        self._dirty = False
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        too_old = time.time() - data.get('recorded', 0) > self.max_age_days * 86400
+        if data.get('version') != CASSETTE_VERSION or too_old:
+            return {}
+        return data.get('interactions', {})
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                json_body: Any = None, data: Any = None) -> str:
+    """Normalized request: method, path, sorted query and canonical body, without run-specific usernames"""
+    parts = urlsplit(url)
+    query = sorted(parse_qsl(parts.query) + [(str(k), str(v)) for k, v in (params or {}).items()])
+    key = f"{method.upper()} {parts.path}"
+    if query:
+        key += f"?{urlencode(query)}"
+    if json_body is not None:
+        key += f" {json.dumps(json_body, sort_keys=True, separators=(',', ':'))}"
+    elif data:
+        key += f" {data if isinstance(data, str) else json.dumps(data, sort_keys=True)}"
+    return UNIQUE_USERNAME.sub("_<unique>", key)
+
+
+def _from_response(response: requests.Response) -> Dict[str, Any]:
+    return {
+        'status': response.status_code,
+        'reason': response.reason,
+        'content_type': response.headers.get('Content-Type', ''),
+        'body': response.text
+    }
+
+
+def _to_response(recorded: Dict[str, Any], url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = recorded['status']
+    response.reason = recorded.get('reason')
+    response.headers = CaseInsensitiveDict({'Content-Type': recorded.get('content_type', '')})
+    response._content = recorded['body'].encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = url
+    return response
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List or invalidate recorded API cassettes")
+    parser.add_argument("--invalidate", metavar="PATTERN", nargs="?", const="*",
+                        help="Delete cassettes whose file name matches the glob pattern (default: all)")
+    args = parser.parse_args(argv)
+
+    directory = ConfigReader.get_cassettes_config()['directory']
+    names = sorted(name for name in os.listdir(directory) if name.endswith(".json")) if os.path.isdir(directory) else []
+    if args.invalidate is None:
+        for name in names:
+            print(name)
+        return
+
+    removed = [name for name in names if fnmatch.fnmatch(name, args.invalidate)]
+    for name in removed:
+        os.remove(os.path.join(directory, name))
+    print(f"✅ Invalidated {len(removed)} cassettes in {directory}")
+
+
+if __name__ == "__main__":
+    main()
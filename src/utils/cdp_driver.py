@@ -0,0 +1,772 @@
+import base64
+import itertools
+import json
+import shutil
+import subprocess
+import threading
+import time
+import urllib.request
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+import websocket
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, JavascriptException,
+    NoAlertPresentException, NoSuchElementException, NoSuchWindowException,
+    StaleElementReferenceException, TimeoutException, WebDriverException
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+# CDP errors meaning the object or its page is gone, e.g. after a navigation
+STALE_ERRORS = ("Could not find object with given id", "Cannot find context with specified id",
+                "Execution context was destroyed", "No node with given id", "__cdp_stale__")
+
+# Runs a Selenium-style script body. Elements in the arguments arrive as
+# placeholders plus trailing object arguments; the result comes back as a
+# single node, a JSON string, or [JSON, node, node, ...] when it holds nodes.
+SCRIPT_WRAPPER = """
+function(packedArgs, timeoutMs) {
+    var elements = Array.prototype.slice.call(arguments, 2);
+    var revive = function(value) {
+        if (Array.isArray(value)) { return value.map(revive); }
+        if (value && typeof value === 'object') {
+            if ('__cdp_element__' in value) { return elements[value.__cdp_element__]; }
+            var revived = {};
+            Object.keys(value).forEach(function(key) { revived[key] = revive(value[key]); });
+            return revived;
+        }
+        return value;
+    };
+    var nodes = [];
+    var pack = function(value) {
+        if (value instanceof Node) { nodes.push(value); return {'__cdp_element__': nodes.length - 1}; }
+        if (Array.isArray(value) || value instanceof NodeList || value instanceof HTMLCollection) {
+            return Array.prototype.map.call(value, pack);
+        }
+        if (value && typeof value === 'object') {
+            if (typeof value.toJSON === 'function') { return value.toJSON(); }
+            var packed = {};
+            Object.keys(value).forEach(function(key) { packed[key] = pack(value[key]); });
+            return packed;
+        }
+        return value === undefined ? null : value;
+    };
+    var finish = function(value) {
+        if (value instanceof Node) { return value; }
+        var json = JSON.stringify(pack(value));
+        return nodes.length ? [json].concat(nodes) : json;
+    };
+    var args = revive(packedArgs);
+    __BODY__
+}
+"""
+
+SYNC_BODY = "return finish((function() { __USER_SCRIPT__ }).apply(null, args));"
+
+ASYNC_BODY = """
+    return new Promise(function(resolve, reject) {
+        var timer = setTimeout(function() { reject(new Error('__cdp_script_timeout__')); }, timeoutMs);
+        args.push(function(value) { clearTimeout(timer); resolve(value); });
+        try { (function() { __USER_SCRIPT__ }).apply(null, args); }
+        catch (e) { clearTimeout(timer); reject(e); }
+    }).then(finish);
+"""
+
+FIND = """
+function(using, value, all) {
+    var root = this && this.nodeType ? this : document;
+    if (root.isConnected === false) { throw new Error('__cdp_stale__'); }
+    if (using === 'css selector') { return all ? Array.from(root.querySelectorAll(value)) : root.querySelector(value); }
+    var type = all ? XPathResult.ORDERED_NODE_SNAPSHOT_TYPE : XPathResult.FIRST_ORDERED_NODE_TYPE;
+    var result = document.evaluate(value, root, null, type, null);
+    if (!all) { return result.singleNodeValue; }
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+    return nodes;
+}
+"""
+
+CLICK_POINT = """
+function() {
+    if (!this.isConnected) { throw new Error('__cdp_stale__'); }
+    this.scrollIntoView({block: 'center', inline: 'center'});
+    var rect = this.getBoundingClientRect();
+    if (!rect.width || !rect.height) { return {error: 'not interactable'}; }
+    var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+    var hit = document.elementFromPoint(x, y);
+    if (hit && hit !== this && !this.contains(hit)) {
+        return {error: 'intercepted', by: hit.outerHTML.slice(0, 200)};
+    }
+    return {x: x, y: y};
+}
+"""
+
+ELEMENT_FUNCTIONS = {
+    'is_displayed': """function() {
+        if (!this.isConnected) { throw new Error('__cdp_stale__'); }
+        var style = window.getComputedStyle(this);
+        return style.visibility !== 'hidden' && style.display !== 'none' && this.getClientRects().length > 0;
+    }""",
+    'is_enabled': "function() { if (!this.isConnected) { throw new Error('__cdp_stale__'); } return !this.disabled; }",
+    'is_selected': "function() { return !!(this.checked || this.selected); }",
+    'text': """function() {
+        if (!this.isConnected) { throw new Error('__cdp_stale__'); }
+        return (this.innerText !== undefined ? this.innerText : this.textContent).trim();
+    }""",
+    'tag_name': "function() { return this.tagName.toLowerCase(); }",
+    'get_attribute': """function(name) {
+        if (!this.isConnected) { throw new Error('__cdp_stale__'); }
+        var property = this[name];
+        if (typeof property === 'boolean') { return property ? 'true' : null; }
+        if (property !== undefined && property !== null && typeof property !== 'object' && typeof property !== 'function') {
+            return String(property);
+        }
+        return this.getAttribute(name);
+    }""",
+    'get_dom_attribute': "function(name) { return this.getAttribute(name); }",
+    'get_property': "function(name) { return this[name]; }",
+    'focus': "function() { if (!this.isConnected) { throw new Error('__cdp_stale__'); } this.focus(); }",
+    'clear': """function() {
+        if (!this.isConnected) { throw new Error('__cdp_stale__'); }
+        this.focus();
+        var prototype = this instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(prototype, 'value').set.call(this, '');
+        this.dispatchEvent(new Event('input', {bubbles: true}));
+        this.dispatchEvent(new Event('change', {bubbles: true}));
+    }""",
+    'rect': """function() {
+        var rect = this.getBoundingClientRect();
+        return {x: rect.left + window.scrollX, y: rect.top + window.scrollY, width: rect.width, height: rect.height};
+    }"""
+}
+
+# Selenium Keys that have a DOM key name; other characters are typed as text
+SPECIAL_KEYS = {
+    Keys.ENTER: ('Enter', 13, '\r'), Keys.RETURN: ('Enter', 13, '\r'), Keys.TAB: ('Tab', 9, None),
+    Keys.BACKSPACE: ('Backspace', 8, None), Keys.DELETE: ('Delete', 46, None), Keys.ESCAPE: ('Escape', 27, None),
+    Keys.ARROW_DOWN: ('ArrowDown', 40, None), Keys.ARROW_UP: ('ArrowUp', 38, None),
+    Keys.ARROW_LEFT: ('ArrowLeft', 37, None), Keys.ARROW_RIGHT: ('ArrowRight', 39, None),
+    Keys.HOME: ('Home', 36, None), Keys.END: ('End', 35, None)
+}
+
+CONSOLE_LEVELS = {'error': 'SEVERE', 'assert': 'SEVERE', 'warning': 'WARNING', 'debug': 'DEBUG'}
+
+
+def find_chrome_binary() -> str:
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise WebDriverException(f"No Chrome binary found, looked for {', '.join(CHROME_BINARIES)}")
+
+
+def start_chrome(arguments: List[str], debug_port: int, binary: Optional[str] = None, timeout: float = 30):
+    """Start Chrome with remote debugging; returns the process, /json/version and the page targets"""
+    command = [binary or find_chrome_binary(), f"--remote-debugging-port={debug_port}"] + arguments + ["about:blank"]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            version = _get_json(f"http://127.0.0.1:{debug_port}/json/version")
+            pages = [target for target in _get_json(f"http://127.0.0.1:{debug_port}/json/list")
+                     if target.get('type') == 'page']
+            if pages:
+                return process, version, pages
+        except (OSError, ValueError):
+            pass
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise WebDriverException(f"Chrome did not open DevTools on port {debug_port}")
+        time.sleep(0.05)
+
+
+class CdpElement:
+    """A DOM node of a CdpDriver page, duck-typed after Selenium's WebElement"""
+
+    def __init__(self, driver: "CdpDriver", object_id: str):
+        self._driver = driver
+        self.id = object_id
+
+    def __eq__(self, other):
+        return isinstance(other, CdpElement) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    @property
+    def parent(self) -> "CdpDriver":
+        return self._driver
+
+    @property
+    def text(self) -> str:
+        return self._call('text')
+
+    @property
+    def tag_name(self) -> str:
+        return self._call('tag_name')
+
+    @property
+    def rect(self) -> Dict[str, float]:
+        return self._call('rect')
+
+    @property
+    def location(self) -> Dict[str, float]:
+        rect = self.rect
+        return {'x': rect['x'], 'y': rect['y']}
+
+    @property
+    def size(self) -> Dict[str, float]:
+        rect = self.rect
+        return {'width': rect['width'], 'height': rect['height']}
+
+    def is_displayed(self) -> bool:
+        return self._call('is_displayed')
+
+    def is_enabled(self) -> bool:
+        return self._call('is_enabled')
+
+    def is_selected(self) -> bool:
+        return self._call('is_selected')
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self._call('get_attribute', name)
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        return self._call('get_dom_attribute', name)
+
+    def get_property(self, name: str):
+        return self._call('get_property', name)
+
+    def clear(self):
+        self._call('clear')
+
+    def click(self):
+        """A real mouse click at the element's center, like chromedriver does"""
+        point = self._driver._call_function(self.id, CLICK_POINT)
+        if point.get('error') == 'intercepted':
+            raise ElementClickInterceptedException(f"element click intercepted: other element would receive the click: {point['by']}")
+        if point.get('error'):
+            raise ElementNotInteractableException("element not interactable: it has no size")
+        for event in ('mousePressed', 'mouseReleased'):
+            self._driver.execute('Input.dispatchMouseEvent', {
+                'type': event, 'x': point['x'], 'y': point['y'], 'button': 'left', 'clickCount': 1
+            })
+
+    def send_keys(self, *values):
+        """Focus the element and type with real key events"""
+        self._call('focus')
+        self._driver.type_keys(''.join(str(value) for value in values))
+
+    def submit(self):
+        self._driver.execute_script("(arguments[0].form || arguments[0]).requestSubmit()", self)
+
+    def screenshot_as_png(self) -> bytes:
+        rect = self.rect
+        return self._driver._capture_screenshot(clip=dict(rect, scale=1))
+
+    def find_element(self, by=By.ID, value=None) -> "CdpElement":
+        return self._driver._find(by, value, root=self)
+
+    def find_elements(self, by=By.ID, value=None) -> List["CdpElement"]:
+        return self._driver._find(by, value, root=self, all_matches=True)
+
+    def _call(self, name: str, *args):
+        return self._driver._call_function(self.id, ELEMENT_FUNCTIONS[name], *args)
+
+
+class CdpAlert:
+    def __init__(self, driver: "CdpDriver", dialog: Dict[str, Any]):
+        self._driver = driver
+        self.text = dialog.get('message', '')
+
+    def accept(self):
+        self._driver.execute('Page.handleJavaScriptDialog', {'accept': True})
+
+    def dismiss(self):
+        self._driver.execute('Page.handleJavaScriptDialog', {'accept': False})
+
+    def send_keys(self, text: str):
+        self._driver.execute('Page.handleJavaScriptDialog', {'accept': True, 'promptText': text})
+
+
+class CdpSwitchTo:
+    def __init__(self, driver: "CdpDriver"):
+        self._driver = driver
+
+    @property
+    def alert(self) -> CdpAlert:
+        dialog = self._driver._dialog
+        if dialog is None:
+            raise NoAlertPresentException("no such alert")
+        return CdpAlert(self._driver, dialog)
+
+    def window(self, handle: str):
+        if handle != self._driver.current_window_handle:
+            raise NoSuchWindowException(f"no such window: {handle}, the chrome-cdp backend drives a single tab")
+
+    def default_content(self):
+        pass
+
+
+class CdpDriver:
+    """Chrome driven over one persistent DevTools WebSocket, without chromedriver.
+
+    Implements the part of Selenium's WebDriver API that the page objects,
+    fixtures and utilities use: navigation, finding elements by any ``By``
+    strategy, clicks and key events, text and attributes, cookies,
+    screenshots, sync and async scripts, CDP commands, and the
+    ``performance`` and ``browser`` logs. It raises Selenium's exceptions, so
+    existing waits and retries behave the same. Commands go through
+    ``execute``, which the CommandProfiler can wrap. Only the first tab is
+    driven; new windows are not followed.
+    """
+
+    def __init__(self, websocket_url: str, process: Optional[subprocess.Popen] = None, target_id: str = "",
+                 browser_version: str = "", log_buffer_size: int = 10000):
+        self.process = process
+        self.target_id = target_id
+        self.capabilities = {'browserName': 'chrome-cdp', 'browserVersion': browser_version}
+        self.session_id = target_id
+        self.switch_to = CdpSwitchTo(self)
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._implicit_wait = 0.0
+        self._script_timeout = 30.0
+        self._page_load_timeout = 300.0
+        self._load_event = threading.Event()
+        self._dialog: Optional[Dict[str, Any]] = None
+        self._performance_log: Deque[Dict[str, Any]] = deque(maxlen=log_buffer_size)
+        self._browser_log: Deque[Dict[str, Any]] = deque(maxlen=log_buffer_size)
+        self._closed = False
+
+        self._socket = websocket.create_connection(websocket_url, suppress_origin=True, enable_multithread=True)
+        self._reader = threading.Thread(target=self._read_loop, name="cdp-reader", daemon=True)
+        self._reader.start()
+        self.execute('Page.enable')
+        self.execute('Runtime.enable')
+
+    @classmethod
+    def launch(cls, arguments: List[str], debug_port: int, binary: Optional[str] = None,
+               timeout: float = 30) -> "CdpDriver":
+        """Start Chrome with remote debugging on ``debug_port`` and connect to its first tab"""
+        process, version, pages = start_chrome(arguments, debug_port, binary, timeout)
+        return cls(pages[0]['webSocketDebuggerUrl'], process, pages[0]['id'], version.get('Browser', ''))
+
+    # -- protocol ---------------------------------------------------------
+
+    def execute(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send one CDP command and wait for its result; the single entry point the CommandProfiler wraps"""
+        return self._send(method, params, max(60.0, self._script_timeout + 5))
+
+    def _send(self, method: str, params: Optional[Dict[str, Any]], timeout: float) -> Dict[str, Any]:
+        if self._closed:
+            raise WebDriverException("invalid session id: the chrome-cdp session is closed")
+        command_id = next(self._ids)
+        waiter = {'event': threading.Event()}
+        with self._pending_lock:
+            self._pending[command_id] = waiter
+        try:
+            with self._send_lock:
+                self._socket.send(json.dumps({'id': command_id, 'method': method, 'params': params or {}}))
+        except (websocket.WebSocketException, OSError) as e:
+            self._pending.pop(command_id, None)
+            raise WebDriverException(f"chrome-cdp connection lost: {e}")
+
+        if not waiter['event'].wait(timeout):
+            with self._pending_lock:
+                self._pending.pop(command_id, None)
+            raise TimeoutException(f"No response to {method} within {timeout}s")
+        message = waiter['message']
+        if 'error' in message:
+            error = message['error'].get('message', str(message['error']))
+            if any(marker in error for marker in STALE_ERRORS):
+                raise StaleElementReferenceException(f"stale element reference: {error}")
+            raise WebDriverException(f"{method} failed: {error}")
+        return message.get('result', {})
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict[str, Any]) -> Dict[str, Any]:
+        return self.execute(cmd, cmd_args)
+
+    def _read_loop(self):
+        while True:
+            try:
+                raw = self._socket.recv()
+            except (websocket.WebSocketException, OSError):
+                break
+            if not raw:
+                break
+            message = json.loads(raw)
+            if 'id' in message:
+                with self._pending_lock:
+                    waiter = self._pending.pop(message['id'], None)
+                if waiter is not None:
+                    waiter['message'] = message
+                    waiter['event'].set()
+            else:
+                self._on_event(message.get('method', ''), message.get('params', {}))
+
+        self._closed = True
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for waiter in pending.values():
+            waiter['message'] = {'error': {'message': 'chrome-cdp connection closed'}}
+            waiter['event'].set()
+
+    def _on_event(self, method: str, params: Dict[str, Any]):
+        now = int(time.time() * 1000)
+        if method.startswith(('Network.', 'Page.')):
+            self._performance_log.append({
+                'message': json.dumps({'message': {'method': method, 'params': params}}),
+                'timestamp': now,
+                'level': 'INFO'
+            })
+        if method == 'Page.loadEventFired':
+            self._load_event.set()
+        elif method == 'Page.javascriptDialogOpening':
+            self._dialog = params
+        elif method == 'Page.javascriptDialogClosed':
+            self._dialog = None
+        elif method == 'Runtime.consoleAPICalled':
+            text = " ".join(str(arg.get('value', arg.get('description', ''))) for arg in params.get('args', []))
+            self._browser_log.append({'level': CONSOLE_LEVELS.get(params.get('type'), 'INFO'),
+                                      'message': text, 'source': 'console-api', 'timestamp': now})
+        elif method == 'Runtime.exceptionThrown':
+            details = params.get('exceptionDetails', {})
+            text = details.get('exception', {}).get('description') or details.get('text', '')
+            self._browser_log.append({'level': 'SEVERE', 'message': text, 'source': 'javascript', 'timestamp': now})
+
+    # -- navigation and page state ------------------------------------------
+
+    def get(self, url: str):
+        self._load_event.clear()
+        result = self.execute('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            raise WebDriverException(f"unknown error: {result['errorText']} ({url})")
+        # Same-document navigations have no loader and fire no load event
+        if result.get('loaderId') and not self._load_event.wait(self._page_load_timeout):
+            raise TimeoutException(f"Timed out after {self._page_load_timeout}s loading {url}")
+
+    def refresh(self):
+        self._load_event.clear()
+        self.execute('Page.reload')
+        self._load_event.wait(self._page_load_timeout)
+
+    def back(self):
+        self.execute_script("history.back()")
+
+    def forward(self):
+        self.execute_script("history.forward()")
+
+    @property
+    def current_url(self) -> str:
+        return self._evaluate_value("location.href")
+
+    @property
+    def title(self) -> str:
+        return self._evaluate_value("document.title")
+
+    @property
+    def page_source(self) -> str:
+        return self._evaluate_value("document.documentElement.outerHTML")
+
+    @property
+    def current_window_handle(self) -> str:
+        return self.target_id
+
+    @property
+    def window_handles(self) -> List[str]:
+        if self._closed:
+            raise WebDriverException("invalid session id: the chrome-cdp session is closed")
+        return [self.target_id]
+
+    def implicitly_wait(self, time_to_wait: float):
+        self._implicit_wait = time_to_wait
+
+    def set_script_timeout(self, time_to_wait: float):
+        self._script_timeout = time_to_wait
+
+    def set_page_load_timeout(self, time_to_wait: float):
+        self._page_load_timeout = time_to_wait
+
+    def set_window_size(self, width: int, height: int, windowHandle: str = "current"):
+        self.execute('Emulation.setDeviceMetricsOverride',
+                     {'width': width, 'height': height, 'deviceScaleFactor': 0, 'mobile': False})
+
+    def get_window_size(self, windowHandle: str = "current") -> Dict[str, int]:
+        return self._evaluate_value("({width: window.innerWidth, height: window.innerHeight})")
+
+    def maximize_window(self):
+        try:
+            window = self.execute('Browser.getWindowForTarget', {'targetId': self.target_id})
+            self.execute('Browser.setWindowBounds', {'windowId': window['windowId'],
+                                                     'bounds': {'windowState': 'maximized'}})
+        except WebDriverException:
+            pass
+
+    # -- elements -----------------------------------------------------------
+
+    def find_element(self, by=By.ID, value=None) -> CdpElement:
+        return self._find(by, value)
+
+    def find_elements(self, by=By.ID, value=None) -> List[CdpElement]:
+        return self._find(by, value, all_matches=True)
+
+    def _find(self, by, value, root: Optional[CdpElement] = None, all_matches: bool = False):
+        using, selector = _to_css_or_xpath(by, value)
+        deadline = time.monotonic() + self._implicit_wait
+        while True:
+            if root is None:
+                expression = f"({FIND}).call(document, {json.dumps(using)}, {json.dumps(selector)}, {json.dumps(all_matches)})"
+                remote = self._evaluate(expression)
+            else:
+                remote = self._call_function_raw(root.id, FIND, using, selector, all_matches)
+
+            if all_matches:
+                found = self._array_elements(remote)
+                if found or time.monotonic() >= deadline:
+                    return found
+            elif remote.get('subtype') == 'node':
+                return CdpElement(self, remote['objectId'])
+            elif time.monotonic() >= deadline:
+                raise NoSuchElementException(f"no such element: Unable to locate element: {{\"method\":\"{by}\",\"selector\":\"{value}\"}}")
+            time.sleep(0.05)
+
+    def type_keys(self, text: str):
+        """Type into the focused element, one key event pair per character"""
+        for char in text:
+            special = SPECIAL_KEYS.get(char)
+            if special:
+                key, code, key_text = special
+                down = {'type': 'keyDown' if key_text else 'rawKeyDown', 'key': key, 'windowsVirtualKeyCode': code}
+                if key_text:
+                    down['text'] = key_text
+                up = {'type': 'keyUp', 'key': key, 'windowsVirtualKeyCode': code}
+            else:
+                down = {'type': 'keyDown', 'key': char, 'text': char, 'unmodifiedText': char}
+                up = {'type': 'keyUp', 'key': char}
+            self.execute('Input.dispatchKeyEvent', down)
+            self.execute('Input.dispatchKeyEvent', up)
+
+    # -- scripts ------------------------------------------------------------
+
+    def execute_script(self, script: str, *args):
+        return self._run_script(script, args, asynchronous=False)
+
+    def execute_async_script(self, script: str, *args):
+        return self._run_script(script, args, asynchronous=True)
+
+    def _run_script(self, script: str, args, asynchronous: bool):
+        elements: List[CdpElement] = []
+        packed = _pack_arguments(list(args), elements)
+        body = (ASYNC_BODY if asynchronous else SYNC_BODY).replace("__USER_SCRIPT__", script)
+        wrapper = SCRIPT_WRAPPER.replace("__BODY__", body)
+        timeout_ms = int(self._script_timeout * 1000)
+
+        if elements:
+            result = self.execute('Runtime.callFunctionOn', {
+                'functionDeclaration': wrapper,
+                'objectId': elements[0].id,
+                'arguments': [{'value': packed}, {'value': timeout_ms}] + [{'objectId': e.id} for e in elements],
+                'awaitPromise': asynchronous
+            })
+        else:
+            result = self.execute('Runtime.evaluate', {
+                'expression': f"({wrapper}).call(null, {json.dumps(packed)}, {timeout_ms})",
+                'awaitPromise': asynchronous
+            })
+        return self._decode_script_result(self._checked(result))
+
+    def _decode_script_result(self, remote: Dict[str, Any]):
+        if remote.get('subtype') == 'node':
+            return CdpElement(self, remote['objectId'])
+        if remote.get('type') == 'string':
+            return json.loads(remote['value'])
+
+        # [JSON, node, node, ...]: the JSON holds placeholders for the nodes
+        properties = self._array_items(remote)
+        nodes = [CdpElement(self, item['objectId']) for item in properties[1:]]
+        return _revive(json.loads(properties[0]['value']), nodes)
+
+    def _evaluate(self, expression: str) -> Dict[str, Any]:
+        return self._checked(self.execute('Runtime.evaluate', {'expression': expression}))
+
+    def _evaluate_value(self, expression: str):
+        return self._checked(self.execute('Runtime.evaluate',
+                                          {'expression': expression, 'returnByValue': True})).get('value')
+
+    def _call_function(self, object_id: str, declaration: str, *args):
+        result = self.execute('Runtime.callFunctionOn', {
+            'objectId': object_id, 'functionDeclaration': declaration,
+            'arguments': [{'value': arg} for arg in args], 'returnByValue': True
+        })
+        return self._checked(result).get('value')
+
+    def _call_function_raw(self, object_id: str, declaration: str, *args) -> Dict[str, Any]:
+        return self._checked(self.execute('Runtime.callFunctionOn', {
+            'objectId': object_id, 'functionDeclaration': declaration,
+            'arguments': [{'value': arg} for arg in args]
+        }))
+
+    def _array_items(self, remote: Dict[str, Any]) -> List[Dict[str, Any]]:
+        properties = self.execute('Runtime.getProperties', {'objectId': remote['objectId'], 'ownProperties': True})
+        items = [item for item in properties['result'] if item['name'].isdigit()]
+        return [item['value'] for item in sorted(items, key=lambda item: int(item['name']))]
+
+    def _array_elements(self, remote: Dict[str, Any]) -> List[CdpElement]:
+        if remote.get('subtype') != 'array':
+            return []
+        return [CdpElement(self, item['objectId']) for item in self._array_items(remote)]
+
+    @staticmethod
+    def _checked(result: Dict[str, Any]) -> Dict[str, Any]:
+        details = result.get('exceptionDetails')
+        if details:
+            text = details.get('exception', {}).get('description') or details.get('text', '')
+            if '__cdp_stale__' in text:
+                raise StaleElementReferenceException("stale element reference: element is not attached to the page document")
+            if '__cdp_script_timeout__' in text:
+                raise TimeoutException("script timeout")
+            raise JavascriptException(f"javascript error: {text}")
+        return result.get('result', {})
+
+    # -- cookies, screenshots and logs --------------------------------------
+
+    def get_cookies(self) -> List[Dict[str, Any]]:
+        return [_to_selenium_cookie(cookie) for cookie in self.execute('Network.getCookies')['cookies']]
+
+    def get_cookie(self, name: str) -> Optional[Dict[str, Any]]:
+        for cookie in self.get_cookies():
+            if cookie['name'] == name:
+                return cookie
+        return None
+
+    def add_cookie(self, cookie_dict: Dict[str, Any]):
+        cookie = {key: cookie_dict[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+                  if key in cookie_dict}
+        if 'expiry' in cookie_dict:
+            cookie['expires'] = cookie_dict['expiry']
+        if 'domain' not in cookie:
+            cookie['url'] = self.current_url
+        self.execute('Network.setCookie', cookie)
+
+    def delete_cookie(self, name: str):
+        self.execute('Network.deleteCookies', {'name': name, 'url': self.current_url})
+
+    def delete_all_cookies(self):
+        """Clears the cookies of every site, not only the current one"""
+        self.execute('Network.clearBrowserCookies')
+
+    def get_screenshot_as_png(self) -> bytes:
+        return self._capture_screenshot()
+
+    def get_screenshot_as_base64(self) -> str:
+        return base64.b64encode(self._capture_screenshot()).decode('ascii')
+
+    def save_screenshot(self, filename: str) -> bool:
+        with open(filename, 'wb') as f:
+            f.write(self._capture_screenshot())
+        return True
+
+    def _capture_screenshot(self, clip: Optional[Dict[str, float]] = None) -> bytes:
+        params = {'format': 'png'}
+        if clip:
+            params['clip'] = clip
+        return base64.b64decode(self.execute('Page.captureScreenshot', params)['data'])
+
+    def get_log(self, log_type: str) -> List[Dict[str, Any]]:
+        """Drain the ``performance`` (Network and Page events) or ``browser`` (console) log"""
+        buffers = {'performance': self._performance_log, 'browser': self._browser_log}
+        if log_type not in buffers:
+            raise ValueError(f"chrome-cdp has no '{log_type}' log")
+        buffer = buffers[log_type]
+        entries = []
+        while buffer:
+            entries.append(buffer.popleft())
+        return entries
+
+    # -- shutdown -------------------------------------------------------------
+
+    def close(self):
+        self.quit()
+
+    def quit(self):
+        """Close the connection, and the browser too when this driver started it"""
+        if not self._closed and self.process is not None:
+            try:
+                self._send('Browser.close', None, timeout=5)
+            except WebDriverException:
+                pass
+        self._closed = True
+        try:
+            self._socket.close()
+        except (websocket.WebSocketException, OSError):
+            pass
+        if self.process is not None and self.process.poll() is None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait(timeout=5)
+
+
+def _to_css_or_xpath(by, value):
+    if by in (By.CSS_SELECTOR, By.XPATH):
+        return by, value
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{_css_string(value)}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{_css_string(value)}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f'[class~="{_css_string(value)}"]'
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    if by == By.LINK_TEXT:
+        return By.XPATH, f".//a[normalize-space(.)={json.dumps(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return By.XPATH, f".//a[contains(., {json.dumps(value)})]"
+    raise WebDriverException(f"invalid argument: unsupported locator strategy '{by}'")
+
+
+def _css_string(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _pack_arguments(value, elements: List[CdpElement]):
+    """Replace elements with placeholders the script wrapper turns back into nodes"""
+    if isinstance(value, CdpElement):
+        elements.append(value)
+        return {'__cdp_element__': len(elements) - 1}
+    if isinstance(value, (list, tuple)):
+        return [_pack_arguments(item, elements) for item in value]
+    if isinstance(value, dict):
+        return {key: _pack_arguments(item, elements) for key, item in value.items()}
+    return value
+
+
+def _revive(value, nodes: List[CdpElement]):
+    if isinstance(value, list):
+        return [_revive(item, nodes) for item in value]
+    if isinstance(value, dict):
+        if '__cdp_element__' in value:
+            return nodes[value['__cdp_element__']]
+        return {key: _revive(item, nodes) for key, item in value.items()}
+    return value
+
+
+def _to_selenium_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    converted = {key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly') if key in cookie}
+    if cookie.get('sameSite'):
+        converted['sameSite'] = cookie['sameSite']
+    if not cookie.get('session') and cookie.get('expires', -1) > 0:
+        converted['expiry'] = int(cookie['expires'])
+    return converted
+
+
+def _get_json(url: str):
+    with urllib.request.urlopen(url, timeout=2) as response:
+        return json.loads(response.read().decode('utf-8'))
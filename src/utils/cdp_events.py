@@ -0,0 +1,68 @@
+import json
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List
+from selenium.common.exceptions import WebDriverException
+
+
+class CdpEventLog:
+    """DevTools events of a Chrome session, read from chromedriver's performance log.
+
+    ``driver.get_log('performance')`` hands out each event only once, so all
+    consumers go through this per-driver log: ``drain`` reads new events,
+    keeps the most recent ones in a bounded ring buffer and passes each to
+    the registered listeners.
+    """
+
+    def __init__(self, driver, max_events: int = 500):
+        self.driver = driver
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def for_driver(driver, max_events: int = 500) -> "CdpEventLog":
+        log = getattr(driver, "_cdp_event_log", None)
+        if log is None:
+            log = CdpEventLog(driver, max_events)
+            driver._cdp_event_log = log
+        return log
+
+    @staticmethod
+    def is_supported(driver) -> bool:
+        return hasattr(driver, "execute_cdp_cmd") and hasattr(driver, "get_log")
+
+    def subscribe(self, listener: Callable[[Dict[str, Any]], None]):
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[Dict[str, Any]], None]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def drain(self) -> int:
+        """Read pending events and dispatch them; returns how many were read"""
+        try:
+            entries = self.driver.get_log("performance")
+        except (WebDriverException, ValueError):
+            return 0
+
+        with self._lock:
+            listeners = list(self._listeners)
+            for entry in entries:
+                event = json.loads(entry["message"])["message"]
+                event["timestamp"] = entry.get("timestamp")
+                self.recent.append(event)
+                for listener in listeners:
+                    listener(event)
+        return len(entries)
+
+    def discard_pending(self):
+        """Drop events that happened before now, e.g. from the previous test on a pooled driver"""
+        try:
+            self.driver.get_log("performance")
+        except (WebDriverException, ValueError):
+            pass
+        self.recent.clear()
@@ -1,61 +1,451 @@
 import configparser
 import os
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from dotenv import dotenv_values
+
+
+# Short environment variable names. HEADLESS is kept for the Dockerfile; the
+# others carry the prefix, as a bare BROWSER is the desktop's default browser.
+# Any option can also be set as ORANGEHRM_<SECTION>_<OPTION>, e.g. ORANGEHRM_TEST_EXPLICIT_WAIT.
+ENV_ALIASES = {
+    'ORANGEHRM_BROWSER': ('Browsers', 'browser'),
+    'HEADLESS': ('Browsers', 'headless'),
+    'ORANGEHRM_BASE_URL': ('OrangeHRM', 'base_url')
+}
+ENV_PREFIX = 'ORANGEHRM_'
+
+_MISSING = object()
+_BOOLEAN_STATES = configparser.ConfigParser.BOOLEAN_STATES
+
+
+class Settings:
+    """Immutable view of the merged configuration layers.
+
+    Exposes the read-only part of the ``ConfigParser`` interface
+    (``get``/``getint``/``getfloat``/``getboolean`` with ``fallback``) so it
+    can be used wherever a parsed config.ini was used before. Values stay
+    strings and are only converted by the typed getters.
+    """
+
+    def __init__(self, sections: Dict[str, Dict[str, Any]]):
+        self._sections = MappingProxyType({
+            name: MappingProxyType(dict(options)) for name, options in sections.items()
+        })
+
+    def sections(self):
+        return list(self._sections)
+
+    def section(self, section: str) -> Mapping[str, Any]:
+        return self._sections.get(section, MappingProxyType({}))
+
+    def has_option(self, section: str, option: str) -> bool:
+        return option in self.section(section)
+
+    def get(self, section: str, option: str, fallback: Any = _MISSING) -> Any:
+        try:
+            return self._sections[section][option]
+        except KeyError:
+            if fallback is _MISSING:
+                raise configparser.NoOptionError(option, section)
+            return fallback
+
+    def getint(self, section: str, option: str, fallback: Any = _MISSING) -> int:
+        value = self.get(section, option, fallback)
+        return value if value is fallback else int(value)
+
+    def getfloat(self, section: str, option: str, fallback: Any = _MISSING) -> float:
+        value = self.get(section, option, fallback)
+        return value if value is fallback else float(value)
+
+    def getboolean(self, section: str, option: str, fallback: Any = _MISSING) -> bool:
+        value = self.get(section, option, fallback)
+        return value if value is fallback else _to_bool(value)
+
 
 class ConfigReader:
-    _config = None
-    
+    """Builds the process-wide Settings from config.ini < .env < environment < CLI.
+
+    config.ini is the lowest layer and holds every known option. The merged
+    settings are cached; config.ini and .env are only re-read when their
+    modification time changes, and the check itself is throttled so
+    page-object construction never touches the filesystem.
+    """
+
+    RELOAD_CHECK_INTERVAL = 2.0
+
+    _config: Optional[Settings] = None
+    _mtimes = None
+    _last_check = 0.0
+    _cli_overrides: Dict[str, Dict[str, Any]] = {}
+    _lock = threading.Lock()
+
     @classmethod
-    def get_config(cls):
+    def get_config(cls) -> Settings:
         """Get the configuration, loading it if necessary"""
-        if cls._config is None:
-            cls._config = cls.read_config()
+        now = time.monotonic()
+        if cls._config is not None and now - cls._last_check < cls.RELOAD_CHECK_INTERVAL:
+            return cls._config
+
+        with cls._lock:
+            cls._last_check = now
+            mtimes = cls._source_mtimes()
+            if cls._config is None or mtimes != cls._mtimes:
+                cls._config = cls._build()
+                cls._mtimes = mtimes
         return cls._config
-    
+
+    @classmethod
+    def set_cli_overrides(cls, overrides: Dict[str, Dict[str, Any]]):
+        """Set the highest-priority layer, typically from pytest command line options"""
+        with cls._lock:
+            cls._cli_overrides = {
+                section: {option: value for option, value in options.items() if value is not None}
+                for section, options in overrides.items()
+            }
+            cls._config = None
+
+    @classmethod
+    def set_cli_override(cls, section: str, option: str, value: Any):
+        """Override a single option in the highest-priority layer, keeping the others"""
+        with cls._lock:
+            cls._cli_overrides = {name: dict(options) for name, options in cls._cli_overrides.items()}
+            cls._cli_overrides.setdefault(section, {})[option] = value
+            cls._config = None
+
+    @staticmethod
+    def get_config_path() -> str:
+        """Absolute path of config.ini"""
+        base_dir = Path(__file__).parent.parent
+        return os.path.join(base_dir, 'config', 'config.ini')
+
+    @staticmethod
+    def get_dotenv_path() -> str:
+        """Path of the .env file, looked up from the working directory"""
+        return os.path.join(os.getcwd(), '.env')
+
     @staticmethod
     def read_config():
-        """Read and return the configuration from config.ini"""
+        """Read and return the raw configuration from config.ini"""
         config = configparser.ConfigParser()
-        
-        # Get the absolute path to the config file
-        base_dir = Path(__file__).parent.parent
-        config_path = os.path.join(base_dir, 'config', 'config.ini')
-        
-        # Read the config file
-        config.read(config_path)
+        config.read(ConfigReader.get_config_path())
         return config
-    
-    @staticmethod
-    def get_base_url():
+
+    @classmethod
+    def get_base_url(cls):
         """Get OrangeHRM base URL"""
-        config = ConfigReader.read_config()
-        return config.get('OrangeHRM', 'base_url', fallback='https://opensource-demo.orangehrmlive.com')
-    
-    @staticmethod
-    def get_browser_config():
+        return cls.get_config().get('OrangeHRM', 'base_url')
+
+    @classmethod
+    def get_browser_config(cls):
         """Get the browser configuration"""
-        config = ConfigReader.read_config()
+        config = cls.get_config()
         return {
             'browser': config.get('Browsers', 'browser'),
             'headless': config.getboolean('Browsers', 'headless')
         }
-    
-    @staticmethod
-    def get_wait_times():
+
+    @classmethod
+    def get_wait_times(cls):
         """Get the wait times configuration"""
-        config = ConfigReader.read_config()
+        config = cls.get_config()
         return {
             'implicit_wait': config.getint('Test', 'implicit_wait'),
             'explicit_wait': config.getint('Test', 'explicit_wait')
         }
 
+    @classmethod
+    def get_wait_engine_config(cls):
+        """Get the wait engine polling configuration"""
+        config = cls.get_config()
+        return {
+            'initial_poll': config.getfloat('Waits', 'initial_poll'),
+            'max_poll': config.getfloat('Waits', 'max_poll'),
+            'backoff': config.getfloat('Waits', 'backoff'),
+            'browser_side': config.getboolean('Waits', 'browser_side')
+        }
+
+    @classmethod
+    def get_driver_pool_config(cls):
+        """Get the driver pool configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('DriverPool', 'enabled'),
+            'max_reuse': config.getint('DriverPool', 'max_reuse')
+        }
+
+    @classmethod
+    def get_prelaunch_config(cls):
+        """Get the background browser pre-launch configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('Prelaunch', 'enabled'),
+            'count': config.getint('Prelaunch', 'count'),
+            'spares': config.getint('Prelaunch', 'spares'),
+            'idle_timeout': config.getfloat('Prelaunch', 'idle_timeout')
+        }
+
+    @classmethod
+    def get_browser_contexts_config(cls):
+        """Get the shared-Chrome browser context configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('BrowserContexts', 'enabled'),
+            'max_contexts': config.getint('BrowserContexts', 'max_contexts')
+        }
+
+    @classmethod
+    def get_governor_config(cls):
+        """Get the memory-aware worker count and launch throttling configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('Governor', 'enabled'),
+            'reserve_mb': config.getint('Governor', 'reserve_mb'),
+            'default_browser_mb': config.getint('Governor', 'default_browser_mb'),
+            'default_context_mb': config.getint('Governor', 'default_context_mb'),
+            'launch_slots': config.getint('Governor', 'launch_slots'),
+            'max_wait': config.getfloat('Governor', 'max_wait'),
+            'database': config.get('Governor', 'database'),
+            'smoothing': config.getfloat('Governor', 'smoothing')
+        }
+
+    @classmethod
+    def get_auth_config(cls):
+        """Get the authentication cache configuration"""
+        config = cls.get_config()
+        return {
+            'login_via': config.get('Auth', 'login_via'),
+            'cookie_ttl': config.getint('Auth', 'cookie_ttl'),
+            'validate_interval': config.getint('Auth', 'validate_interval')
+        }
+
+    @classmethod
+    def get_api_config(cls):
+        """Get the API client configuration"""
+        config = cls.get_config()
+        return {
+            'timeout': config.getint('Api', 'timeout'),
+            'max_concurrency': config.getint('Api', 'max_concurrency'),
+            'pool_maxsize': config.getint('Api', 'pool_maxsize'),
+            'max_retries': config.getint('Api', 'max_retries'),
+            'backoff_factor': config.getfloat('Api', 'backoff_factor'),
+            'batch_size': config.getint('Api', 'batch_size')
+        }
+
+    @classmethod
+    def get_user_pool_config(cls):
+        """Get the test user pool configuration"""
+        config = cls.get_config()
+        return {
+            'size': config.getint('UserPool', 'size'),
+            'prefix': config.get('UserPool', 'prefix'),
+            'lease_timeout': config.getint('UserPool', 'lease_timeout')
+        }
+
+    @classmethod
+    def get_sweeper_config(cls):
+        """Get the orphaned test data sweeper configuration"""
+        config = cls.get_config()
+        return {
+            'on_session_start': config.getboolean('Sweeper', 'on_session_start'),
+            'prefix': config.get('Sweeper', 'prefix'),
+            'min_age': config.getint('Sweeper', 'min_age'),
+            'batch_size': config.getint('Sweeper', 'batch_size'),
+            'page_size': config.getint('Sweeper', 'page_size'),
+            'dry_run': config.getboolean('Sweeper', 'dry_run')
+        }
+
+    @classmethod
+    def get_network_config(cls):
+        """Get the CDP network policy configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('Network', 'enabled'),
+            'block': cls._split_list(config.get('Network', 'block')),
+            'block_hosts': cls._split_list(config.get('Network', 'block_hosts')),
+            'event_buffer_size': config.getint('Network', 'event_buffer_size')
+        }
+
+    @classmethod
+    def get_profiler_config(cls):
+        """Get the WebDriver/HTTP command profiler configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('Profiler', 'enabled'),
+            'output_dir': config.get('Profiler', 'output_dir'),
+            'max_records': config.getint('Profiler', 'max_records'),
+            'round_trip_warning': config.getint('Profiler', 'round_trip_warning')
+        }
+
+    @classmethod
+    def get_page_metrics_config(cls):
+        """Get the page load measurement configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('PageMetrics', 'enabled'),
+            'budget_metric': config.get('PageMetrics', 'budget_metric'),
+            'budget_mode': config.get('PageMetrics', 'budget_mode'),
+            'trend_file': config.get('PageMetrics', 'trend_file')
+        }
+
+    @classmethod
+    def get_page_budgets(cls):
+        """Get the load-time budget in seconds per lowercased URL path"""
+        return {path: float(seconds) for path, seconds in cls.get_config().section('PageBudgets').items()}
+
+    @classmethod
+    def get_attachments_config(cls):
+        """Get the Allure attachment pipeline configuration"""
+        config = cls.get_config()
+        return {
+            'policy': config.get('Attachments', 'policy'),
+            'sample_rate': config.getfloat('Attachments', 'sample_rate'),
+            'max_bytes': config.getint('Attachments', 'max_bytes'),
+            'oversize': config.get('Attachments', 'oversize'),
+            'dedupe': config.getboolean('Attachments', 'dedupe'),
+            'max_pending': config.getint('Attachments', 'max_pending')
+        }
+
+    @classmethod
+    def get_cassettes_config(cls):
+        """Get the API record/replay cassette configuration"""
+        config = cls.get_config()
+        return {
+            'mode': config.get('Cassettes', 'mode'),
+            'directory': config.get('Cassettes', 'directory'),
+            'max_age_days': config.getfloat('Cassettes', 'max_age_days')
+        }
+
+    @classmethod
+    def get_verification_config(cls):
+        """Get the API-then-UI verification configuration"""
+        config = cls.get_config()
+        return {
+            'timeout': config.getfloat('Verification', 'timeout'),
+            'initial_delay': config.getfloat('Verification', 'initial_delay'),
+            'max_delay': config.getfloat('Verification', 'max_delay'),
+            'backoff': config.getfloat('Verification', 'backoff'),
+            'ui_timeout': config.getfloat('Verification', 'ui_timeout')
+        }
+
+    @classmethod
+    def get_scheduling_config(cls):
+        """Get the duration-aware xdist scheduling configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('Scheduling', 'enabled'),
+            'database': config.get('Scheduling', 'database'),
+            'smoothing': config.getfloat('Scheduling', 'smoothing')
+        }
+
+    @classmethod
+    def get_failure_artifacts_config(cls):
+        """Get the failure artifact capture configuration"""
+        config = cls.get_config()
+        return {
+            'enabled': config.getboolean('FailureArtifacts', 'enabled'),
+            'artifacts': cls._split_list(config.get('FailureArtifacts', 'artifacts')),
+            'max_bytes': config.getint('FailureArtifacts', 'max_bytes'),
+            'compress_above': config.getint('FailureArtifacts', 'compress_above'),
+            'network_entries': config.getint('FailureArtifacts', 'network_entries')
+        }
+
+    @classmethod
+    def get_load_config(cls):
+        """Get the load generation configuration"""
+        config = cls.get_config()
+        return {
+            'journey': config.get('Load', 'journey'),
+            'users': config.getint('Load', 'users'),
+            'ramp_up': config.getfloat('Load', 'ramp_up'),
+            'think_time': config.getfloat('Load', 'think_time'),
+            'duration': config.getfloat('Load', 'duration'),
+            'prefix': config.get('Load', 'prefix'),
+            'output_dir': config.get('Load', 'output_dir'),
+            'max_error_rate': config.getfloat('Load', 'max_error_rate')
+        }
+
+    @classmethod
+    def get_local_server_config(cls):
+        """Get the configuration of the local OrangeHRM stand-in (base_url = local)"""
+        config = cls.get_config()
+        return {
+            'host': config.get('LocalServer', 'host'),
+            'port': config.getint('LocalServer', 'port')
+        }
+
     @staticmethod
-    def get_orangehrm_config():
+    def _split_list(value):
+        """Split a comma separated option into a list"""
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+    @classmethod
+    def get_orangehrm_config(cls):
         """Get OrangeHRM specific configuration"""
-        config = ConfigReader.read_config()
+        config = cls.get_config()
         return {
             'base_url': config.get('OrangeHRM', 'base_url'),
             'default_password': config.get('OrangeHRM', 'default_password'),
             'admin_username': config.get('OrangeHRM', 'admin_username'),
             'admin_password': config.get('OrangeHRM', 'admin_password')
-        }
\ No newline at end of file
+        }
+
+    @classmethod
+    def _build(cls) -> Settings:
+        """Merge all layers, lowest priority first"""
+        parser = cls.read_config()
+        sections = {section: dict(parser.items(section)) for section in parser.sections()}
+
+        # .env first, then the real environment so it wins over the file
+        for variables in (dotenv_values(cls.get_dotenv_path()), os.environ):
+            for name, value in variables.items():
+                target = cls._option_for_env(name, sections)
+                if target and value is not None:
+                    _set(sections, target[0], target[1], value)
+
+        for section, options in cls._cli_overrides.items():
+            for option, value in options.items():
+                _set(sections, section, option, value)
+
+        return Settings(sections)
+
+    @staticmethod
+    def _option_for_env(name: str, sections: Dict[str, Dict[str, Any]]):
+        """Map an environment variable name to a (section, option) pair, if it names one"""
+        if name in ENV_ALIASES:
+            return ENV_ALIASES[name]
+        if not name.startswith(ENV_PREFIX):
+            return None
+
+        remainder = name[len(ENV_PREFIX):].lower()
+        for section in sections:
+            prefix = f"{section.lower()}_"
+            if remainder.startswith(prefix):
+                return section, remainder[len(prefix):]
+        return None
+
+    @classmethod
+    def _source_mtimes(cls):
+        mtimes = []
+        for path in (cls.get_config_path(), cls.get_dotenv_path()):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+
+def _set(sections: Dict[str, Dict[str, Any]], section: str, option: str, value: Any):
+    sections.setdefault(section, {})[option] = value
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    try:
+        return _BOOLEAN_STATES[str(value).strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value!r}")
@@ -0,0 +1,141 @@
+import argparse
+import re
+import time
+from typing import Any, Dict, List, Optional
+from src.utils.auth_cache import AuthCache
+from src.utils.bulk_api_helper import OrangeHRMBulkApiHelper
+from src.utils.config_reader import ConfigReader
+
+
+class OrphanedUserSweeper:
+    """Deletes test users left behind by interrupted runs.
+
+    Pages through ``/api/v2/admin/users``, keeps users whose name starts with
+    the test prefix and whose creation time (embedded right after the prefix
+    by ``unique_username``) is older than ``min_age`` seconds, then deletes
+    them in batches. Users without a parseable timestamp are never touched.
+    """
+
+    def __init__(self, api_helper: OrangeHRMBulkApiHelper, prefix: str = "autotest",
+                 min_age: int = 3600, batch_size: int = 50, page_size: int = 100,
+                 dry_run: bool = False):
+        self.api_helper = api_helper
+        self.prefix = prefix
+        self.min_age = min_age
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.dry_run = dry_run
+        self._name_pattern = re.compile(rf"^{re.escape(prefix)}_(\d{{10}})(?:_|$)")
+
+    def sweep(self) -> Dict[str, Any]:
+        """Find and delete stale users, returning a summary of what was done"""
+        started = time.monotonic()
+        users = self._list_all_users()
+        listed = time.monotonic()
+
+        stale = []
+        undated = 0
+        now = time.time()
+        for user in users:
+            if not user['userName'].startswith(f"{self.prefix}_"):
+                continue
+            created_at = self._created_at(user['userName'])
+            if created_at is None:
+                undated += 1
+            elif now - created_at >= self.min_age:
+                stale.append(user)
+
+        deleted = 0
+        if stale and not self.dry_run:
+            ids = [user['id'] for user in stale]
+            for i in range(0, len(ids), self.batch_size):
+                batch = ids[i:i + self.batch_size]
+                if self.api_helper.delete_users(batch, batch_size=self.batch_size):
+                    deleted += len(batch)
+
+        finished = time.monotonic()
+        return {
+            'dry_run': self.dry_run,
+            'scanned': len(users),
+            'stale': len(stale),
+            'undated_skipped': undated,
+            'deleted': deleted,
+            'stale_usernames': [user['userName'] for user in stale],
+            'list_seconds': round(listed - started, 3),
+            'delete_seconds': round(finished - listed, 3),
+            'total_seconds': round(finished - started, 3)
+        }
+
+    def _list_all_users(self) -> List[Dict[str, Any]]:
+        """Collect every user before deleting, so deletions do not shift the offsets"""
+        users = []
+        offset = 0
+        while True:
+            response = self.api_helper._request(
+                "GET", self.api_helper.users_url,
+                params={"limit": self.page_size, "offset": offset, "sortField": "u.userName", "sortOrder": "ASC"}
+            )
+            if response.status_code != 200:
+                raise Exception(f"Failed to list users at offset {offset}. Status: {response.status_code}")
+
+            body = response.json()
+            page = body.get('data', [])
+            users.extend(page)
+            offset += len(page)
+
+            total = body.get('meta', {}).get('total', 0)
+            if not page or offset >= total:
+                return users
+
+    def _created_at(self, username: str) -> Optional[int]:
+        match = self._name_pattern.match(username)
+        return int(match.group(1)) if match else None
+
+
+def sweep_orphaned_users(dry_run: Optional[bool] = None, **overrides) -> Dict[str, Any]:
+    """Run the sweeper with settings from the [Sweeper] config section"""
+    sweeper_config = ConfigReader.get_sweeper_config()
+    settings = {
+        'prefix': sweeper_config['prefix'],
+        'min_age': sweeper_config['min_age'],
+        'batch_size': sweeper_config['batch_size'],
+        'page_size': sweeper_config['page_size'],
+        'dry_run': sweeper_config['dry_run'] if dry_run is None else dry_run
+    }
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+
+    api_helper = AuthCache.apply_to_api_helper(OrangeHRMBulkApiHelper(), AuthCache.get_session())
+    try:
+        return OrphanedUserSweeper(api_helper, **settings).sweep()
+    finally:
+        api_helper.close()
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    action = "would delete" if summary['dry_run'] else "deleted"
+    count = summary['stale'] if summary['dry_run'] else summary['deleted']
+    return (f"Orphaned user sweep: scanned {summary['scanned']} users, {action} {count} "
+            f"({summary['undated_skipped']} undated skipped) in {summary['total_seconds']:.2f}s "
+            f"[list {summary['list_seconds']:.2f}s, delete {summary['delete_seconds']:.2f}s]")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Delete stale test users left behind by interrupted runs")
+    parser.add_argument("--prefix", help="Username prefix of test users")
+    parser.add_argument("--min-age", type=int, help="Only delete users older than this many seconds")
+    parser.add_argument("--batch-size", type=int, help="User ids per DELETE request")
+    parser.add_argument("--page-size", type=int, help="Users fetched per list request")
+    parser.add_argument("--dry-run", action="store_true", default=None, help="List stale users without deleting them")
+    args = parser.parse_args(argv)
+
+    summary = sweep_orphaned_users(
+        dry_run=args.dry_run, prefix=args.prefix, min_age=args.min_age,
+        batch_size=args.batch_size, page_size=args.page_size
+    )
+    for username in summary['stale_usernames']:
+        print(f"  {username}")
+    print(format_summary(summary))
+
+
+if __name__ == "__main__":
+    main()
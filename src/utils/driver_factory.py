@@ -1,33 +1,124 @@
-import threading
 import time
-import tempfile
-import random
 import os
-import shutil
+import threading
+from typing import List, Optional
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from src.utils.browser_contexts import BrowserHost
+from src.utils.cdp_driver import CdpDriver
+from src.utils.cdp_events import CdpEventLog
 from src.utils.config_reader import ConfigReader
+from src.utils.profiler import CommandProfiler
+from src.utils.resource_allocator import PortAllocator, ProfileDirAllocator
+from src.utils.resource_governor import ResourceGovernor
+from src.utils.session_stats import SessionStats
+
+
+# Average of the random startup stagger sleeps the allocators replaced:
+# uniform(0.5, 2.0) locally and uniform(0.5, 1.5) in Docker
+REMOVED_STAGGER_SECONDS = {'local': 1.25, 'docker': 1.0}
+
+
+@SessionStats.register_summary
+def _launch_summary(values):
+    launches = values.get('driver.launches', 0)
+    if not launches:
+        return []
+    launch_seconds = values.get('driver.launch_seconds', 0)
+    return [
+        f"Browser launches: {int(launches)}, {launch_seconds:.1f}s total ({launch_seconds / launches:.2f}s avg)",
+        f"Startup stagger sleeps removed: ~{values.get('driver.stagger_seconds_saved', 0):.1f}s saved"
+    ]
+
+
+@SessionStats.register_summary
+def _prelaunch_summary(values):
+    if not values.get('prelaunch.launched'):
+        return []
+    return [f"Browser pre-launch: {int(values.get('prelaunch.taken', 0))} of {int(values['prelaunch.launched'])} "
+            f"taken ready, {values.get('prelaunch.hidden_seconds', 0):.1f}s launch time hidden "
+            f"({values.get('prelaunch.waited_seconds', 0):.1f}s waited), "
+            f"{int(values.get('prelaunch.reaped', 0))} idle spares reaped"]
 
 
 class DriverFactory:
+    _prelauncher = None
+    _governor = None
+    
+    PERFORMANCE_ARGS = [
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-features=TranslateUI",
+        "--disable-ipc-flooding-protection",
+        "--disable-web-security",
+        "--disable-logging",
+        "--memory-pressure-off",
+        "--max_old_space_size=4096"
+    ]
+    
     @staticmethod
     def get_driver(browser_name=None, headless=None):
-        """Set up and return a WebDriver instance"""
-        # Get configuration
+        """Return a WebDriver instance, pre-launched in the background when one is ready"""
         browser_config = ConfigReader.get_browser_config()
-        wait_times = ConfigReader.get_wait_times()
-        
         browser_name = (browser_name or browser_config['browser']).lower()
         headless = headless if headless is not None else browser_config['headless']
         
+        prelauncher = DriverFactory._prelauncher
+        if prelauncher is not None:
+            driver = prelauncher.take(browser_name, headless)
+            if driver is not None:
+                return driver
+        return DriverFactory._launch_driver(browser_name, headless)
+    
+    @staticmethod
+    def start_prelaunch(browser_name=None, headless=None, count=1, spares=1, idle_timeout=120):
+        """Start launching browsers in the background, e.g. while tests are being collected"""
+        if DriverFactory._prelauncher is not None:
+            return DriverFactory._prelauncher
+        browser_config = ConfigReader.get_browser_config()
+        DriverFactory._prelauncher = DriverPrelauncher(
+            (browser_name or browser_config['browser']).lower(),
+            headless if headless is not None else browser_config['headless'],
+            count, spares, idle_timeout
+        )
+        DriverFactory._prelauncher.start()
+        return DriverFactory._prelauncher
+    
+    @staticmethod
+    def stop_prelaunch():
+        """Stop launching and quit every pre-launched browser nobody took"""
+        prelauncher, DriverFactory._prelauncher = DriverFactory._prelauncher, None
+        if prelauncher is not None:
+            prelauncher.shutdown()
+    
+    @staticmethod
+    def _resource_governor():
+        if DriverFactory._governor is None:
+            DriverFactory._governor = ResourceGovernor.from_config()
+        return DriverFactory._governor
+    
+    @staticmethod
+    def _launch_driver(browser_name, headless):
+        """Set up and return a new WebDriver instance"""
+        started = time.monotonic()
+        wait_times = ConfigReader.get_wait_times()
+        
         # Check if running in Docker
         is_docker = os.path.exists('/.dockerenv')
         
-        if browser_name == "chrome":
-            driver = DriverFactory._create_chrome_driver(headless, is_docker)
-        elif browser_name == "firefox":
-            driver = DriverFactory._create_firefox_driver(headless, is_docker)
-        else:
-            raise ValueError(f"Browser '{browser_name}' is not supported")
+        # Take one of the machine-wide launch slots and wait out memory pressure in it
+        governor = DriverFactory._resource_governor()
+        profile = governor.profile_key(browser_name, ConfigReader.get_browser_contexts_config()['enabled'])
+        with governor.launch_slot(profile):
+            if browser_name == "chrome":
+                driver = DriverFactory._create_chrome_driver(headless, is_docker)
+            elif browser_name == "chrome-cdp":
+                driver = DriverFactory._create_cdp_driver(headless, is_docker)
+            elif browser_name == "firefox":
+                driver = DriverFactory._create_firefox_driver(headless, is_docker)
+            else:
+                raise ValueError(f"Browser '{browser_name}' is not supported")
         
         # Set window size and timeouts
         if is_docker or headless:
@@ -36,8 +127,48 @@ class DriverFactory:
             driver.maximize_window()
             
         driver.implicitly_wait(wait_times['implicit_wait'])
+        
+        # Time every command the tests send through this driver
+        if ConfigReader.get_profiler_config()['enabled']:
+            CommandProfiler.instrument_driver(driver)
+        
+        SessionStats.add('driver.launches')
+        SessionStats.add('driver.launch_seconds', time.monotonic() - started)
+        if browser_name == "chrome":
+            SessionStats.add('driver.stagger_seconds_saved', REMOVED_STAGGER_SECONDS['docker' if is_docker else 'local'])
         return driver
     
+    @staticmethod
+    def quit_driver(driver):
+        """Quit a WebDriver, ignoring errors from an already dead session, and free its port and profile"""
+        # Measure the browser while it still runs, for the next run's worker count
+        browser_host = getattr(driver, 'browser_host', None)
+        try:
+            if browser_host is not None:
+                DriverFactory._resource_governor().record_context(browser_host.pid, browser_host.baseline_mb,
+                                                                  browser_host.open_contexts())
+            else:
+                browser_name = (getattr(driver, 'capabilities', None) or {}).get('browserName', 'unknown')
+                DriverFactory._resource_governor().record_browser(driver, browser_name)
+        except Exception as e:
+            print(f"⚠️ Could not measure browser memory: {e}")
+        
+        if browser_host is not None:
+            browser_host.close_context(driver)
+            return
+        
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"⚠️ Error while quitting driver: {e}")
+        
+        debug_port = getattr(driver, 'debug_port', None)
+        if debug_port:
+            PortAllocator.release(debug_port)
+        profile_dir = getattr(driver, 'profile_dir', None)
+        if profile_dir:
+            ProfileDirAllocator.release(profile_dir)
+    
     @staticmethod
     def _create_chrome_driver(headless, is_docker):
         """Create Chrome WebDriver with appropriate options"""
@@ -57,13 +188,114 @@ class DriverFactory:
         # Performance optimizations
         DriverFactory._add_performance_options(options)
         
+        # Expose DevTools events (network policy counters) through get_log('performance'),
+        # and console messages for failure artifacts through get_log('browser')
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"})
+        
         # Handle parallel execution
+        debug_port = PortAllocator.reserve()
+        profile_dir = None
         if is_docker:
-            DriverFactory._configure_docker_chrome(options)
+            DriverFactory._configure_docker_chrome(options, debug_port)
         else:
-            DriverFactory._configure_local_chrome(options)
+            profile_dir = ProfileDirAllocator.acquire()
+            DriverFactory._configure_local_chrome(options, debug_port, profile_dir)
+        
+        try:
+            driver = webdriver.Chrome(options=options)
+        except Exception:
+            PortAllocator.release(debug_port)
+            if profile_dir:
+                ProfileDirAllocator.release(profile_dir)
+            raise
+        
+        # Remember the allocated resources so quit_driver can release them
+        driver.debug_port = debug_port
+        driver.profile_dir = profile_dir
+        CdpEventLog.for_driver(driver, ConfigReader.get_network_config()['event_buffer_size'])
+        return driver
+    
+    @staticmethod
+    def _create_cdp_driver(headless, is_docker):
+        """Drive Chrome over a DevTools WebSocket: a context in the shared Chrome when enabled, else a Chrome of its own"""
+        contexts_config = ConfigReader.get_browser_contexts_config()
+        if contexts_config['enabled']:
+            host = BrowserHost.shared() or DriverFactory.start_browser_host(headless)
+            driver = host.new_context(contexts_config['max_contexts'])
+            if driver is not None:
+                CdpEventLog.for_driver(driver, ConfigReader.get_network_config()['event_buffer_size'])
+                return driver
+            SessionStats.add('contexts.overflow')
+        
+        debug_port = PortAllocator.reserve()
+        profile_dir = ProfileDirAllocator.acquire()
+        try:
+            driver = CdpDriver.launch(DriverFactory._cdp_arguments(headless or is_docker, profile_dir), debug_port,
+                                      binary=os.environ.get('CHROME_BINARY'))
+        except Exception:
+            PortAllocator.release(debug_port)
+            ProfileDirAllocator.release(profile_dir)
+            raise
         
-        return webdriver.Chrome(options=options)
+        driver.debug_port = debug_port
+        driver.profile_dir = profile_dir
+        CdpEventLog.for_driver(driver, ConfigReader.get_network_config()['event_buffer_size'])
+        print(f"chrome-cdp: Using debug port {debug_port}, {driver.capabilities['browserVersion']}")
+        return driver
+    
+    @staticmethod
+    def start_browser_host(headless=None):
+        """Launch the Chrome that browser contexts share, or return the one already running"""
+        if BrowserHost.shared() is not None:
+            return BrowserHost.shared()
+        if headless is None:
+            headless = ConfigReader.get_browser_config()['headless']
+        
+        debug_port = PortAllocator.reserve()
+        profile_dir = ProfileDirAllocator.acquire()
+        try:
+            host = BrowserHost.launch(DriverFactory._cdp_arguments(headless or os.path.exists('/.dockerenv'), profile_dir),
+                                      debug_port, binary=os.environ.get('CHROME_BINARY'))
+        except Exception:
+            PortAllocator.release(debug_port)
+            ProfileDirAllocator.release(profile_dir)
+            raise
+        
+        host.profile_dir = profile_dir
+        host.baseline_mb = DriverFactory._resource_governor().record_host(host.pid)
+        BrowserHost.set_shared(host)
+        print(f"chrome-cdp: Shared Chrome for browser contexts on debug port {debug_port}")
+        return host
+    
+    @staticmethod
+    def stop_browser_host():
+        """Disconnect from the shared Chrome, quitting it if this process launched it"""
+        host = BrowserHost.shared()
+        BrowserHost.set_shared(None)
+        if host is None:
+            return
+        host.shutdown()
+        if host.debug_port:
+            PortAllocator.release(host.debug_port)
+        if host.profile_dir:
+            ProfileDirAllocator.release(host.profile_dir)
+    
+    @staticmethod
+    def _cdp_arguments(headless, profile_dir):
+        """Chrome command line of the chrome-cdp backend"""
+        arguments = [
+            "--window-size=1920,1080",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--disable-extensions",
+            "--no-first-run",
+            "--no-default-browser-check",
+            f"--user-data-dir={profile_dir}"
+        ] + DriverFactory.PERFORMANCE_ARGS
+        if headless:
+            arguments.append("--headless")
+        return arguments
     
     @staticmethod
     def _create_firefox_driver(headless, is_docker):
@@ -78,80 +310,158 @@ class DriverFactory:
     @staticmethod
     def _add_performance_options(options):
         """Add performance optimization arguments to Chrome"""
-        performance_args = [
-            "--disable-background-timer-throttling",
-            "--disable-renderer-backgrounding",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-features=TranslateUI",
-            "--disable-ipc-flooding-protection",
-            "--disable-web-security",
-            "--disable-logging",
-            "--memory-pressure-off",
-            "--max_old_space_size=4096"
-        ]
-        
-        for arg in performance_args:
+        for arg in DriverFactory.PERFORMANCE_ARGS:
             options.add_argument(arg)
     
     @staticmethod
-    def _configure_docker_chrome(options):
+    def _configure_docker_chrome(options, debug_port):
         """Configure Chrome for Docker environment"""
-        # Generate unique debugging port
-        unique_port = DriverFactory._generate_unique_port()
-        options.add_argument(f"--remote-debugging-port={unique_port}")
+        options.add_argument(f"--remote-debugging-port={debug_port}")
         
-        # Add Docker-specific optimizations
+        # Add Docker-specific optimizations. Images are blocked per test by NetworkPolicy.
         docker_args = [
             "--disable-plugins",
-            "--disable-images",
             "--disable-features=VizDisplayCompositor"
         ]
         
         for arg in docker_args:
             options.add_argument(arg)
         
-        # Stagger startup to avoid conflicts
-        time.sleep(random.uniform(0.5, 1.5))
-        print(f"Docker mode: Using debug port {unique_port}")
+        print(f"Docker mode: Using debug port {debug_port}")
     
     @staticmethod
-    def _configure_local_chrome(options):
+    def _configure_local_chrome(options, debug_port, profile_dir):
         """Configure Chrome for local environment"""
-        # Generate unique identifiers
-        unique_port = DriverFactory._generate_unique_port()
-        unique_id = DriverFactory._generate_unique_id()
-        
-        options.add_argument(f"--remote-debugging-port={unique_port}")
-        
-        # Create unique user data directory
-        user_data_dir = os.path.join(tempfile.gettempdir(), f"chrome_user_data_{unique_id}")
-        
-        # Clean up existing directory
-        if os.path.exists(user_data_dir):
-            shutil.rmtree(user_data_dir, ignore_errors=True)
-        
-        os.makedirs(user_data_dir, exist_ok=True)
-        options.add_argument(f"--user-data-dir={user_data_dir}")
+        options.add_argument(f"--remote-debugging-port={debug_port}")
+        options.add_argument(f"--user-data-dir={profile_dir}")
         
-        # Stagger startup
-        time.sleep(random.uniform(0.5, 2.0))
-        
-        print(f"Local mode: Using user data dir: {user_data_dir}")
-        print(f"Local mode: Using debug port: {unique_port}")
-    
-    @staticmethod
-    def _generate_unique_port():
-        """Generate a unique debugging port"""
-        thread_id = threading.current_thread().ident
-        timestamp = int(time.time() * 1000000)
-        return 9222 + (hash(f"{thread_id}_{timestamp}") % 10000)
-    
+        print(f"Local mode: Using user data dir: {profile_dir}")
+        print(f"Local mode: Using debug port: {debug_port}")
+
+
+class PrelaunchedDriver:
+    """A browser launched ahead of time, with how long the launch took"""
+
+    def __init__(self, driver, launch_seconds: float):
+        self.driver = driver
+        self.launch_seconds = launch_seconds
+        self.ready_since = time.monotonic()
+
+
+class DriverPrelauncher:
+    """Launches browsers on a background thread before tests ask for them.
+
+    ``count`` browsers are launched as soon as the worker starts, overlapping
+    with collection. Whenever one is taken, another is launched until
+    ``spares`` are ready or launching again, so a replacement for a crashed
+    or recycled driver is usually waiting already. Spares idle for longer
+    than ``idle_timeout`` seconds are quit, e.g. once only API tests remain.
+    """
+
+    def __init__(self, browser_name: str, headless: bool, count: int = 1, spares: int = 1,
+                 idle_timeout: float = 120):
+        self.browser_name = browser_name
+        self.headless = headless
+        self.spares = spares
+        self.idle_timeout = idle_timeout
+        self._ready: List[PrelaunchedDriver] = []
+        self._wanted = count
+        self._launching = False
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="driver-prelaunch", daemon=True)
+        self._thread.start()
+
+    def take(self, browser_name: str, headless: bool):
+        """A ready browser for this configuration, or None if none is ready or launching"""
+        if (browser_name, headless) != (self.browser_name, self.headless):
+            return None
+
+        waiting_since = time.monotonic()
+        with self._condition:
+            while True:
+                # A launch already under way or queued finishes sooner than a new one
+                while not self._ready and (self._launching or self._wanted) and not self._stopped:
+                    self._condition.wait()
+                if not self._ready:
+                    return None
+
+                prelaunched = self._ready.pop(0)
+                if self._is_alive(prelaunched.driver):
+                    break
+                print("⚠️ Pre-launched driver died while idle, discarding it")
+                DriverFactory.quit_driver(prelaunched.driver)
+
+            if len(self._ready) + self._wanted + int(self._launching) < self.spares:
+                self._wanted += 1
+                self._condition.notify_all()
+
+        waited = time.monotonic() - waiting_since
+        SessionStats.add('prelaunch.taken')
+        SessionStats.add('prelaunch.waited_seconds', waited)
+        SessionStats.add('prelaunch.hidden_seconds', max(prelaunched.launch_seconds - waited, 0))
+        return prelaunched.driver
+
+    def shutdown(self):
+        with self._condition:
+            self._stopped = True
+            ready, self._ready = self._ready, []
+            self._condition.notify_all()
+        for prelaunched in ready:
+            DriverFactory.quit_driver(prelaunched.driver)
+        if self._thread is not None:
+            self._thread.join(timeout=60)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._stopped and self._wanted == 0:
+                    self._condition.wait(timeout=min(self.idle_timeout, 10))
+                idle = self._take_idle_spares()
+                if self._stopped:
+                    return
+                launch = self._wanted > 0
+                if launch:
+                    self._wanted -= 1
+                    self._launching = True
+
+            for prelaunched in idle:
+                DriverFactory.quit_driver(prelaunched.driver)
+                SessionStats.add('prelaunch.reaped')
+            if not launch:
+                continue
+
+            started = time.monotonic()
+            try:
+                driver = DriverFactory._launch_driver(self.browser_name, self.headless)
+                SessionStats.add('prelaunch.launched')
+            except Exception as e:
+                print(f"⚠️ Background browser launch failed: {e}")
+                driver = None
+
+            with self._condition:
+                self._launching = False
+                stopped = self._stopped
+                if driver is not None and not stopped:
+                    self._ready.append(PrelaunchedDriver(driver, time.monotonic() - started))
+                self._condition.notify_all()
+            if driver is not None and stopped:
+                DriverFactory.quit_driver(driver)
+
+    def _take_idle_spares(self) -> List[PrelaunchedDriver]:
+        """Remove the spares nobody took for ``idle_timeout``; called with the condition held"""
+        now = time.monotonic()
+        idle = [p for p in self._ready if now - p.ready_since > self.idle_timeout]
+        self._ready = [p for p in self._ready if p not in idle]
+        return idle
+
     @staticmethod
-    def _generate_unique_id():
-        """Generate a unique identifier for Chrome instances"""
-        thread_id = threading.current_thread().ident
-        timestamp = int(time.time() * 1000000)
-        random_suffix = random.randint(10000, 99999)
-        process_id = os.getpid()
-        
-        return f"{process_id}_{thread_id}_{timestamp}_{random_suffix}"
\ No newline at end of file
+    def _is_alive(driver) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
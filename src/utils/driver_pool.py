@@ -0,0 +1,141 @@
+import threading
+from typing import Dict, List, Optional
+from selenium.common.exceptions import WebDriverException
+from src.utils.driver_factory import DriverFactory
+from src.utils.locators import ElementCache
+from src.utils.session_stats import SessionStats
+
+
+@SessionStats.register_summary
+def _pool_summary(values):
+    if not values.get('pool.acquired'):
+        return []
+    return [f"Driver pool: {int(values['pool.acquired'])} acquired, "
+            f"{int(values.get('pool.reused', 0))} reused, {int(values.get('pool.recycled', 0))} recycled"]
+
+
+class PooledDriver:
+    """A WebDriver owned by the pool together with its reuse bookkeeping"""
+
+    def __init__(self, driver, browser_name: str):
+        self.driver = driver
+        self.browser_name = browser_name
+        self.uses = 0
+
+
+class DriverPool:
+    """Per-worker pool of warm WebDrivers that are reset between tests.
+
+    Every xdist worker is a separate process, so a process-wide pool is a
+    per-worker pool. Drivers are handed out by ``acquire`` and returned with
+    ``release``, which wipes cookies, storage and extra windows so the next
+    test starts from a blank browser without paying for a new launch.
+    """
+
+    def __init__(self, max_reuse: int = 25):
+        self.max_reuse = max_reuse
+        self._idle: List[PooledDriver] = []
+        self._leased: Dict[int, PooledDriver] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, browser_name: str):
+        """Return a healthy driver for the requested browser"""
+        while True:
+            pooled = self._take_idle(browser_name)
+            if pooled is None:
+                pooled = PooledDriver(DriverFactory.get_driver(browser_name), browser_name)
+            elif not self._is_healthy(pooled.driver):
+                print("⚠️ Pooled driver failed health check, recycling it")
+                self._discard(pooled)
+                continue
+            else:
+                SessionStats.add('pool.reused')
+
+            SessionStats.add('pool.acquired')
+            pooled.uses += 1
+            with self._lock:
+                self._leased[id(pooled.driver)] = pooled
+            return pooled.driver
+
+    def release(self, driver, discard: bool = False):
+        """Return a driver to the pool, resetting its state for the next test"""
+        with self._lock:
+            pooled = self._leased.pop(id(driver), None)
+
+        if pooled is None:
+            DriverFactory.quit_driver(driver)
+            return
+
+        if discard or pooled.uses >= self.max_reuse or not self._reset(driver):
+            self._discard(pooled)
+            return
+
+        with self._lock:
+            self._idle.append(pooled)
+
+    def shutdown(self):
+        """Quit every driver owned by the pool"""
+        with self._lock:
+            pooled_drivers = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+
+        for pooled in pooled_drivers:
+            DriverFactory.quit_driver(pooled.driver)
+
+    def _take_idle(self, browser_name: str) -> Optional[PooledDriver]:
+        with self._lock:
+            for index, pooled in enumerate(self._idle):
+                if pooled.browser_name == browser_name:
+                    return self._idle.pop(index)
+        return None
+
+    def _discard(self, pooled: PooledDriver):
+        SessionStats.add('pool.recycled')
+        DriverFactory.quit_driver(pooled.driver)
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        """Cheap liveness probe: a crashed session fails any command"""
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(driver) -> bool:
+        """Bring the browser back to a blank state. Returns False if the reset failed"""
+        try:
+            DriverPool._dismiss_alert(driver)
+
+            # Close every window but the first one
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per origin, so clear it before leaving the current page
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+
+            if hasattr(driver, "execute_cdp_cmd"):
+                # Clears cookies for every domain, not only the current one
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.delete_all_cookies()
+
+            driver.get("about:blank")
+            ElementCache.for_driver(driver).clear()
+            return True
+        except WebDriverException as e:
+            print(f"⚠️ Failed to reset pooled driver: {e.msg}")
+            return False
+
+    @staticmethod
+    def _dismiss_alert(driver):
+        try:
+            driver.switch_to.alert.dismiss()
+        except WebDriverException:
+            pass
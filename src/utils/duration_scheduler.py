@@ -0,0 +1,150 @@
+import os
+import sqlite3
+import statistics
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from xdist.scheduler import WorkStealingScheduling
+from src.utils.session_stats import SessionStats
+
+
+@SessionStats.register_summary
+def _scheduling_summary(values):
+    if 'scheduling.predicted_seconds.max' not in values:
+        return []
+    return [f"Duration-aware scheduling: {int(values.get('scheduling.known_tests', 0))} tests longest-first, "
+            f"{int(values.get('scheduling.unknown_tests', 0))} unknown left to work stealing; "
+            f"makespan predicted {values['scheduling.predicted_seconds.max']:.1f}s, "
+            f"actual {values.get('scheduling.actual_seconds.max', 0):.1f}s"]
+
+
+class TimingDatabase:
+    """Per-test durations, setup and teardown included, in a local SQLite file.
+
+    Each run is folded into an exponentially weighted moving average, so a
+    single slow run only moves the estimate by ``smoothing``.
+    """
+
+    def __init__(self, path: str, smoothing: float = 0.3):
+        self.path = path
+        self.smoothing = smoothing
+
+    def load(self) -> Dict[str, float]:
+        if not os.path.exists(self.path):
+            return {}
+        with self._connect() as connection:
+            return dict(connection.execute("SELECT nodeid, seconds FROM durations"))
+
+    def update(self, durations: Dict[str, float]):
+        """Fold one run's durations into the stored averages"""
+        if not durations:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._connect() as connection:
+            connection.executemany(
+                """
+                INSERT INTO durations (nodeid, seconds, runs, updated) VALUES (?, ?, 1, ?)
+                ON CONFLICT(nodeid) DO UPDATE SET
+                    seconds = seconds + ? * (excluded.seconds - seconds),
+                    runs = runs + 1,
+                    updated = excluded.updated
+                """,
+                [(nodeid, seconds, now, self.smoothing) for nodeid, seconds in durations.items()]
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS durations ("
+            "nodeid TEXT PRIMARY KEY, seconds REAL NOT NULL, runs INTEGER NOT NULL, updated TEXT)"
+        )
+        return connection
+
+
+class DurationRecorder:
+    """Sums the setup, call and teardown durations of every test report it sees"""
+
+    _durations: Dict[str, float] = {}
+
+    @classmethod
+    def add(cls, report):
+        cls._durations[report.nodeid] = cls._durations.get(report.nodeid, 0.0) + (report.duration or 0.0)
+
+    @classmethod
+    def save(cls, database: TimingDatabase):
+        durations, cls._durations = cls._durations, {}
+        database.update(durations)
+
+
+def lpt_partition(durations: Dict[int, float], bins: int) -> Tuple[List[List[int]], List[float]]:
+    """Longest-processing-time-first assignment: each test goes to the least loaded bin.
+
+    Returns the test indices per bin, longest first, and each bin's total.
+    """
+    assignment: List[List[int]] = [[] for _ in range(bins)]
+    loads = [0.0] * bins
+    for index in sorted(durations, key=lambda i: durations[i], reverse=True):
+        target = loads.index(min(loads))
+        assignment[target].append(index)
+        loads[target] += durations[index]
+    return assignment, loads
+
+
+class DurationScheduling(WorkStealingScheduling):
+    """xdist work stealing that starts from a longest-first plan.
+
+    Tests with a known duration are split across the workers with LPT, so the
+    slow end-to-end tests start first instead of landing last on one worker.
+    Tests without history stay in the shared pending list and are handed out
+    by the normal work-stealing rules once workers run low, and stealing
+    still corrects for estimates that turn out wrong. Stealing takes from the
+    tail of a queue, which in this plan holds the shortest tests.
+    """
+
+    def __init__(self, config, log=None, durations: Optional[Dict[str, float]] = None):
+        super().__init__(config, log)
+        self.durations = durations or {}
+        self.started: Optional[float] = None
+
+    def schedule(self):
+        if self.collection is not None or not self.collection_is_completed:
+            super().schedule()
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+        self.started = time.monotonic()
+
+        nodes = [node for node in self.nodes if not node.shutting_down]
+        known = {index: self.durations[nodeid] for index, nodeid in enumerate(self.collection)
+                 if nodeid in self.durations}
+        unknown = [index for index in range(len(self.collection)) if index not in known]
+        assignment, loads = lpt_partition(known, len(nodes))
+
+        # Unknown tests are predicted at the median known duration, placed the same way
+        estimate = statistics.median(known.values()) if known else 0.0
+        predicted = list(loads)
+        for _ in unknown:
+            predicted[predicted.index(min(predicted))] += estimate
+        SessionStats.set_max('scheduling.predicted_seconds.max', max(predicted))
+        SessionStats.add('scheduling.known_tests', len(known))
+        SessionStats.add('scheduling.unknown_tests', len(unknown))
+
+        for node, indices in zip(nodes, assignment):
+            if indices:
+                self.node2pending[node].extend(indices)
+                node.send_runtest_some(indices)
+        self.pending[:] = unknown
+        self.check_schedule()
+
+    def mark_test_complete(self, node, item_index, duration=None):
+        super().mark_test_complete(node, item_index, duration)
+        if self.started is not None:
+            SessionStats.set_max('scheduling.actual_seconds.max', time.monotonic() - self.started)
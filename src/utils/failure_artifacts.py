@@ -0,0 +1,218 @@
+import base64
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from allure_commons.types import AttachmentType
+from selenium.common.exceptions import WebDriverException
+from src.utils.attachments import AttachmentPipeline
+from src.utils.cdp_events import CdpEventLog
+from src.utils.config_reader import ConfigReader
+from src.utils.session_stats import SessionStats
+
+
+ARTIFACTS = ('screenshot', 'page_source', 'console', 'network', 'cookies')
+
+# Header and cookie values that would leak the session into the report
+SENSITIVE_HEADERS = ('cookie', 'set-cookie', 'authorization')
+
+# JPEG (quality, scale) re-encodes tried in order when the PNG screenshot is over max_bytes
+SCREENSHOT_FALLBACKS = ((80, 1.0), (60, 0.5), (40, 0.25))
+
+
+@SessionStats.register_summary
+def _failure_artifacts_summary(values):
+    if not values.get('failure_artifacts.captures'):
+        return []
+    return [f"Failure captures: {int(values['failure_artifacts.captures'])}, "
+            f"{values.get('failure_artifacts.seconds', 0):.1f}s collecting, "
+            f"{int(values.get('failure_artifacts.errors', 0))} artifacts unavailable, "
+            f"{int(values.get('failure_artifacts.screenshots_reduced', 0))} screenshots shrunk to JPEG"]
+
+
+class FailureArtifacts:
+    """Collects what a failed UI test left behind in the browser.
+
+    Only the WebDriver reads happen on the test thread, so the driver can go
+    back to the pool right after ``capture``; compression and the file writes
+    are done by the AttachmentPipeline writer thread. Every artifact is capped
+    at ``max_bytes`` and text artifacts over ``compress_above`` are gzipped.
+    A screenshot over the cap is retaken by Chrome as a JPEG, downscaled
+    until it fits.
+    The network log is rebuilt from the driver's CdpEventLog ring buffer,
+    which holds the most recent DevTools events only.
+    """
+
+    def __init__(self, artifacts: Iterable[str] = ARTIFACTS, max_bytes: int = 1048576,
+                 compress_above: int = 32768, network_entries: int = 100):
+        unknown = set(artifacts) - set(ARTIFACTS)
+        if unknown:
+            raise ValueError(f"Unknown failure artifacts {sorted(unknown)}, choose from {ARTIFACTS}")
+        self.artifacts = list(artifacts)
+        self.max_bytes = max_bytes
+        self.compress_above = compress_above
+        self.network_entries = network_entries
+
+    @classmethod
+    def from_config(cls) -> "FailureArtifacts":
+        config = ConfigReader.get_failure_artifacts_config()
+        return cls(config['artifacts'], config['max_bytes'], config['compress_above'], config['network_entries'])
+
+    def capture(self, driver, test_name: str) -> Dict[str, str]:
+        """Attach every configured artifact; returns the reason for each one that could not be collected"""
+        started = time.perf_counter()
+        errors = {}
+        for artifact in self.artifacts:
+            try:
+                getattr(self, f"_capture_{artifact}")(driver, test_name)
+            except (WebDriverException, AttributeError, ValueError, KeyError) as e:
+                errors[artifact] = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+
+        if errors:
+            AttachmentPipeline.attach(json.dumps(errors, indent=2), "failure-artifacts-unavailable",
+                                      AttachmentType.JSON, policy='always')
+            print(f"⚠️ Some failure artifacts could not be collected: {', '.join(errors)}")
+
+        SessionStats.add('failure_artifacts.captures')
+        SessionStats.add('failure_artifacts.errors', len(errors))
+        SessionStats.add('failure_artifacts.seconds', time.perf_counter() - started)
+        return errors
+
+    def _capture_screenshot(self, driver, test_name: str):
+        png = driver.get_screenshot_as_png()
+        if len(png) <= self.max_bytes:
+            # PNG is already compressed, so it is capped but never gzipped
+            AttachmentPipeline.attach(png, f"failure_{test_name}", AttachmentType.PNG,
+                                      policy='always', max_bytes=self.max_bytes)
+            return
+        jpeg = self._reduced_screenshot(driver, len(png))
+        AttachmentPipeline.attach(jpeg, f"failure_{test_name}", AttachmentType.JPG,
+                                  policy='always', max_bytes=self.max_bytes)
+
+    def _reduced_screenshot(self, driver, png_size: int) -> bytes:
+        """The viewport as a JPEG small enough for max_bytes, taken again over DevTools"""
+        too_big = f"screenshot is {png_size} bytes, over the {self.max_bytes} byte limit"
+        if not hasattr(driver, "execute_cdp_cmd"):
+            raise ValueError(f"{too_big}, and only Chrome can retake it smaller")
+        viewport = driver.execute_cdp_cmd('Page.getLayoutMetrics', {})['cssVisualViewport']
+        for quality, scale in SCREENSHOT_FALLBACKS:
+            params = {'format': 'jpeg', 'quality': quality}
+            if scale < 1:
+                params['clip'] = {'x': viewport['pageX'], 'y': viewport['pageY'], 'width': viewport['clientWidth'],
+                                  'height': viewport['clientHeight'], 'scale': scale}
+            jpeg = base64.b64decode(driver.execute_cdp_cmd('Page.captureScreenshot', params)['data'])
+            if len(jpeg) <= self.max_bytes:
+                SessionStats.add('failure_artifacts.screenshots_reduced')
+                return jpeg
+        raise ValueError(f"{too_big}, even as a quarter-size JPEG")
+
+    def _capture_page_source(self, driver, test_name: str):
+        self._attach_text(driver.page_source, "page-source", AttachmentType.HTML)
+
+    def _capture_console(self, driver, test_name: str):
+        entries = driver.get_log("browser")
+        lines = [
+            f"{_format_timestamp(entry.get('timestamp'))} {entry.get('level', '')} {entry.get('message', '')}"
+            for entry in entries
+        ]
+        self._attach_text("\n".join(lines) or "(no console messages)", "browser-console", AttachmentType.TEXT)
+
+    def _capture_network(self, driver, test_name: str):
+        if not CdpEventLog.is_supported(driver):
+            raise ValueError("network log needs a Chrome session")
+        event_log = CdpEventLog.for_driver(driver)
+        event_log.drain()
+        har = build_har(list(event_log.recent), self.network_entries)
+        self._attach_text(json.dumps(har, indent=2), "network-log.har", AttachmentType.JSON)
+
+    def _capture_cookies(self, driver, test_name: str):
+        state = {
+            'url': driver.current_url,
+            'title': driver.title,
+            'cookies': [dict(cookie, value=_mask(cookie.get('value', ''))) for cookie in driver.get_cookies()]
+        }
+        self._attach_text(json.dumps(state, indent=2), "page-state", AttachmentType.JSON)
+
+    def _attach_text(self, text: str, name: str, attachment_type: AttachmentType):
+        payload = text.encode('utf-8')
+        if len(payload) > self.max_bytes:
+            omitted = len(payload) - self.max_bytes
+            payload = payload[:self.max_bytes] + f"\n... [truncated {omitted} bytes]".encode()
+        AttachmentPipeline.attach(payload, name, attachment_type, policy='always',
+                                  max_bytes=self.compress_above, oversize='gzip')
+
+
+def build_har(events: List[Dict[str, Any]], max_entries: int = 100) -> Dict[str, Any]:
+    """HAR 1.2 style log of the last ``max_entries`` requests found in DevTools Network events"""
+    entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    started: Dict[str, float] = {}
+
+    for event in events:
+        method = event.get('method', '')
+        params = event.get('params', {})
+        request_id = params.get('requestId')
+
+        if method == 'Network.requestWillBeSent':
+            request = params.get('request', {})
+            # A redirect reuses the request id; keep the final hop
+            entries.pop(request_id, None)
+            started[request_id] = params.get('timestamp', 0)
+            entries[request_id] = {
+                'startedDateTime': _format_timestamp(params.get('wallTime', 0) * 1000),
+                'time': None,
+                'request': {
+                    'method': request.get('method'),
+                    'url': request.get('url'),
+                    'headers': _har_headers(request.get('headers'))
+                },
+                'response': {'status': 0, 'statusText': '', 'headers': [], 'content': {'mimeType': ''}},
+                '_resourceType': params.get('type')
+            }
+        elif request_id not in entries:
+            continue
+        elif method == 'Network.responseReceived':
+            response = params.get('response', {})
+            entries[request_id]['response'] = {
+                'status': response.get('status'),
+                'statusText': response.get('statusText', ''),
+                'headers': _har_headers(response.get('headers')),
+                'content': {'mimeType': response.get('mimeType', '')}
+            }
+        elif method == 'Network.loadingFinished':
+            entries[request_id]['time'] = _elapsed_ms(started[request_id], params.get('timestamp'))
+            entries[request_id]['response']['bodySize'] = params.get('encodedDataLength')
+        elif method == 'Network.loadingFailed':
+            entries[request_id]['time'] = _elapsed_ms(started[request_id], params.get('timestamp'))
+            entries[request_id]['_error'] = params.get('errorText')
+            if params.get('blockedReason'):
+                entries[request_id]['_blockedReason'] = params['blockedReason']
+
+    return {
+        'log': {
+            'version': '1.2',
+            'creator': {'name': 'orangehrm-tests', 'version': '1.0'},
+            'entries': list(entries.values())[-max_entries:]
+        }
+    }
+
+
+def _har_headers(headers: Optional[Dict[str, Any]]) -> List[Dict[str, str]]:
+    return [
+        {'name': name, 'value': _mask(str(value)) if name.lower() in SENSITIVE_HEADERS else str(value)}
+        for name, value in (headers or {}).items()
+    ]
+
+
+def _mask(value: str) -> str:
+    return f"{value[:4]}…" if len(value) > 4 else "…"
+
+
+def _elapsed_ms(start: float, end: Optional[float]) -> Optional[float]:
+    return round((end - start) * 1000, 1) if end is not None else None
+
+
+def _format_timestamp(milliseconds: Optional[float]) -> str:
+    if not milliseconds:
+        return ''
+    return datetime.fromtimestamp(milliseconds / 1000, tz=timezone.utc).isoformat(timespec='milliseconds')
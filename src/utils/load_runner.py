@@ -0,0 +1,311 @@
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+import allure
+import requests
+from src.utils.api_helper import OrangeHRMApiHelper
+from src.utils.attachments import AttachmentPipeline
+from src.utils.auth_cache import AuthCache
+from src.utils.config_reader import ConfigReader
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in the style of HdrHistogram.
+
+    Latencies are stored as integer microseconds. Each power-of-two range is
+    split into ``2 ** sub_bucket_bits`` linear buckets, so any percentile is
+    exact to within ``1 / 2 ** sub_bucket_bits`` (under 1% by default) while
+    memory stays bounded no matter how many values are recorded.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, seconds: float):
+        value = max(int(seconds * 1_000_000), 0)
+        bucket = self._bucket_floor(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total_us += value
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+        self.max_us = max(self.max_us, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percent: float) -> float:
+        """Latency in seconds below which ``percent`` of the recorded values fall"""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= target:
+                # Highest value equivalent to this bucket, never above the true max
+                return min(bucket + self._bucket_width(bucket) - 1, self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'min': round((self.min_us or 0) / 1_000_000, 4),
+            'mean': round(self.total_us / self.count / 1_000_000, 4) if self.count else 0.0,
+            'p50': round(self.percentile(50), 4),
+            'p90': round(self.percentile(90), 4),
+            'p99': round(self.percentile(99), 4),
+            'max': round(self.max_us / 1_000_000, 4)
+        }
+
+    def _bucket_floor(self, value: int) -> int:
+        shift = max(value.bit_length() - 1 - self.sub_bucket_bits, 0)
+        return (value >> shift) << shift
+
+    def _bucket_width(self, bucket: int) -> int:
+        return 1 << max(bucket.bit_length() - 1 - self.sub_bucket_bits, 0)
+
+
+class LoadStats:
+    """Thread-safe latency histograms and error counts per endpoint and journey"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, int] = {}
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+    def record(self, name: str, seconds: float, ok: bool):
+        with self._lock:
+            self.endpoints.setdefault(name, LatencyHistogram()).record(seconds)
+            if not ok:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    def report(self) -> Dict[str, Any]:
+        elapsed = (self.finished or time.monotonic()) - self.started
+        with self._lock:
+            rows = []
+            for name in sorted(self.endpoints):
+                summary = self.endpoints[name].summary()
+                errors = self.errors.get(name, 0)
+                rows.append(dict(
+                    name=name,
+                    errors=errors,
+                    error_rate=round(errors / summary['count'], 4) if summary['count'] else 0.0,
+                    throughput=round(summary['count'] / elapsed, 2) if elapsed else 0.0,
+                    **summary
+                ))
+        return {'elapsed_seconds': round(elapsed, 2), 'endpoints': rows}
+
+
+class LoadApiHelper(OrangeHRMApiHelper):
+    """API helper that records every request into LoadStats instead of the Allure report"""
+
+    attach_to_report = False
+
+    def __init__(self, stats: LoadStats, base_url: Optional[str] = None):
+        super().__init__(base_url)
+        self.stats = stats
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        name = f"{method} {urlsplit(url).path}"
+        started = time.perf_counter()
+        try:
+            response = super()._request(method, url, **kwargs)
+        except requests.RequestException:
+            self.stats.record(name, time.perf_counter() - started, False)
+            raise
+        self.stats.record(name, time.perf_counter() - started, response.status_code < 400)
+        return response
+
+
+def user_lifecycle_journey(helper: LoadApiHelper, prefix: str):
+    """Create a user, find it by username and delete it, as test_user_management does"""
+    user = helper.create_unique_user(prefix=prefix)
+    try:
+        if helper.get_user_by_username(user['username']) is None:
+            raise Exception(f"Created user '{user['username']}' not found")
+    except Exception:
+        # Still clean up, but let the journey's own error be the one reported
+        helper.delete_user_by_id(user['id'])
+        raise
+    if not helper.delete_user_by_id(user['id']):
+        raise Exception(f"Failed to delete user '{user['username']}'")
+
+
+def user_search_journey(helper: LoadApiHelper, prefix: str):
+    """Read-only: look up the admin user and a username that does not exist"""
+    if helper.get_user_by_username(helper.config['admin_username']) is None:
+        raise Exception("Admin user not found")
+    helper.get_user_by_username(f"{prefix}_missing_{random.randint(0, 10 ** 6)}")
+
+
+JOURNEYS: Dict[str, Callable[[LoadApiHelper, str], None]] = {
+    'user_lifecycle': user_lifecycle_journey,
+    'user_search': user_search_journey
+}
+
+
+class LoadRunner:
+    """Replays an API journey from concurrent virtual users.
+
+    Virtual users start evenly spread over ``ramp_up`` seconds, each with its
+    own HTTP session sharing the cached admin login, and repeat the journey
+    with a randomized ``think_time`` pause (±50%) until ``duration`` has
+    passed. Every request is recorded per endpoint, every journey as
+    ``journey <name>``.
+    """
+
+    def __init__(self, journey: str = "user_lifecycle", users: int = 5, ramp_up: float = 5,
+                 think_time: float = 1.0, duration: float = 30, prefix: str = "autotest",
+                 base_url: Optional[str] = None):
+        if journey not in JOURNEYS:
+            raise ValueError(f"Unknown journey '{journey}', choose from {sorted(JOURNEYS)}")
+        self.journey = journey
+        self.users = users
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.duration = duration
+        self.prefix = prefix
+        self.base_url = base_url
+        self.stats = LoadStats()
+        self._stop = threading.Event()
+
+    def run(self) -> Dict[str, Any]:
+        """Run the load and return the report"""
+        auth_state = AuthCache.get_session(base_url=self.base_url)
+        self.stats = LoadStats()
+        deadline = self.stats.started + self.ramp_up + self.duration
+
+        threads = [
+            threading.Thread(target=self._virtual_user, args=(index, auth_state, deadline),
+                             name=f"vu-{index}", daemon=True)
+            for index in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        self.stats.finished = time.monotonic()
+
+        report = self.stats.report()
+        report.update(journey=self.journey, users=self.users, ramp_up=self.ramp_up,
+                      think_time=self.think_time, duration=self.duration)
+        return report
+
+    def _virtual_user(self, index: int, auth_state, deadline: float):
+        start_delay = self.ramp_up * index / self.users if self.users else 0
+        if self._stop.wait(start_delay):
+            return
+
+        helper = AuthCache.apply_to_api_helper(LoadApiHelper(self.stats, auth_state.base_url), auth_state)
+        journey = JOURNEYS[self.journey]
+        try:
+            while time.monotonic() < deadline and not self._stop.is_set():
+                started = time.perf_counter()
+                try:
+                    journey(helper, self.prefix)
+                    ok = True
+                except Exception as e:
+                    ok = False
+                    print(f"⚠️ vu-{index} journey failed: {e}")
+                self.stats.record(f"journey {self.journey}", time.perf_counter() - started, ok)
+
+                pause = self.think_time * random.uniform(0.5, 1.5)
+                if self._stop.wait(min(pause, max(deadline - time.monotonic(), 0))):
+                    return
+        finally:
+            helper.session.close()
+
+
+def export_report(report: Dict[str, Any], output_dir: str) -> Dict[str, str]:
+    """Write the report as JSON and CSV; returns the file paths"""
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.join(output_dir, f"load_{report['journey']}_{time.strftime('%Y%m%d_%H%M%S')}")
+
+    with open(f"{stem}.json", 'w') as f:
+        json.dump(report, f, indent=2)
+
+    columns = ['name', 'count', 'errors', 'error_rate', 'throughput', 'min', 'mean', 'p50', 'p90', 'p99', 'max']
+    with open(f"{stem}.csv", 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(report['endpoints'])
+
+    return {'json': f"{stem}.json", 'csv': f"{stem}.csv"}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Load run: journey '{report['journey']}', {report['users']} users, {report['elapsed_seconds']}s",
+        f"{'endpoint':<45}{'count':>8}{'err%':>7}{'req/s':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}"
+    ]
+    for row in report['endpoints']:
+        lines.append(
+            f"{row['name']:<45}{row['count']:>8}{row['error_rate'] * 100:>6.1f}%{row['throughput']:>8.2f}"
+            f"{row['p50'] * 1000:>7.0f}ms{row['p90'] * 1000:>7.0f}ms{row['p99'] * 1000:>7.0f}ms{row['max'] * 1000:>7.0f}ms"
+        )
+    return "\n".join(lines)
+
+
+def attach_report(report: Dict[str, Any], files: Dict[str, str]):
+    """Attach the report table and its CSV to the Allure report"""
+    AttachmentPipeline.attach(format_report(report), "load-summary", allure.attachment_type.TEXT)
+    with open(files['csv'], 'rb') as f:
+        AttachmentPipeline.attach(f.read(), "load-latencies", allure.attachment_type.CSV)
+
+
+def run_load(**overrides) -> Dict[str, Any]:
+    """Run a load test with [Load] settings from config, overridden by keyword arguments"""
+    load_config = ConfigReader.get_load_config()
+    options = {key: value for key, value in overrides.items() if value is not None}
+    settings = {key: options.get(key, load_config[key])
+                for key in ('journey', 'users', 'ramp_up', 'think_time', 'duration', 'prefix')}
+    output_dir = options.get('output_dir', load_config['output_dir'])
+
+    report = LoadRunner(**settings).run()
+    report['files'] = export_report(report, output_dir)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay API journeys from concurrent virtual users")
+    parser.add_argument("--journey", choices=sorted(JOURNEYS), help="Journey each virtual user repeats")
+    parser.add_argument("--users", type=int, help="Number of virtual users")
+    parser.add_argument("--ramp-up", type=float, help="Seconds over which virtual users start")
+    parser.add_argument("--think-time", type=float, help="Average pause between journeys (seconds)")
+    parser.add_argument("--duration", type=float, help="Seconds to keep running after ramp-up")
+    parser.add_argument("--prefix", help="Username prefix of the users the journeys create")
+    parser.add_argument("--output-dir", help="Directory for the JSON and CSV reports")
+    args = parser.parse_args(argv)
+
+    report = run_load(**vars(args))
+    print(format_report(report))
+    print(f"Reports: {report['files']['json']}, {report['files']['csv']}")
+
+
+if __name__ == "__main__":
+    main()
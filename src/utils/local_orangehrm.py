@@ -0,0 +1,578 @@
+import argparse
+import html
+import itertools
+import json
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+from src.utils.config_reader import ConfigReader
+
+
+# base_url value that selects the bundled stand-in instead of a real OrangeHRM
+LOCAL_BASE_URL = "local"
+
+AUTH_COOKIE_NAME = "orangehrm"
+LOGIN_PATH = "/web/index.php/auth/login"
+VALIDATE_PATH = "/web/index.php/auth/validate"
+DASHBOARD_PATH = "/web/index.php/dashboard/index"
+ADMIN_USERS_PATH = "/web/index.php/admin/viewSystemUsers"
+USERS_API_PATH = "/web/index.php/api/v2/admin/users"
+EMPLOYEES_API_PATH = "/web/index.php/api/v2/pim/employees"
+
+USER_ROLES = {1: "Admin", 2: "ESS"}
+
+# Employees of the stand-in; create_user's default emp_number is 7
+EMPLOYEES = [
+    {'empNumber': 7, 'employeeId': '0007', 'firstName': 'Peter', 'middleName': 'Mac', 'lastName': 'Anderson'},
+    {'empNumber': 3, 'employeeId': '0003', 'firstName': 'Linda', 'middleName': 'Jane', 'lastName': 'Anderson'},
+    {'empNumber': 12, 'employeeId': '0012', 'firstName': 'Odis', 'middleName': '', 'lastName': 'Adalwin'},
+    {'empNumber': 21, 'employeeId': '0021', 'firstName': 'Rebecca', 'middleName': '', 'lastName': 'Harmony'}
+]
+
+
+class LocalOrangeHRMStore:
+    """In-memory users, employees and login sessions of the stand-in server"""
+
+    def __init__(self, admin_username: str, admin_password: str):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.employees = {employee['empNumber']: dict(employee, terminationId=None) for employee in EMPLOYEES}
+        self.users: Dict[int, Dict[str, Any]] = {}
+        self.sessions: Dict[str, str] = {}
+        self.login_tokens = set()
+        self._add_user(admin_username, admin_password, 1, 7, True)
+
+    def issue_login_token(self) -> str:
+        token = secrets.token_hex(16)
+        with self._lock:
+            self.login_tokens.add(token)
+        return token
+
+    def login(self, token: str, username: str, password: str) -> Optional[str]:
+        """Return a new session id for valid credentials and an unused login token"""
+        with self._lock:
+            if token not in self.login_tokens:
+                return None
+            self.login_tokens.discard(token)
+            for user in self.users.values():
+                if user['userName'] == username and user['password'] == password and user['status']:
+                    session_id = secrets.token_hex(16)
+                    self.sessions[session_id] = username
+                    return session_id
+        return None
+
+    def is_logged_in(self, session_id: Optional[str]) -> bool:
+        with self._lock:
+            return session_id in self.sessions
+
+    def list_users(self, filters: Dict[str, str]) -> Tuple[List[Dict[str, Any]], int]:
+        with self._lock:
+            users = [self._user_json(user) for user in self.users.values()]
+
+        if filters.get('username'):
+            users = [user for user in users if user['userName'] == filters['username']]
+        if filters.get('userRoleId'):
+            users = [user for user in users if str(user['userRole']['id']) == filters['userRoleId']]
+        if filters.get('empNumber'):
+            users = [user for user in users if str(user['employee']['empNumber']) == filters['empNumber']]
+        if filters.get('status') in ('0', '1'):
+            users = [user for user in users if user['status'] == (filters['status'] == '1')]
+
+        users.sort(key=lambda user: user['userName'].lower(), reverse=filters.get('sortOrder') == 'DESC')
+        offset = int(filters.get('offset') or 0)
+        limit = int(filters.get('limit') or 50)
+        return users[offset:offset + limit], len(users)
+
+    def create_user(self, payload: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """Validate like OrangeHRM does and create the user; returns (status, body)"""
+        invalid = {}
+        username = str(payload.get('username') or '')
+        if len(username) < 5:
+            invalid['username'] = "Should have at least 5 characters"
+        if not payload.get('password'):
+            invalid['password'] = "Required"
+        if payload.get('userRoleId') not in USER_ROLES:
+            invalid['userRoleId'] = "Invalid"
+        if payload.get('empNumber') not in self.employees:
+            invalid['empNumber'] = "Invalid"
+
+        with self._lock:
+            if any(user['userName'] == username for user in self.users.values()):
+                invalid['username'] = "Already exists"
+            if invalid:
+                return 422, {'error': {'status': '422', 'message': 'Invalid Parameter',
+                                       'data': {'invalidParamKeys': invalid}}}
+            user = self._add_user(username, payload['password'], payload['userRoleId'],
+                                  payload['empNumber'], bool(payload.get('status', True)))
+            return 200, {'data': self._user_json(user), 'meta': [], 'rels': []}
+
+    def delete_users(self, ids: List[int]) -> Tuple[int, Dict[str, Any]]:
+        """Delete all the users or none of them, like OrangeHRM; returns (status, body)"""
+        if not ids:
+            return 422, {'error': {'status': '422', 'message': 'Invalid Parameter',
+                                   'data': {'invalidParamKeys': {'ids': "Required"}}}}
+        with self._lock:
+            if any(user_id not in self.users for user_id in ids):
+                return 404, {'error': {'status': '404', 'message': 'Records Not Found'}}
+            for user_id in ids:
+                del self.users[user_id]
+            return 200, {'data': ids, 'meta': [], 'rels': []}
+
+    def search_employees(self, name_or_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        needle = name_or_id.lower()
+        matches = [
+            employee for employee in self.employees.values()
+            if needle in _full_name(employee).lower() or needle == employee['employeeId']
+        ]
+        return matches[:limit]
+
+    def _add_user(self, username, password, user_role_id, emp_number, status):
+        user_id = next(self._ids)
+        user = {'id': user_id, 'userName': username, 'password': password, 'status': status,
+                'userRoleId': user_role_id, 'empNumber': emp_number}
+        self.users[user_id] = user
+        return user
+
+    def _user_json(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        employee = self.employees[user['empNumber']]
+        role = USER_ROLES[user['userRoleId']]
+        return {
+            'id': user['id'],
+            'userName': user['userName'],
+            'deleted': False,
+            'status': user['status'],
+            'employee': dict(employee),
+            'userRole': {'id': user['userRoleId'], 'name': role, 'displayName': role}
+        }
+
+
+class LocalOrangeHRMHandler(BaseHTTPRequestHandler):
+    """Routes the subset of OrangeHRM the page objects and API helpers use"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalOrangeHRM"
+    # Headers and body are written separately; with Nagle on, keep-alive
+    # clients wait for a delayed ACK (~40ms) on every response
+    disable_nagle_algorithm = True
+
+    @property
+    def store(self) -> LocalOrangeHRMStore:
+        return self.server.store
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        logged_in = self.store.is_logged_in(self._session_id())
+
+        if url.path in ("/", "/web/index.php", "/web/index.php/"):
+            return self._redirect(LOGIN_PATH)
+        if url.path == LOGIN_PATH:
+            if logged_in:
+                return self._redirect(DASHBOARD_PATH)
+            return self._html(_login_page(self.store.issue_login_token(), 'error' in query))
+        if url.path in (DASHBOARD_PATH, ADMIN_USERS_PATH):
+            if not logged_in:
+                return self._redirect(LOGIN_PATH)
+            page = _dashboard_page() if url.path == DASHBOARD_PATH else _admin_users_page()
+            return self._html(page)
+        if url.path == USERS_API_PATH:
+            if not logged_in:
+                return self._unauthorized()
+            users, total = self.store.list_users(query)
+            return self._json(200, {'data': users, 'meta': {'total': total}, 'rels': []})
+        if url.path == EMPLOYEES_API_PATH:
+            if not logged_in:
+                return self._unauthorized()
+            employees = self.store.search_employees(query.get('nameOrId', ''), int(query.get('limit') or 50))
+            return self._json(200, {'data': employees, 'meta': {'total': len(employees)}, 'rels': []})
+        self._json(404, {'error': {'status': '404', 'message': 'Not Found'}})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        body = self._read_body()
+
+        if url.path == VALIDATE_PATH:
+            form = {key: values[-1] for key, values in parse_qs(body.decode()).items()}
+            session_id = self.store.login(form.get('_token', ''), form.get('username', ''), form.get('password', ''))
+            if session_id is None:
+                return self._redirect(f"{LOGIN_PATH}?{urlencode({'error': 'credentials'})}")
+            return self._redirect(DASHBOARD_PATH, cookie=session_id)
+        if url.path == USERS_API_PATH:
+            if not self.store.is_logged_in(self._session_id()):
+                return self._unauthorized()
+            return self._json(*self.store.create_user(_json_body(body)))
+        self._json(404, {'error': {'status': '404', 'message': 'Not Found'}})
+
+    def do_DELETE(self):
+        url = urlsplit(self.path)
+        body = self._read_body()
+
+        if url.path == USERS_API_PATH:
+            if not self.store.is_logged_in(self._session_id()):
+                return self._unauthorized()
+            ids = [int(user_id) for user_id in _json_body(body).get('ids', [])]
+            return self._json(*self.store.delete_users(ids))
+        self._json(404, {'error': {'status': '404', 'message': 'Not Found'}})
+
+    def log_message(self, format, *args):
+        """Keep test output clean; the server handles thousands of requests per run"""
+
+    def _session_id(self) -> Optional[str]:
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        morsel = cookie.get(AUTH_COOKIE_NAME)
+        return morsel.value if morsel else None
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _redirect(self, location: str, cookie: Optional[str] = None):
+        self.send_response(302)
+        self.send_header('Location', location)
+        if cookie:
+            self.send_header('Set-Cookie', f"{AUTH_COOKIE_NAME}={cookie}; Path=/web; HttpOnly; SameSite=Lax")
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _unauthorized(self):
+        self._json(401, {'error': {'status': '401', 'message': 'Session expired'}})
+
+    def _json(self, status: int, body: Dict[str, Any]):
+        self._send(status, json.dumps(body).encode(), 'application/json')
+
+    def _html(self, page: str):
+        self._send(200, page.encode(), 'text/html; charset=utf-8')
+
+    def _send(self, status: int, payload: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class LocalOrangeHRMServer:
+    """Multi-threaded in-memory OrangeHRM stand-in, started on a background thread.
+
+    Each process (every xdist worker) runs its own server, so workers never
+    contend for one backend and ``-n auto`` scales with the cores.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 admin_username: Optional[str] = None, admin_password: Optional[str] = None):
+        config = ConfigReader.get_orangehrm_config()
+        self.httpd = ThreadingHTTPServer((host, port), LocalOrangeHRMHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = LocalOrangeHRMStore(
+            admin_username or config['admin_username'], admin_password or config['admin_password']
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def store(self) -> LocalOrangeHRMStore:
+        return self.httpd.store
+
+    def start(self) -> "LocalOrangeHRMServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="local-orangehrm", daemon=True)
+        self._thread.start()
+        print(f"✅ Local OrangeHRM stand-in running at {self.url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+def is_local_base_url(base_url: str) -> bool:
+    return base_url.strip().lower() == LOCAL_BASE_URL
+
+
+def _full_name(employee: Dict[str, Any]) -> str:
+    return ' '.join(filter(None, (employee['firstName'], employee['middleName'], employee['lastName'])))
+
+
+def _json_body(body: bytes) -> Dict[str, Any]:
+    try:
+        return json.loads(body or b"{}")
+    except ValueError:
+        return {}
+
+
+# Markup below mirrors the class names and structure of OrangeHRM 5 that the
+# page object locators depend on; styling is only what visibility checks need.
+_STYLE = """
+<style>
+  body { font-family: sans-serif; margin: 0; }
+  .oxd-topbar { display: flex; justify-content: space-between; padding: 8px 16px; background: #f6f6f6; }
+  .oxd-userdropdown-img { width: 32px; height: 32px; border-radius: 50%; background: #e87a00; }
+  .oxd-layout { display: flex; }
+  .oxd-sidepanel { width: 180px; padding: 16px; }
+  .oxd-sidepanel a { display: block; padding: 6px 0; color: #333; text-decoration: none; }
+  .oxd-layout-context { flex: 1; padding: 16px; }
+  .oxd-input-group { display: inline-block; position: relative; width: 220px; margin: 8px; vertical-align: top; }
+  .oxd-input, .oxd-select-text { display: block; box-sizing: border-box; width: 100%; min-height: 32px; padding: 6px; border: 1px solid #ccc; cursor: pointer; }
+  div[role='listbox'] { position: absolute; z-index: 10; left: 0; right: 0; background: #fff; border: 1px solid #ccc; }
+  div[role='option'] { padding: 6px; cursor: pointer; }
+  div[role='option']:hover { background: #eee; }
+  div[role='row'] { display: flex; border-bottom: 1px solid #eee; }
+  div[role='cell'] { flex: 1; padding: 6px; }
+  .oxd-loading-spinner { width: 24px; height: 24px; border: 3px solid #e87a00; border-radius: 50%; }
+  .oxd-dialog-container { position: fixed; top: 30%; left: 35%; padding: 24px; background: #fff; border: 1px solid #999; }
+  .oxd-alert-content-text { color: #a00; }
+</style>
+"""
+
+_TOPBAR = """
+<header class="oxd-topbar">
+  <h6 class="oxd-text oxd-text--h6 oxd-topbar-header-breadcrumb-module">{title}</h6>
+  <span class="oxd-userdropdown-tab">
+    <img class="oxd-userdropdown-img" alt="profile picture"
+         src="data:image/gif;base64,R0lGODlhAQABAIAAAAUEBAAAACwAAAAAAQABAAACAkQBADs=">
+  </span>
+</header>
+<div class="oxd-layout">
+  <nav class="oxd-sidepanel">
+    <a href="{admin}"><span class="oxd-text oxd-main-menu-item--name">Admin</span></a>
+    <a href="{dashboard}"><span class="oxd-text oxd-main-menu-item--name">Dashboard</span></a>
+  </nav>
+  <div class="oxd-layout-context">
+"""
+
+
+def _layout(title: str, content: str, script: str = "") -> str:
+    topbar = _TOPBAR.format(title=html.escape(title), admin=ADMIN_USERS_PATH, dashboard=DASHBOARD_PATH)
+    return (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>OrangeHRM</title>{_STYLE}</head>"
+            f"<body>{topbar}{content}</div></div><script>{script}</script></body></html>")
+
+
+def _login_page(token: str, failed: bool) -> str:
+    error = ('<div class="oxd-alert oxd-alert--error" role="alert">'
+             '<p class="oxd-text oxd-text--p oxd-alert-content-text">Invalid credentials</p></div>') if failed else ""
+    return f"""<!DOCTYPE html><html><head><meta charset='utf-8'><title>OrangeHRM</title>{_STYLE}</head><body>
+<div class="orangehrm-login-container">
+  <h5 class="oxd-text oxd-text--h5 orangehrm-login-title">Login</h5>
+  <auth-login :token="&quot;{token}&quot;"></auth-login>
+  {error}
+  <form class="oxd-form" method="post" action="{VALIDATE_PATH}">
+    <input type="hidden" name="_token" value="{token}">
+    <div class="oxd-input-group"><input class="oxd-input" name="username" placeholder="Username"></div>
+    <div class="oxd-input-group"><input class="oxd-input" name="password" type="password" placeholder="Password"></div>
+    <button type="submit" class="oxd-button oxd-button--main orangehrm-login-button">Login</button>
+  </form>
+</div></body></html>"""
+
+
+def _dashboard_page() -> str:
+    return _layout("Dashboard", '<div class="orangehrm-dashboard-grid"><p>Time at Work</p></div>')
+
+
+def _field(label: str, control: str) -> str:
+    return (f'<div class="oxd-input-group oxd-input-field-bottom-space">'
+            f'<div class="oxd-input-group__label-wrapper"><label class="oxd-label">{label}</label></div>'
+            f'<div>{control}</div></div>')
+
+
+def _select(name: str) -> str:
+    return (f'<div class="oxd-select-wrapper"><div class="oxd-select-text oxd-select-text--active" tabindex="0"'
+            f' data-field="{name}"><div class="oxd-select-text-input">-- Select --</div></div></div>')
+
+
+def _admin_users_page() -> str:
+    form = (
+        '<form class="oxd-form" id="user-search">'
+        + _field("Username", '<input class="oxd-input oxd-input--active" name="username">')
+        + _field("User Role", _select("role"))
+        + _field("Employee Name", '<div class="oxd-autocomplete-wrapper"><input class="oxd-input" '
+                 'name="employee" placeholder="Type for hints..."></div>')
+        + _field("Status", _select("status"))
+        + '<button type="button" class="oxd-button oxd-button--ghost" id="reset">Reset</button>'
+        + '<button type="submit" class="oxd-button oxd-button--secondary orangehrm-left-space">Search</button>'
+        + '</form>'
+        + '<div id="records"></div><div class="oxd-table-body" id="table-body"></div><div id="dialog"></div>'
+    )
+    return _layout("Admin", form, _ADMIN_USERS_SCRIPT.replace("__USERS_API__", USERS_API_PATH)
+                   .replace("__EMPLOYEES_API__", EMPLOYEES_API_PATH))
+
+
+_ADMIN_USERS_SCRIPT = """
+var OPTIONS = {role: ['-- Select --', 'Admin', 'ESS'], status: ['-- Select --', 'Enabled', 'Disabled']};
+var ROLE_IDS = {'Admin': 1, 'ESS': 2};
+var selected = {role: null, status: null};
+var employee = null;
+var searchTimer = null;
+var tableBody = document.getElementById('table-body');
+
+function esc(text) {
+    var div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+function closeListbox() {
+    var open = document.querySelector('div[role="listbox"]');
+    if (open) { open.remove(); }
+}
+function openListbox(anchor, items, onPick) {
+    closeListbox();
+    var listbox = document.createElement('div');
+    listbox.setAttribute('role', 'listbox');
+    items.forEach(function (item) {
+        var option = document.createElement('div');
+        option.setAttribute('role', 'option');
+        option.className = 'oxd-select-option';
+        option.innerHTML = '<span>' + esc(item.text) + '</span>';
+        if (onPick) { option.addEventListener('click', function () { onPick(item); closeListbox(); }); }
+        listbox.appendChild(option);
+    });
+    anchor.appendChild(listbox);
+}
+function spinner(on) {
+    var existing = document.querySelector('.oxd-loading-spinner');
+    if (on && !existing) {
+        var div = document.createElement('div');
+        div.className = 'oxd-loading-spinner';
+        document.getElementById('records').appendChild(div);
+    } else if (!on && existing) {
+        existing.remove();
+    }
+}
+
+document.querySelectorAll('.oxd-select-text').forEach(function (control) {
+    control.addEventListener('click', function (event) {
+        event.stopPropagation();
+        var field = control.getAttribute('data-field');
+        var items = OPTIONS[field].map(function (text) { return {text: text}; });
+        openListbox(control.parentNode, items, function (item) {
+            selected[field] = item.text === '-- Select --' ? null : item.text;
+            control.querySelector('.oxd-select-text-input').textContent = item.text;
+        });
+    });
+});
+
+var employeeInput = document.querySelector('input[name="employee"]');
+employeeInput.addEventListener('input', function () {
+    employee = null;
+    clearTimeout(searchTimer);
+    var text = employeeInput.value.trim();
+    if (!text) { return closeListbox(); }
+    openListbox(employeeInput.parentNode, [{text: 'Searching....'}]);
+    searchTimer = setTimeout(function () {
+        fetch('__EMPLOYEES_API__?nameOrId=' + encodeURIComponent(text) + '&limit=10')
+            .then(function (response) { return response.json(); })
+            .then(function (body) {
+                var items = body.data.map(function (emp) {
+                    var name = [emp.firstName, emp.middleName, emp.lastName].filter(Boolean).join(' ');
+                    return {text: name, empNumber: emp.empNumber};
+                });
+                if (!items.length) { return openListbox(employeeInput.parentNode, [{text: 'No match'}]); }
+                openListbox(employeeInput.parentNode, items, function (item) {
+                    employee = item;
+                    employeeInput.value = item.text;
+                });
+            });
+    }, 200);
+});
+document.addEventListener('click', closeListbox);
+
+function currentQuery() {
+    var params = {limit: 50, offset: 0, sortField: 'u.userName', sortOrder: 'ASC'};
+    var username = document.querySelector('input[name="username"]').value.trim();
+    if (username) { params.username = username; }
+    if (selected.role) { params.userRoleId = ROLE_IDS[selected.role]; }
+    if (selected.status) { params.status = selected.status === 'Enabled' ? 1 : 0; }
+    if (employee) { params.empNumber = employee.empNumber; }
+    return Object.keys(params).map(function (key) {
+        return key + '=' + encodeURIComponent(params[key]);
+    }).join('&');
+}
+function renderUsers(users) {
+    var records = document.getElementById('records');
+    records.innerHTML = users.length
+        ? '<span class="oxd-text oxd-text--span">(' + users.length + ') Records Found</span>'
+        : '<span class="oxd-text oxd-text--span">No Records Found</span>';
+    tableBody.innerHTML = users.map(function (user) {
+        var emp = user.employee;
+        var name = [emp.firstName, emp.lastName].filter(Boolean).join(' ');
+        return '<div class="oxd-table-card"><div role="row" class="oxd-table-row" data-id="' + user.id + '">'
+            + '<div role="cell"><div>' + esc(user.userName) + '</div></div>'
+            + '<div role="cell"><div>' + esc(user.userRole.displayName) + '</div></div>'
+            + '<div role="cell"><div>' + esc(name) + '</div></div>'
+            + '<div role="cell"><div>' + (user.status ? 'Enabled' : 'Disabled') + '</div></div>'
+            + '<div role="cell"><div class="oxd-table-cell-actions">'
+            + '<button type="button" class="oxd-icon-button"><i class="oxd-icon bi-trash"></i></button>'
+            + '</div></div></div></div>';
+    }).join('');
+}
+function loadUsers() {
+    spinner(true);
+    tableBody.innerHTML = '';
+    return fetch('__USERS_API__?' + currentQuery())
+        .then(function (response) { return response.json(); })
+        .then(function (body) { renderUsers(body.data); })
+        .finally(function () { spinner(false); });
+}
+
+document.getElementById('user-search').addEventListener('submit', function (event) {
+    event.preventDefault();
+    loadUsers();
+});
+document.getElementById('reset').addEventListener('click', function () {
+    document.getElementById('user-search').reset();
+    selected = {role: null, status: null};
+    employee = null;
+    document.querySelectorAll('.oxd-select-text-input').forEach(function (el) { el.textContent = '-- Select --'; });
+    loadUsers();
+});
+tableBody.addEventListener('click', function (event) {
+    var button = event.target.closest('button');
+    if (!button) { return; }
+    var userId = parseInt(button.closest('div[role="row"]').getAttribute('data-id'), 10);
+    var dialog = document.getElementById('dialog');
+    dialog.innerHTML = '<div class="oxd-dialog-container" role="document"><p class="oxd-text">Are you Sure?</p>'
+        + '<button type="button" class="oxd-button oxd-button--ghost">No, Cancel</button>'
+        + '<button type="button" class="oxd-button oxd-button--label-danger">Yes, Delete</button></div>';
+    var buttons = dialog.querySelectorAll('button');
+    buttons[0].addEventListener('click', function () { dialog.innerHTML = ''; });
+    buttons[1].addEventListener('click', function () {
+        dialog.innerHTML = '';
+        spinner(true);
+        fetch('__USERS_API__', {
+            method: 'DELETE',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({ids: [userId]})
+        }).then(loadUsers);
+    });
+});
+
+loadUsers();
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the in-memory OrangeHRM stand-in server")
+    parser.add_argument("--host", help="Interface to bind")
+    parser.add_argument("--port", type=int, help="Port to listen on")
+    args = parser.parse_args(argv)
+
+    server_config = ConfigReader.get_local_server_config()
+    server = LocalOrangeHRMServer(args.host or server_config['host'],
+                                  args.port if args.port is not None else server_config['port'] or 8080)
+    server.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
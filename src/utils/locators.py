@@ -0,0 +1,145 @@
+import re
+import string
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+from selenium.webdriver.common.by import By
+
+
+def xpath_literal(value: str) -> str:
+    """Quote a string for XPath, including values that contain quotes"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def css_string(value: str) -> str:
+    """Quote a string for use inside a CSS attribute selector"""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\a ")
+    return f'"{escaped}"'
+
+
+class BuiltLocator(tuple):
+    """A (By, value) tuple that also records whether its element may be cached"""
+
+    cacheable = True
+
+    def __new__(cls, by: str, value: str, cacheable: bool = True):
+        built = super().__new__(cls, (by, value))
+        built.cacheable = cacheable
+        return built
+
+
+class Locator:
+    """A named, parameterized locator template.
+
+    Exactly one of ``css`` or ``xpath`` is given. Parameters are written as
+    ``{name}`` and substituted with proper quoting for the selector language,
+    so values containing quotes cannot break the expression. Built locators
+    are memoized per parameter set.
+
+    Set ``cacheable=False`` for elements the app may re-render in place with
+    different content, such as table rows, so a stale handle is never reused.
+    """
+
+    def __init__(self, name: str, css: Optional[str] = None, xpath: Optional[str] = None,
+                 cacheable: bool = True):
+        if (css is None) == (xpath is None):
+            raise ValueError(f"Locator '{name}' needs exactly one of css or xpath")
+
+        self.name = name
+        self.cacheable = cacheable
+        self.by = By.CSS_SELECTOR if css is not None else By.XPATH
+        self.template = css if css is not None else xpath
+        self.params = frozenset(
+            field for _, field, _, _ in string.Formatter().parse(self.template) if field
+        )
+        self._quote = css_string if self.by == By.CSS_SELECTOR else xpath_literal
+        self._validate()
+        self._build = lru_cache(maxsize=256)(self._build_uncached)
+
+    def __call__(self, **params) -> BuiltLocator:
+        """Build the (By, value) tuple for the given parameters"""
+        if set(params) != self.params:
+            raise ValueError(f"Locator '{self.name}' expects parameters {sorted(self.params)}, got {sorted(params)}")
+        return self._build(tuple(sorted(params.items())))
+
+    def _build_uncached(self, params: Tuple[Tuple[str, str], ...]) -> BuiltLocator:
+        quoted = {key: self._quote(str(value)) for key, value in params}
+        return BuiltLocator(self.by, self.template.format(**quoted), self.cacheable)
+
+    def _validate(self):
+        """Catch template typos when the page class is defined, not when a test runs"""
+        sample = self.template.format(**{param: "''" for param in self.params})
+        for opening, closing in ("[]", "()"):
+            if sample.count(opening) != sample.count(closing):
+                raise ValueError(f"Locator '{self.name}' has unbalanced '{opening}{closing}': {self.template}")
+        if self.by == By.XPATH and not re.match(r"^\(?/", sample):
+            raise ValueError(f"XPath locator '{self.name}' must be anchored with '/': {self.template}")
+
+
+class LocatorRegistry:
+    """Locators of a page object, looked up by name"""
+
+    def __init__(self, locators: Iterable[Locator] = ()):
+        self._locators: Dict[str, Locator] = {}
+        for locator in locators:
+            self.add(locator)
+
+    def add(self, locator: Locator) -> Locator:
+        if locator.name in self._locators:
+            raise ValueError(f"Locator '{locator.name}' is already registered")
+        self._locators[locator.name] = locator
+        return locator
+
+    def get(self, name: str, **params) -> BuiltLocator:
+        """Build a registered locator"""
+        return self._locators[name](**params)
+
+    def __getitem__(self, name: str) -> Locator:
+        return self._locators[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._locators
+
+
+class ElementCache:
+    """Element handles resolved on the current page, shared by every page object of a driver.
+
+    Only locators marked cacheable are stored. ``navigate_to_page`` starts a
+    new page state and clears the cache; a handle that went stale in between
+    is dropped by the caller on first use.
+    """
+
+    def __init__(self):
+        self._elements = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def for_driver(driver) -> "ElementCache":
+        cache = getattr(driver, "_element_cache", None)
+        if cache is None:
+            cache = ElementCache()
+            driver._element_cache = cache
+        return cache
+
+    def get(self, locator):
+        element = self._elements.get(locator)
+        if element is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return element
+
+    def put(self, locator, element):
+        if getattr(locator, "cacheable", False):
+            self._elements[locator] = element
+
+    def discard(self, locator):
+        self._elements.pop(locator, None)
+
+    def clear(self):
+        self._elements.clear()
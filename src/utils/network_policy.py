@@ -0,0 +1,149 @@
+import json
+from typing import Any, Dict, Iterable, List, Optional
+import allure
+from src.utils.attachments import AttachmentPipeline
+from src.utils.cdp_events import CdpEventLog
+from src.utils.config_reader import ConfigReader
+from src.utils.session_stats import SessionStats
+
+
+# URL patterns for Network.setBlockedURLs; '*' is the only wildcard it supports.
+# Patterns match the whole URL, so each extension ends in '*' to also match
+# cache-busting query strings like app.woff2?v=3.
+BLOCK_CATEGORIES = {
+    'images': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.ico*', '*.bmp*'],
+    'fonts': ['*.woff*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.mp3*', '*.ogg*'],
+    'analytics': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*hotjar.com*', '*segment.io*', '*facebook.net*'
+    ]
+}
+
+
+@SessionStats.register_summary
+def _network_summary(values):
+    if not values.get('network.sessions'):
+        return []
+    return [f"Network policy: {int(values.get('network.blocked_requests', 0))} requests blocked, "
+            f"{int(values.get('network.allowed_requests', 0))} allowed "
+            f"({values.get('network.allowed_bytes', 0) / 1048576:.1f} MB transferred)"]
+
+
+class NetworkCounters:
+    """Counts blocked and allowed requests from a session's Network events"""
+
+    def __init__(self):
+        self.requests = 0
+        self.blocked_requests = 0
+        self.failed_requests = 0
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+        self.blocked_urls: List[str] = []
+        self._urls: Dict[str, str] = {}
+
+    def __call__(self, event: Dict[str, Any]):
+        method, params = event.get("method"), event.get("params", {})
+        if method == "Network.requestWillBeSent":
+            self.requests += 1
+            self._urls[params["requestId"]] = params["request"]["url"]
+        elif method == "Network.loadingFinished":
+            self.allowed_requests += 1
+            self.allowed_bytes += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed":
+            if params.get("blockedReason"):
+                self.blocked_requests += 1
+                url = self._urls.get(params["requestId"])
+                if url and len(self.blocked_urls) < 50:
+                    self.blocked_urls.append(url)
+            else:
+                self.failed_requests += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'blocked_requests': self.blocked_requests,
+            'allowed_requests': self.allowed_requests,
+            'failed_requests': self.failed_requests,
+            'allowed_bytes': self.allowed_bytes,
+            'blocked_urls_sample': self.blocked_urls
+        }
+
+
+class NetworkPolicy:
+    """Blocks resource categories and hosts in a Chrome session through CDP.
+
+    Chrome ignores most ``--disable-*`` resource flags, but
+    ``Network.setBlockedURLs`` reliably fails matching requests before they
+    are sent. A policy is applied per test; categories come from the
+    ``network_policy`` marker or the [Network] config section.
+    """
+
+    def __init__(self, block: Iterable[str] = (), block_hosts: Iterable[str] = (),
+                 extra_patterns: Iterable[str] = ()):
+        self.block = [category for category in block if category]
+        self.block_hosts = [host for host in block_hosts if host]
+        self.extra_patterns = list(extra_patterns)
+        self.counters: Optional[NetworkCounters] = None
+
+        unknown = [category for category in self.block if category not in BLOCK_CATEGORIES]
+        if unknown:
+            raise ValueError(f"Unknown network block categories: {unknown}")
+
+    @classmethod
+    def for_test(cls, node) -> "NetworkPolicy":
+        """Policy from the test's ``network_policy`` marker, else from config"""
+        network_config = ConfigReader.get_network_config()
+        marker = node.get_closest_marker("network_policy")
+        if marker is None:
+            return cls(block=network_config['block'], block_hosts=network_config['block_hosts'])
+
+        block = marker.kwargs.get('block', marker.args[0] if marker.args else ())
+        return cls(
+            block=block or (),
+            block_hosts=marker.kwargs.get('block_hosts', network_config['block_hosts']),
+            extra_patterns=marker.kwargs.get('patterns', ())
+        )
+
+    @property
+    def patterns(self) -> List[str]:
+        patterns = []
+        for category in self.block:
+            patterns.extend(BLOCK_CATEGORIES[category])
+        for host in self.block_hosts:
+            patterns.append(f"*://{host}/*")
+        patterns.extend(self.extra_patterns)
+        return patterns
+
+    def apply(self, driver) -> bool:
+        """Install the policy and start counting; returns False for non-Chrome drivers"""
+        if not CdpEventLog.is_supported(driver):
+            return False
+
+        event_log = CdpEventLog.for_driver(driver)
+        event_log.discard_pending()
+        self.counters = NetworkCounters()
+        event_log.subscribe(self.counters)
+
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+        return True
+
+    def finish(self, driver) -> Optional[Dict[str, Any]]:
+        """Collect this test's counters, attach them to Allure and stop counting"""
+        if self.counters is None:
+            return None
+
+        event_log = CdpEventLog.for_driver(driver)
+        event_log.drain()
+        event_log.unsubscribe(self.counters)
+
+        summary = dict(self.counters.as_dict(), blocked_categories=self.block, blocked_hosts=self.block_hosts)
+        AttachmentPipeline.attach(json.dumps(summary, indent=2), "network-policy", allure.attachment_type.JSON)
+
+        SessionStats.add('network.sessions')
+        SessionStats.add('network.blocked_requests', self.counters.blocked_requests)
+        SessionStats.add('network.allowed_requests', self.counters.allowed_requests)
+        SessionStats.add('network.allowed_bytes', self.counters.allowed_bytes)
+        self.counters = None
+        return summary
@@ -0,0 +1,188 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+import allure
+from selenium.common.exceptions import WebDriverException
+from src.utils.attachments import AttachmentPipeline
+from src.utils.cdp_events import CdpEventLog
+from src.utils.config_reader import ConfigReader
+from src.utils.session_stats import SessionStats
+
+
+# One round-trip for Navigation Timing, Paint Timing and resource totals.
+# Times are milliseconds since navigation start; app_ready is "now", which is
+# when the page is usable if the caller waited for the app to go idle first.
+COLLECT_PAGE_TIMINGS = """
+    var nav = performance.getEntriesByType('navigation')[0] || {};
+    var paints = {};
+    performance.getEntriesByType('paint').forEach(function(entry) { paints[entry.name] = entry.startTime; });
+    var resources = performance.getEntriesByType('resource');
+    var byType = {};
+    var transfer = 0;
+    resources.forEach(function(entry) {
+        byType[entry.initiatorType] = (byType[entry.initiatorType] || 0) + 1;
+        transfer += entry.transferSize || 0;
+    });
+    return {
+        url: location.href,
+        ttfb: nav.responseStart || null,
+        dom_interactive: nav.domInteractive || null,
+        dom_content_loaded: nav.domContentLoadedEventEnd || null,
+        load: nav.loadEventEnd || null,
+        document_transfer_bytes: nav.transferSize || 0,
+        first_paint: paints['first-paint'] || null,
+        first_contentful_paint: paints['first-contentful-paint'] || null,
+        app_ready: performance.now(),
+        resource_count: resources.length,
+        resource_transfer_bytes: transfer,
+        resources_by_type: byType
+    };
+"""
+
+# Performance.getMetrics values worth keeping, under shorter names
+CDP_METRICS = {
+    'JSHeapUsedSize': 'js_heap_used_bytes',
+    'JSHeapTotalSize': 'js_heap_total_bytes',
+    'Nodes': 'dom_nodes',
+    'Documents': 'documents',
+    'JSEventListeners': 'js_event_listeners',
+    'LayoutCount': 'layout_count',
+    'ScriptDuration': 'script_seconds',
+    'TaskDuration': 'task_seconds'
+}
+
+
+@SessionStats.register_summary
+def _page_metrics_summary(values):
+    navigations = values.get('pages.navigations', 0)
+    if not navigations:
+        return []
+    lines = [f"Page loads measured: {int(navigations)}, "
+             f"{values.get('pages.budget_seconds', 0) / navigations:.2f}s avg against budget metric"]
+    if values.get('pages.budget_violations'):
+        lines.append(f"Page budget violations: {int(values['pages.budget_violations'])}")
+    return lines
+
+
+class PageBudgetExceeded(AssertionError):
+    """A page took longer to load than its budget allows"""
+
+
+class PageBudgets:
+    """Load-time budgets in seconds per URL path.
+
+    Defaults come from the [PageBudgets] config section; tests add or
+    override them with ``@pytest.mark.page_budget(path, seconds, mode=...)``.
+    Paths are matched case-insensitively, since config.ini keys are lowercased.
+
+    The default ``app_ready`` metric is taken after OrangeHRM's loading
+    spinner is gone, so it includes the API calls that fill a list page; the
+    browser's ``load`` event fires before that data arrives in this SPA.
+    """
+
+    def __init__(self, budgets: Dict[str, float], mode: str = "warn"):
+        if mode not in ("warn", "fail"):
+            raise ValueError(f"Page budget mode must be 'warn' or 'fail', got '{mode}'")
+        self.budgets = {path.lower(): float(seconds) for path, seconds in budgets.items()}
+        self.mode = mode
+
+    @classmethod
+    def for_test(cls, node) -> "PageBudgets":
+        budgets = dict(ConfigReader.get_page_budgets())
+        marker_budgets = {}
+        mode = None
+        # Closest markers come first and win over module or class level ones
+        for marker in node.iter_markers("page_budget"):
+            try:
+                path, seconds, marker_mode = _page_budget_args(*marker.args, **marker.kwargs)
+            except TypeError as e:
+                raise ValueError(f"page_budget marker takes (path, seconds, mode=None): {e}")
+            marker_budgets.setdefault(path.lower(), seconds)
+            mode = mode or marker_mode
+        budgets.update(marker_budgets)
+        return cls(budgets, mode or ConfigReader.get_page_metrics_config()['budget_mode'])
+
+    def attach_to(self, driver):
+        """Make the budgets visible to every page object using this driver"""
+        driver._page_budgets = self
+
+    @staticmethod
+    def of(driver) -> Optional["PageBudgets"]:
+        return getattr(driver, "_page_budgets", None)
+
+    def budget_for(self, path: str) -> Optional[float]:
+        return self.budgets.get(path.lower())
+
+
+def _page_budget_args(path: str, seconds: float, mode: Optional[str] = None):
+    """Bind page_budget marker arguments, given positionally or by keyword"""
+    return path, seconds, mode
+
+
+class PageMetrics:
+    """Captures load performance of the page a driver just navigated to"""
+
+    @staticmethod
+    def capture(driver) -> Dict[str, Any]:
+        """Navigation, paint and resource timings plus CDP runtime metrics of the current page"""
+        metrics = driver.execute_script(COLLECT_PAGE_TIMINGS)
+        for key in ('ttfb', 'dom_interactive', 'dom_content_loaded', 'load',
+                    'first_paint', 'first_contentful_paint', 'app_ready'):
+            if metrics.get(key) is not None:
+                metrics[key] = round(metrics[key] / 1000, 3)
+
+        if CdpEventLog.is_supported(driver):
+            try:
+                if not getattr(driver, "_performance_domain_enabled", False):
+                    driver.execute_cdp_cmd("Performance.enable", {})
+                    driver._performance_domain_enabled = True
+                for metric in driver.execute_cdp_cmd("Performance.getMetrics", {})['metrics']:
+                    if metric['name'] in CDP_METRICS:
+                        metrics[CDP_METRICS[metric['name']]] = metric['value']
+            except WebDriverException:
+                pass
+        return metrics
+
+    @staticmethod
+    def record(driver, url: str, metrics: Dict[str, Any]):
+        """Check the page's budget, attach the metrics and append them to the trend file"""
+        config = ConfigReader.get_page_metrics_config()
+        # Budgets apply to where the browser ended up, e.g. the login page after a redirect
+        path = urlsplit(metrics.get('url') or url).path
+        budgets = PageBudgets.of(driver)
+        budget = budgets.budget_for(path) if budgets else None
+        measured = metrics.get(config['budget_metric'])
+
+        entry = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'test': os.environ.get('PYTEST_CURRENT_TEST', '').split(' ')[0],
+            'path': path,
+            'budget_metric': config['budget_metric'],
+            'budget': budget,
+            'within_budget': None if budget is None or measured is None else measured <= budget,
+            'metrics': metrics
+        }
+        AttachmentPipeline.attach(json.dumps(entry, indent=2), f"page-metrics {path}", allure.attachment_type.JSON)
+        PageMetrics._append_trend(config['trend_file'], entry)
+
+        SessionStats.add('pages.navigations')
+        if measured is not None:
+            SessionStats.add('pages.budget_seconds', measured)
+
+        if entry['within_budget'] is False:
+            SessionStats.add('pages.budget_violations')
+            message = f"{path} took {measured:.2f}s ({config['budget_metric']}), budget is {budget:.2f}s"
+            if budgets.mode == "fail":
+                raise PageBudgetExceeded(message)
+            print(f"⚠️ Page budget exceeded: {message}")
+
+    @staticmethod
+    def _append_trend(trend_file: str, entry: Dict[str, Any]):
+        """One JSON line per navigation; a single append keeps xdist workers from interleaving"""
+        directory = os.path.dirname(trend_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(trend_file, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
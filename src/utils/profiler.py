@@ -0,0 +1,293 @@
+import functools
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+import allure
+import allure_commons
+from src.utils.attachments import AttachmentPipeline
+from src.utils.session_stats import SessionStats
+
+
+NO_STEP = "(outside steps)"
+
+
+@SessionStats.register_summary
+def _profiler_summary(values):
+    if not values.get('profiler.tests'):
+        return []
+    lines = [
+        f"WebDriver commands: {int(values.get('profiler.webdriver_commands', 0))}, "
+        f"{values.get('profiler.webdriver_seconds', 0):.1f}s; "
+        f"HTTP calls: {int(values.get('profiler.http_calls', 0))}, {values.get('profiler.http_seconds', 0):.1f}s"
+    ]
+    if values.get('profiler.chatty_tests'):
+        lines.append(f"Tests over the round-trip warning threshold: {int(values['profiler.chatty_tests'])}")
+    return lines
+
+
+class TestRunProfile:
+    """Commands, HTTP calls and spans recorded during one test"""
+
+    def __init__(self, test_id: str, max_records: int):
+        self.test_id = test_id
+        self.max_records = max_records
+        self.thread_id = threading.get_ident()
+        self.started = time.perf_counter()
+        self.records: List[Dict[str, Any]] = []
+        self.dropped_records = 0
+        self.step_seconds: Dict[str, float] = defaultdict(float)
+        self.wait_seconds: Dict[str, float] = defaultdict(float)
+
+    def add(self, record: Dict[str, Any]):
+        if len(self.records) < self.max_records:
+            self.records.append(record)
+        else:
+            self.dropped_records += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Totals, per-step and per-command roll-ups and the raw records"""
+        duration = time.perf_counter() - self.started
+        steps: Dict[str, Dict[str, Any]] = {}
+        commands: Dict[str, Dict[str, Any]] = {}
+        actions: Dict[str, Dict[str, Any]] = {}
+        totals = {kind: {'count': 0, 'seconds': 0.0} for kind in ('webdriver', 'http')}
+        acting_seconds = 0.0
+
+        for record in self.records:
+            kind, seconds = record['kind'], record['seconds']
+            totals[kind]['count'] += 1
+            totals[kind]['seconds'] += seconds
+            if kind == 'webdriver' and not record['in_wait']:
+                acting_seconds += seconds
+
+            step = steps.setdefault(record['step'], {
+                'step': record['step'], 'webdriver_count': 0, 'webdriver_seconds': 0.0,
+                'http_count': 0, 'http_seconds': 0.0
+            })
+            step[f"{kind}_count"] += 1
+            step[f"{kind}_seconds"] += seconds
+
+            command = commands.setdefault(f"{kind} {record['name']}", {'count': 0, 'seconds': 0.0})
+            command['count'] += 1
+            command['seconds'] += seconds
+
+            if record['action']:
+                action = actions.setdefault(record['action'], {'count': 0, 'seconds': 0.0})
+                action['count'] += 1
+                action['seconds'] += seconds
+
+        for title, seconds in self.step_seconds.items():
+            steps.setdefault(title, {
+                'step': title, 'webdriver_count': 0, 'webdriver_seconds': 0.0,
+                'http_count': 0, 'http_seconds': 0.0
+            })['wall_seconds'] = seconds
+
+        return {
+            'test': self.test_id,
+            'duration': round(duration, 3),
+            'round_trips': totals['webdriver']['count'] + totals['http']['count'],
+            'totals': {kind: _rounded(values) for kind, values in totals.items()},
+            'waiting_seconds': round(sum(self.wait_seconds.values()), 3),
+            'acting_seconds': round(acting_seconds, 3),
+            'steps': [_rounded(step) for step in steps.values()],
+            'commands': _sorted_by_seconds(commands),
+            'page_actions': _sorted_by_seconds(actions),
+            'waits': {description: round(seconds, 3) for description, seconds in self.wait_seconds.items()},
+            'records': self.records,
+            'dropped_records': self.dropped_records
+        }
+
+
+class CommandProfiler:
+    """Records every WebDriver command and HTTP call of the running test.
+
+    Drivers and HTTP sessions are instrumented once; records are only kept
+    while a test profile is active and only from the test's own thread, so
+    background work such as user pool refills does not leak into tests.
+    Records are attributed to the innermost ``allure.step``, page action and
+    wait that is open when they happen.
+    """
+
+    _profile: Optional[TestRunProfile] = None
+    _local = threading.local()
+    _installed = False
+
+    @classmethod
+    def install(cls):
+        """Follow allure steps; safe to call more than once"""
+        if not cls._installed:
+            allure_commons.plugin_manager.register(_AllureStepListener())
+            cls._installed = True
+
+    @classmethod
+    def start(cls, test_id: str, max_records: int = 2000):
+        cls._local.stack = []
+        cls._profile = TestRunProfile(test_id, max_records)
+
+    @classmethod
+    def stop(cls) -> Optional[Dict[str, Any]]:
+        profile, cls._profile = cls._profile, None
+        if profile is None:
+            return None
+
+        result = profile.to_dict()
+        SessionStats.add('profiler.tests')
+        SessionStats.add('profiler.webdriver_commands', result['totals']['webdriver']['count'])
+        SessionStats.add('profiler.webdriver_seconds', result['totals']['webdriver']['seconds'])
+        SessionStats.add('profiler.http_calls', result['totals']['http']['count'])
+        SessionStats.add('profiler.http_seconds', result['totals']['http']['seconds'])
+        return result
+
+    @classmethod
+    def record(cls, kind: str, name: str, seconds: float, **details):
+        profile = cls._profile
+        if profile is None or threading.get_ident() != profile.thread_id:
+            return
+
+        stack = cls._stack()
+        profile.add(dict(
+            kind=kind,
+            name=name,
+            seconds=round(seconds, 4),
+            at=round(time.perf_counter() - profile.started, 4),
+            step=cls._innermost(stack, 'step') or NO_STEP,
+            action=cls._innermost(stack, 'action'),
+            in_wait=any(span_kind == 'wait' for span_kind, _ in stack),
+            **details
+        ))
+
+    @classmethod
+    @contextmanager
+    def span(cls, kind: str, name: str):
+        """Attribute everything recorded inside the block to a step, page action or wait"""
+        stack = cls._stack()
+        stack.append((kind, name))
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            profile = cls._profile
+            if profile is not None and kind in ('step', 'wait') and threading.get_ident() == profile.thread_id:
+                totals = profile.step_seconds if kind == 'step' else profile.wait_seconds
+                totals[name] += time.perf_counter() - started
+
+    @classmethod
+    def instrument_driver(cls, driver):
+        """Time every command a WebDriver sends, by wrapping its ``execute``"""
+        if getattr(driver, "_profiler_instrumented", False):
+            return driver
+
+        execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                name = driver_command
+                if driver_command == "executeCdpCommand" and params:
+                    name = f"{driver_command}:{params.get('cmd')}"
+                cls.record('webdriver', name, time.perf_counter() - started)
+
+        driver.execute = profiled_execute
+        driver._profiler_instrumented = True
+        return driver
+
+    @classmethod
+    def instrument_session(cls, session):
+        """Time every request a ``requests.Session`` sends"""
+        if getattr(session, "_profiler_instrumented", False):
+            return session
+
+        request = session.request
+
+        def profiled_request(method, url, *args, **kwargs):
+            started = time.perf_counter()
+            status = None
+            try:
+                response = request(method, url, *args, **kwargs)
+                status = response.status_code
+                return response
+            finally:
+                cls.record('http', f"{method.upper()} {urlsplit(url).path}",
+                           time.perf_counter() - started, status=status)
+
+        session.request = profiled_request
+        session._profiler_instrumented = True
+        return session
+
+    @classmethod
+    def _stack(cls) -> List:
+        if not hasattr(cls._local, "stack"):
+            cls._local.stack = []
+        return cls._local.stack
+
+    @staticmethod
+    def _innermost(stack, kind: str) -> Optional[str]:
+        for span_kind, name in reversed(stack):
+            if span_kind == kind:
+                return name
+        return None
+
+
+def profiled_action(method):
+    """Attribute the commands of a page object method to '<Page>.<method>'"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with CommandProfiler.span('action', f"{type(self).__name__}.{method.__name__}"):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def write_profile(profile: Dict[str, Any], output_dir: str, round_trip_warning: int) -> str:
+    """Save a test profile as JSON, attach it per the attachment policy and return the file path"""
+    os.makedirs(output_dir, exist_ok=True)
+    file_name = re.sub(r"[^\w.-]+", "_", profile['test']).strip("_")[:180] + ".json"
+    path = os.path.join(output_dir, file_name)
+    content = json.dumps(profile, indent=2)
+    with open(path, 'w') as f:
+        f.write(content)
+
+    # The file keeps every profile; the report copy follows the attachment policy and is gzipped, never cut short
+    AttachmentPipeline.attach(content, "performance-profile", allure.attachment_type.JSON, oversize='gzip')
+
+    if round_trip_warning and profile['round_trips'] > round_trip_warning:
+        SessionStats.add('profiler.chatty_tests')
+        print(f"⚠️ {profile['test']} made {profile['round_trips']} round-trips "
+              f"({profile['totals']['webdriver']['count']} WebDriver, {profile['totals']['http']['count']} HTTP)")
+    return path
+
+
+class _AllureStepListener:
+    """Opens a profiler span for every allure step"""
+
+    def __init__(self):
+        self._spans = {}
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        span = CommandProfiler.span('step', title)
+        span.__enter__()
+        self._spans[uuid] = span
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        span = self._spans.pop(uuid, None)
+        if span is not None:
+            span.__exit__(None, None, None)
+
+
+def _rounded(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: round(value, 3) if isinstance(value, float) else value for key, value in values.items()}
+
+
+def _sorted_by_seconds(entries: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows = [dict(name=name, **_rounded(values)) for name, values in entries.items()]
+    return sorted(rows, key=lambda row: row['seconds'], reverse=True)
@@ -0,0 +1,276 @@
+import json
+import os
+import re
+import shutil
+import socket
+import tempfile
+import threading
+import uuid
+from typing import Optional, Set
+
+
+def get_worker_id() -> str:
+    """The xdist worker id (gw0, gw1, ...) or 'main' when not running under xdist"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def get_worker_index() -> int:
+    """Numeric index of the xdist worker, 0 when not running under xdist"""
+    match = re.search(r"(\d+)$", get_worker_id())
+    return int(match.group(1)) if match else 0
+
+
+class PortAllocator:
+    """Hands out free local ports from a range reserved for this xdist worker.
+
+    Worker N owns ports ``BASE_PORT + N * RANGE_SIZE`` up to the next worker's
+    range, so workers can never pick the same port. Within the range a port is
+    only returned if it is not already handed out and can actually be bound,
+    which also skips ports held by other programs. If the range is exhausted
+    the OS picks a free port (bind to port 0).
+    """
+
+    BASE_PORT = 20000
+    RANGE_SIZE = 200
+
+    _in_use: Set[int] = set()
+    _cursor = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def reserve(cls) -> int:
+        """Return a free port that no other driver in this run is using"""
+        start = cls.BASE_PORT + get_worker_index() * cls.RANGE_SIZE
+        with cls._lock:
+            for _ in range(cls.RANGE_SIZE):
+                port = start + cls._cursor
+                cls._cursor = (cls._cursor + 1) % cls.RANGE_SIZE
+                if port not in cls._in_use and cls._is_free(port):
+                    cls._in_use.add(port)
+                    return port
+
+            port = cls._any_free_port()
+            cls._in_use.add(port)
+            return port
+
+    @classmethod
+    def release(cls, port: int):
+        with cls._lock:
+            cls._in_use.discard(port)
+
+    @staticmethod
+    def _is_free(port: int) -> bool:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind(("127.0.0.1", port))
+                return True
+            except OSError:
+                return False
+
+    @staticmethod
+    def _any_free_port() -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+
+# Chrome settings baked into the template profile: no first-run UI, prompts or
+# background services that would cost time or pop up over the page under test
+TEMPLATE_PREFERENCES = {
+    'browser': {'check_default_browser': False, 'has_seen_welcome_page': True},
+    'distribution': {
+        'skip_first_run_ui': True,
+        'suppress_first_run_bubble': True,
+        'suppress_first_run_default_browser_prompt': True,
+        'import_bookmarks': False,
+        'import_history': False,
+        'import_search_engine': False,
+        'make_chrome_default': False
+    },
+    'credentials_enable_service': False,
+    'profile': {
+        'password_manager_enabled': False,
+        'default_content_setting_values': {'notifications': 2, 'geolocation': 2}
+    },
+    'autofill': {'profile_enabled': False, 'credit_card_enabled': False},
+    'translate': {'enabled': False},
+    'safebrowsing': {'enabled': False},
+    'search': {'suggest_enabled': False}
+}
+
+TEMPLATE_VERSION = 1
+
+
+class ProfileTemplate:
+    """A pre-seeded Chrome user-data directory that per-driver profiles are cloned from.
+
+    The template has the first-run sentinel and ``TEMPLATE_PREFERENCES``
+    in place, so Chrome skips first-run setup. It is built once per machine
+    and shared by all workers; a build goes to a private directory that is
+    renamed into place, so concurrent workers never see a half-written one.
+    """
+
+    @staticmethod
+    def get_path() -> str:
+        return os.path.join(ProfileDirAllocator.get_root(), f"template_v{TEMPLATE_VERSION}")
+
+    @classmethod
+    def ensure(cls) -> str:
+        path = cls.get_path()
+        if os.path.isdir(path):
+            return path
+
+        building = f"{path}.{os.getpid()}.{threading.get_ident()}"
+        os.makedirs(os.path.join(building, "Default"), exist_ok=True)
+        open(os.path.join(building, "First Run"), 'w').close()
+        with open(os.path.join(building, "Local State"), 'w') as f:
+            json.dump({'browser': {'has_seen_welcome_page': True}}, f)
+        with open(os.path.join(building, "Default", "Preferences"), 'w') as f:
+            json.dump(TEMPLATE_PREFERENCES, f)
+
+        try:
+            os.rename(building, path)
+        except OSError:
+            # Another worker won the race, its template is identical
+            shutil.rmtree(building, ignore_errors=True)
+        return path
+
+    @classmethod
+    def clone_to(cls, destination: str):
+        """Copy the template with hardlinks, falling back to a plain copy across filesystems.
+
+        Chrome replaces Preferences and Local State atomically instead of
+        writing into them, so a linked file is never modified in place.
+        """
+        shutil.copytree(cls.ensure(), destination, copy_function=_link_or_copy)
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process exists; on Windows os.kill would terminate it, so every pid counts as alive"""
+    if os.name == "nt":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _link_or_copy(source: str, destination: str):
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+class ProfileDirAllocator:
+    """Chrome user-data directories per xdist worker and run.
+
+    Directories live under ``<tmp>/orangehrm_chrome/<worker id>-<pid>/profile_<n>``
+    where ``n`` is the lowest slot not used by a live driver of this worker.
+    The pid keeps runs that share a machine apart: a run only ever renames,
+    empties or removes directories under its own worker root. Worker roots
+    left behind by runs whose process is gone are reclaimed on the first
+    ``acquire``. Each profile is a clone of the ProfileTemplate. Released
+    profiles are renamed into the worker's ``trash`` directory, which is
+    cheap, and deleted there by a background janitor thread; ``cleanup``
+    removes the whole worker root at session end.
+    """
+
+    _in_use: Set[int] = set()
+    _lock = threading.Lock()
+    _trash_ready = threading.Event()
+    _janitor: Optional[threading.Thread] = None
+    _stopping = False
+    _reclaimed = False
+
+    @staticmethod
+    def get_root() -> str:
+        return os.path.join(tempfile.gettempdir(), "orangehrm_chrome")
+
+    @classmethod
+    def get_worker_root(cls) -> str:
+        return os.path.join(cls.get_root(), f"{get_worker_id()}-{os.getpid()}")
+
+    @classmethod
+    def get_trash_dir(cls) -> str:
+        return os.path.join(cls.get_worker_root(), "trash")
+
+    @classmethod
+    def acquire(cls) -> str:
+        """Return a fresh profile directory, cloned from the template, reserved for one driver"""
+        with cls._lock:
+            slot = 0
+            while slot in cls._in_use:
+                slot += 1
+            cls._in_use.add(slot)
+            reclaim, cls._reclaimed = not cls._reclaimed, True
+
+        if reclaim:
+            cls._reclaim_dead_runs()
+        path = os.path.join(cls.get_worker_root(), f"profile_{slot}")
+
+        # Leftovers from a failed release must not leak into the next driver
+        if os.path.exists(path):
+            cls._move_to_trash(path)
+            shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(cls.get_worker_root(), exist_ok=True)
+        ProfileTemplate.clone_to(path)
+        return path
+
+    @classmethod
+    def release(cls, path: str):
+        cls._move_to_trash(path)
+        slot = int(os.path.basename(path).rsplit("_", 1)[1])
+        with cls._lock:
+            cls._in_use.discard(slot)
+
+    @classmethod
+    def cleanup(cls):
+        """Remove this worker's profiles and trash, at session end once every driver has quit"""
+        cls._stopping = True
+        cls._trash_ready.set()
+        if cls._janitor is not None:
+            cls._janitor.join(timeout=30)
+            cls._janitor = None
+        cls._stopping = False
+        shutil.rmtree(cls.get_worker_root(), ignore_errors=True)
+
+    @classmethod
+    def _reclaim_dead_runs(cls):
+        """Move worker roots of runs whose process has exited into this worker's trash"""
+        root = cls.get_root()
+        for name in os.listdir(root) if os.path.isdir(root) else []:
+            match = re.fullmatch(r"(?:main|gw\d+)-(\d+)", name)
+            if match and not _process_alive(int(match.group(1))):
+                cls._move_to_trash(os.path.join(root, name))
+
+    @classmethod
+    def _move_to_trash(cls, path: str):
+        trash = cls.get_trash_dir()
+        os.makedirs(trash, exist_ok=True)
+        try:
+            os.rename(path, os.path.join(trash, f"{os.path.basename(path)}_{uuid.uuid4().hex[:8]}"))
+        except OSError:
+            return
+        cls._ensure_janitor()
+        cls._trash_ready.set()
+
+    @classmethod
+    def _ensure_janitor(cls):
+        with cls._lock:
+            if cls._janitor is None or not cls._janitor.is_alive():
+                cls._janitor = threading.Thread(target=cls._empty_trash, name="profile-janitor", daemon=True)
+                cls._janitor.start()
+
+    @classmethod
+    def _empty_trash(cls):
+        while cls._trash_ready.wait(timeout=60):
+            cls._trash_ready.clear()
+            trash = cls.get_trash_dir()
+            for name in os.listdir(trash) if os.path.isdir(trash) else []:
+                shutil.rmtree(os.path.join(trash, name), ignore_errors=True)
+            if cls._stopping:
+                return
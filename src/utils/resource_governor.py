@@ -0,0 +1,281 @@
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.utils.config_reader import ConfigReader
+from src.utils.session_stats import SessionStats
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-worker launch slots
+    fcntl = None
+
+
+SLOT_DIR = os.path.join(tempfile.gettempdir(), "orangehrm_governor")
+
+# Memory profile keys for chrome-cdp browser contexts: one context's share of
+# the shared Chrome, and the shared Chrome itself with no context open
+CONTEXT_PROFILE = "chrome-cdp:context"
+HOST_PROFILE = "chrome-cdp:host"
+
+
+@SessionStats.register_summary
+def _governor_summary(values):
+    if not any(key.startswith('governor.') for key in values):
+        return []
+    return [f"Resource governor: {int(values.get('governor.pressure_waits', 0))} launches waited for memory "
+            f"({values.get('governor.wait_seconds', 0):.1f}s), "
+            f"peak memory used {values.get('governor.used_mb.max', 0):.0f}MB, "
+            f"peak load {values.get('governor.load.max', 0):.1f}, "
+            f"largest browser {values.get('governor.browser_mb.max', 0):.0f}MB RSS"
+            + (f", largest context {values['governor.context_mb.max']:.0f}MB"
+               if 'governor.context_mb.max' in values else "")]
+
+
+def read_meminfo() -> Optional[Dict[str, int]]:
+    """MemTotal and MemAvailable from /proc/meminfo in MB, None where there is no /proc"""
+    try:
+        with open("/proc/meminfo") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return None
+    return {name: int(fields[name].split()[0]) // 1024 for name in ('MemTotal', 'MemAvailable') if name in fields}
+
+
+def process_tree_rss(pid: int) -> int:
+    """Resident memory of a process and all its descendants, in bytes; 0 where /proc is unavailable"""
+    children: Dict[int, List[int]] = {}
+    rss: Dict[int, int] = {}
+    try:
+        entries = [entry for entry in os.listdir('/proc') if entry.isdigit()]
+    except OSError:
+        return 0
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    for entry in entries:
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, so split after its closing parenthesis
+                fields = f.read().rsplit(')', 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+        rss[int(entry)] = int(fields[21]) * page_size
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += rss.get(current, 0)
+        pending.extend(children.get(current, []))
+    return total
+
+
+@contextmanager
+def machine_lock(name: str):
+    """Hold a lock shared by every worker and run on this machine, from the same lock files as the launch slots"""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(SLOT_DIR, exist_ok=True)
+    with open(os.path.join(SLOT_DIR, f"{name}.lock"), "w") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def browser_pid(driver) -> Optional[int]:
+    """Root of the driver's browser process tree: chromedriver/geckodriver, or Chrome for chrome-cdp"""
+    process = getattr(driver, 'process', None) or getattr(getattr(driver, 'service', None), 'process', None)
+    return getattr(process, 'pid', None)
+
+
+class MemoryProfile:
+    """Measured RSS per browser type in a local SQLite file, as a moving average like TimingDatabase"""
+
+    def __init__(self, path: str, smoothing: float = 0.3):
+        self.path = path
+        self.smoothing = smoothing
+
+    def load(self) -> Dict[str, float]:
+        if not os.path.exists(self.path):
+            return {}
+        with self._connect() as connection:
+            return dict(connection.execute("SELECT browser, rss_mb FROM browser_memory"))
+
+    def update(self, browser: str, rss_mb: float):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                """
+                INSERT INTO browser_memory (browser, rss_mb, samples, updated) VALUES (?, ?, 1, ?)
+                ON CONFLICT(browser) DO UPDATE SET
+                    rss_mb = rss_mb + ? * (excluded.rss_mb - rss_mb),
+                    samples = samples + 1,
+                    updated = excluded.updated
+                """,
+                (browser, rss_mb, datetime.now().isoformat(timespec='seconds'), self.smoothing)
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS browser_memory ("
+            "browser TEXT PRIMARY KEY, rss_mb REAL NOT NULL, samples INTEGER NOT NULL, updated TEXT)"
+        )
+        return connection
+
+
+class ResourceGovernor:
+    """Sizes and paces browser use by the memory the machine actually has.
+
+    ``auto_workers`` picks the ``-n auto`` worker count from MemAvailable and
+    the measured RSS of the configured browser, capped by the CPU count. With
+    chrome-cdp browser contexts a worker costs one context instead, plus the
+    shared Chrome once. ``launch_slot`` wraps every browser launch: at most
+    ``launch_slots`` launches run at once across all workers, using lock
+    files in the temp directory, and the holder of a slot waits while
+    MemAvailable is below one browser plus ``reserve_mb`` (at most
+    ``max_wait`` seconds). Checking inside the slot means workers that see
+    memory recover at the same moment still launch one slot at a time, each
+    seeing what the previous launch used. ``record_browser`` and
+    ``record_context`` measure before a driver is quit and fold the result
+    into the profile for the next run.
+    """
+
+    def __init__(self, enabled: bool = True, reserve_mb: int = 1024, default_browser_mb: int = 600,
+                 default_context_mb: int = 150, launch_slots: int = 2, max_wait: float = 120,
+                 database: str = "reports/browser-memory.sqlite", smoothing: float = 0.3):
+        self.enabled = enabled
+        self.reserve_mb = reserve_mb
+        self.default_browser_mb = default_browser_mb
+        self.default_context_mb = default_context_mb
+        self.launch_slots = launch_slots
+        self.max_wait = max_wait
+        self.profile = MemoryProfile(database, smoothing)
+        self._browser_mb: Optional[Dict[str, float]] = None
+
+    @classmethod
+    def from_config(cls) -> "ResourceGovernor":
+        return cls(**ConfigReader.get_governor_config())
+
+    def browser_mb(self, browser: str) -> float:
+        if self._browser_mb is None:
+            try:
+                self._browser_mb = self.profile.load()
+            except sqlite3.Error:
+                self._browser_mb = {}
+        default = self.default_context_mb if browser == CONTEXT_PROFILE else self.default_browser_mb
+        return self._browser_mb.get(browser, default)
+
+    @staticmethod
+    def profile_key(browser: str, contexts: bool = False) -> str:
+        """Memory profile of one driver: a browser context when chrome-cdp runs in a shared Chrome"""
+        return CONTEXT_PROFILE if contexts and browser == "chrome-cdp" else browser
+
+    def auto_workers(self, browser: str, browsers_per_worker: int = 1, contexts: bool = False) -> Optional[int]:
+        """Workers that fit in the available memory, at most one per CPU; None without /proc/meminfo"""
+        memory = read_meminfo()
+        if not self.enabled or not memory or 'MemAvailable' not in memory:
+            return None
+        key = self.profile_key(browser, contexts)
+        shared = self.browser_mb(HOST_PROFILE) if key == CONTEXT_PROFILE else 0
+        per_worker = self.browser_mb(key) * browsers_per_worker
+        fit = int((memory['MemAvailable'] - self.reserve_mb - shared) // per_worker)
+        workers = max(1, min(os.cpu_count() or 1, fit))
+        print(f"✅ Resource governor: {workers} workers for {memory['MemAvailable']}MB available, "
+              f"~{per_worker:.0f}MB per worker ({browsers_per_worker} x {key}), {os.cpu_count()} CPUs")
+        return workers
+
+    @contextmanager
+    def launch_slot(self, browser: str):
+        """Hold a cross-worker launch slot, and wait out memory pressure while holding it"""
+        if not self.enabled:
+            yield
+            return
+        with self._slot():
+            self._wait_for_memory(browser)
+            yield
+
+    def record_browser(self, driver, browser: str):
+        pid = browser_pid(driver)
+        if not self.enabled or pid is None:
+            return
+        rss_mb = process_tree_rss(pid) / 1048576
+        if not rss_mb:
+            return
+        SessionStats.set_max('governor.browser_mb.max', rss_mb)
+        self._store(browser, rss_mb)
+
+    def record_host(self, pid: int) -> float:
+        """Measure a freshly launched shared Chrome; returns its RSS in MB, the baseline for its contexts"""
+        rss_mb = process_tree_rss(pid) / 1048576
+        if self.enabled and rss_mb:
+            self._store(HOST_PROFILE, rss_mb)
+        return rss_mb
+
+    def record_context(self, pid: int, baseline_mb: float, open_contexts: int):
+        """Store one context's share of the shared Chrome's growth over its baseline"""
+        if not self.enabled or open_contexts <= 0 or not baseline_mb:
+            return
+        rss_mb = process_tree_rss(pid) / 1048576
+        per_context = (rss_mb - baseline_mb) / open_contexts
+        if rss_mb and per_context > 0:
+            SessionStats.set_max('governor.context_mb.max', per_context)
+            self._store(CONTEXT_PROFILE, per_context)
+
+    def _store(self, key: str, rss_mb: float):
+        try:
+            self.profile.update(key, rss_mb)
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not store the browser memory profile: {e}")
+
+    def _wait_for_memory(self, browser: str):
+        needed = self.browser_mb(browser) + self.reserve_mb
+        started = time.monotonic()
+        waited = False
+        while True:
+            memory = read_meminfo()
+            if not memory or 'MemAvailable' not in memory:
+                return
+            SessionStats.set_max('governor.used_mb.max', memory['MemTotal'] - memory['MemAvailable'])
+            SessionStats.set_max('governor.load.max', os.getloadavg()[0])
+            if memory['MemAvailable'] >= needed:
+                break
+            if time.monotonic() - started > self.max_wait:
+                print(f"⚠️ Launching {browser} with only {memory['MemAvailable']}MB available after "
+                      f"waiting {self.max_wait:.0f}s for memory")
+                break
+            waited = True
+            time.sleep(0.5)
+        if waited:
+            SessionStats.add('governor.pressure_waits')
+            SessionStats.add('governor.wait_seconds', time.monotonic() - started)
+
+    @contextmanager
+    def _slot(self):
+        if fcntl is None or self.launch_slots <= 0:
+            yield
+            return
+        os.makedirs(SLOT_DIR, exist_ok=True)
+        while True:
+            for index in range(self.launch_slots):
+                handle = open(os.path.join(SLOT_DIR, f"launch-{index}.lock"), "w")
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    handle.close()
+                    continue
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+                    handle.close()
+                return
+            time.sleep(0.05)
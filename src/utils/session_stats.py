@@ -0,0 +1,63 @@
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+
+class SessionStats:
+    """Process-wide counters reported in the pytest session summary.
+
+    Each xdist worker accumulates its own counters; conftest ships them to the
+    controller through ``workeroutput`` where they are merged and formatted
+    by the summary callbacks that modules register with ``register_summary``.
+    """
+
+    _values: Dict[str, float] = defaultdict(float)
+    _summaries: List[Callable[[Dict[str, float]], List[str]]] = []
+    _lock = threading.Lock()
+
+    @classmethod
+    def add(cls, name: str, amount: float = 1):
+        """Increase a counter"""
+        with cls._lock:
+            cls._values[name] += amount
+
+    @classmethod
+    def set_max(cls, name: str, value: float):
+        """Keep the largest value seen for a counter"""
+        with cls._lock:
+            cls._values[name] = max(cls._values.get(name, value), value)
+
+    @classmethod
+    def get(cls, name: str) -> float:
+        with cls._lock:
+            return cls._values.get(name, 0)
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, float]:
+        with cls._lock:
+            return dict(cls._values)
+
+    @classmethod
+    def merge(cls, values: Dict[str, float]):
+        """Add counters received from another process, e.g. an xdist worker"""
+        with cls._lock:
+            for name, value in values.items():
+                if name.endswith('.max'):
+                    cls._values[name] = max(cls._values.get(name, value), value)
+                else:
+                    cls._values[name] += value
+
+    @classmethod
+    def register_summary(cls, formatter: Callable[[Dict[str, float]], List[str]]):
+        """Register a callback that turns counters into summary lines"""
+        if formatter not in cls._summaries:
+            cls._summaries.append(formatter)
+        return formatter
+
+    @classmethod
+    def summary_lines(cls) -> List[str]:
+        values = cls.snapshot()
+        lines = []
+        for formatter in cls._summaries:
+            lines.extend(formatter(values))
+        return lines
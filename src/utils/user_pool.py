@@ -0,0 +1,120 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from src.utils.api_helper import unique_username
+from src.utils.bulk_api_helper import BulkLookupError, OrangeHRMBulkApiHelper
+
+
+class UserPool:
+    """Session-level pool of pre-created system users.
+
+    A background thread keeps ``target_size`` users ready so tests can lease
+    one without waiting on a create round-trip. Every user the pool created,
+    leased or not, is deleted in batched DELETE calls on ``shutdown``.
+    """
+
+    def __init__(self, api_helper: OrangeHRMBulkApiHelper, target_size: int = 3,
+                 prefix: str = "autotest", authenticate: Optional[Callable[[OrangeHRMBulkApiHelper], Any]] = None,
+                 lease_timeout: float = 30, **user_kwargs):
+        self.api_helper = api_helper
+        self.target_size = target_size
+        self.prefix = prefix
+        self.lease_timeout = lease_timeout
+        self.user_kwargs = user_kwargs
+        self._authenticate = authenticate
+        self._ready: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._created: List[Dict[str, Any]] = []
+        self._created_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.leased = 0
+        self.created_inline = 0
+
+    def start(self):
+        """Start replenishing the pool in the background"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._replenish, name="user-pool", daemon=True)
+            self._thread.start()
+        return self
+
+    def lease(self) -> Dict[str, Any]:
+        """Take a ready user, creating one inline if the pool cannot supply it in time"""
+        self._wakeup.set()
+        try:
+            user = self._ready.get(timeout=self.lease_timeout)
+        except queue.Empty:
+            print("⚠️ User pool empty, creating user inline")
+            self._refresh_auth()
+            user = self.api_helper.create_user(username=unique_username(self.prefix), **self.user_kwargs)
+            self._track([user])
+            self.created_inline += 1
+
+        self.leased += 1
+        self._wakeup.set()
+        return user
+
+    def shutdown(self):
+        """Stop replenishing and delete every user the pool created"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.lease_timeout)
+
+        with self._created_lock:
+            users = list(self._created)
+            self._created = []
+        if not users:
+            return
+
+        self._refresh_auth()
+        started = time.monotonic()
+        if not self.api_helper.delete_users([user['id'] for user in users]):
+            # Tests may delete their own user (e.g. through the UI), which fails
+            # the whole batch, so retry with only the users that still exist
+            try:
+                existing = self.api_helper.get_users_bulk([user['username'] for user in users])
+                unknown = []
+            except BulkLookupError as e:
+                existing = e.found
+                unknown = [user['id'] for user in users if user['username'] in e.failed]
+            remaining = [user['id'] for user in existing.values() if user is not None]
+            if remaining:
+                self.api_helper.delete_users(remaining)
+            if unknown:
+                # Whether these still exist is unknown, so one per request keeps a deleted one from failing the others
+                self.api_helper.delete_users(unknown, batch_size=1)
+
+        print(f"User pool: {self.leased} leased, {len(users)} cleaned up "
+              f"in {time.monotonic() - started:.2f}s")
+
+    def _replenish(self):
+        while not self._stopped.is_set():
+            missing = self.target_size - self._ready.qsize()
+            if missing <= 0:
+                self._wakeup.wait(timeout=1)
+                self._wakeup.clear()
+                continue
+
+            try:
+                self._refresh_auth()
+                users = self.api_helper.create_users_bulk(
+                    missing, prefix=self.prefix, strict=False, **self.user_kwargs
+                )
+            except Exception as e:
+                print(f"⚠️ User pool failed to create users: {e}")
+                self._stopped.wait(timeout=2)
+                continue
+
+            self._track(users)
+            for user in users:
+                self._ready.put(user)
+
+    def _track(self, users: List[Dict[str, Any]]):
+        with self._created_lock:
+            self._created.extend(users)
+
+    def _refresh_auth(self):
+        if self._authenticate is not None:
+            self._authenticate(self.api_helper)
@@ -0,0 +1,112 @@
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+import allure
+import requests
+from src.utils.attachments import AttachmentPipeline
+from src.utils.cassettes import Cassette
+from src.utils.config_reader import ConfigReader
+from src.utils.session_stats import SessionStats
+
+
+@SessionStats.register_summary
+def _verification_summary(values):
+    if not values.get('verification.checks'):
+        return []
+    return [f"Verifications: {int(values['verification.checks'])}, "
+            f"{values.get('verification.api_seconds', 0):.1f}s API polling, "
+            f"{values.get('verification.ui_seconds', 0):.1f}s UI checks, "
+            f"{int(values.get('verification.failed', 0))} failed"]
+
+
+class Verifier:
+    """Confirms backend state through the API before looking at the UI.
+
+    The API check is polled with exponential backoff until it passes or
+    ``timeout`` runs out, which is cheaper and more reliable than waiting for
+    the UI to render the outcome. The UI check runs once, and only after the
+    API agrees, so it sees the final state and needs a short timeout only.
+    Both results are recorded in a single Allure step.
+    """
+
+    def __init__(self, api_helper, timeout: float = 10.0, initial_delay: float = 0.25,
+                 max_delay: float = 2.0, backoff: float = 2.0, ui_timeout: float = 5.0):
+        self.api = api_helper
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.ui_timeout = ui_timeout
+
+    @classmethod
+    def from_config(cls, api_helper) -> "Verifier":
+        return cls(api_helper, **ConfigReader.get_verification_config())
+
+    def verify(self, description: str, api_check: Callable[[], bool],
+               ui_check: Optional[Callable[[float], bool]] = None) -> bool:
+        """Poll ``api_check`` until it passes, then run ``ui_check(ui_timeout)`` once"""
+        with allure.step(f"Verify {description}"):
+            results = [self._poll_api(api_check)]
+            if ui_check is not None:
+                results.append(self._check_ui(ui_check) if results[0]['passed'] else
+                               {'channel': 'ui', 'passed': None, 'skipped': "API did not agree"})
+
+            passed = all(result['passed'] for result in results)
+            AttachmentPipeline.attach(json.dumps(results, indent=2), "verification", allure.attachment_type.JSON)
+
+        SessionStats.add('verification.checks')
+        if passed:
+            print(f"✅ Verified {description}")
+        else:
+            SessionStats.add('verification.failed')
+            print(f"❌ Could not verify {description}: {results}")
+        return passed
+
+    def user_deleted(self, username: str, ui_check: Optional[Callable[[float], bool]] = None) -> bool:
+        return self.verify(f"user '{username}' is deleted",
+                           lambda: self.api.get_user_by_username(username) is None, ui_check)
+
+    def user_exists(self, username: str, ui_check: Optional[Callable[[float], bool]] = None) -> bool:
+        return self.verify(f"user '{username}' exists",
+                           lambda: self.api.get_user_by_username(username) is not None, ui_check)
+
+    def _poll_api(self, api_check: Callable[[], bool]) -> Dict[str, Any]:
+        started = time.monotonic()
+        deadline = started + self.timeout
+        delay = self.initial_delay
+        attempts = 0
+        passed = False
+        last_error = None
+
+        while True:
+            attempts += 1
+            try:
+                # Always ask the live server; a replayed answer would verify nothing
+                with Cassette.suspended():
+                    passed = bool(api_check())
+                last_error = None
+            except requests.RequestException as e:
+                last_error = f"{type(e).__name__}: {e}"
+
+            remaining = deadline - time.monotonic()
+            if passed or remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * self.backoff, self.max_delay)
+
+        seconds = time.monotonic() - started
+        SessionStats.add('verification.api_seconds', seconds)
+        return {
+            'channel': 'api',
+            'passed': passed,
+            'attempts': attempts,
+            'seconds': round(seconds, 3),
+            'last_error': last_error
+        }
+
+    def _check_ui(self, ui_check: Callable[[float], bool]) -> Dict[str, Any]:
+        started = time.monotonic()
+        passed = bool(ui_check(self.ui_timeout))
+        seconds = time.monotonic() - started
+        SessionStats.add('verification.ui_seconds', seconds)
+        return {'channel': 'ui', 'passed': passed, 'seconds': round(seconds, 3)}
@@ -0,0 +1,215 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, StaleElementReferenceException,
+    TimeoutException, WebDriverException
+)
+from src.utils.profiler import CommandProfiler
+from src.utils.session_stats import SessionStats
+
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# OrangeHRM shows a spinner while lists load and "Searching..." in autocomplete
+# dropdowns while it queries the API. Returns true once neither is present.
+APP_IDLE_CHECK = """
+    return !document.querySelector('.oxd-loading-spinner')
+        && !(document.body && document.body.innerText.indexOf('Searching...') !== -1);
+"""
+
+# Resolves as soon as the app is idle, re-checking on DOM mutations and at most
+# once per animation frame, so there is no fixed polling interval.
+APP_IDLE_ASYNC = """
+    var done = arguments[arguments.length - 1];
+    var timeoutMs = arguments[0];
+    var isIdle = function () {
+        %s
+    };
+    if (isIdle()) { return done(true); }
+    var scheduled = false;
+    var observer = new MutationObserver(function () {
+        if (scheduled) { return; }
+        scheduled = true;
+        requestAnimationFrame(function () {
+            scheduled = false;
+            if (isIdle()) { finish(true); }
+        });
+    });
+    var timer = setTimeout(function () { finish(isIdle()); }, timeoutMs);
+    function finish(result) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(result);
+    }
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true, attributes: true});
+""" % APP_IDLE_CHECK
+
+# Resolves once the DOM has not changed for quietMs milliseconds
+DOM_SETTLED_ASYNC = """
+    var done = arguments[arguments.length - 1];
+    var quietMs = arguments[0], timeoutMs = arguments[1];
+    var quietTimer, observer;
+    var hardTimer = setTimeout(function () { finish(false); }, timeoutMs);
+    function finish(result) {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(hardTimer);
+        done(result);
+    }
+    function restartQuietTimer() {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(function () { finish(true); }, quietMs);
+    }
+    observer = new MutationObserver(restartQuietTimer);
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true, attributes: true});
+    restartQuietTimer();
+"""
+
+
+@SessionStats.register_summary
+def _wait_summary(values):
+    if not values.get('waits.count'):
+        return []
+    return [f"Waits: {int(values['waits.count'])} waits, {values.get('waits.seconds', 0):.1f}s total, "
+            f"{int(values.get('waits.timeouts', 0))} timed out"]
+
+
+class WaitRecorder:
+    """Collects how long every wait took compared to its timeout"""
+
+    _records: List[Dict[str, Any]] = []
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, description: str, timeout: float, elapsed: float, succeeded: bool, polls: int):
+        with cls._lock:
+            cls._records.append({
+                'description': description,
+                'timeout': timeout,
+                'elapsed': round(elapsed, 3),
+                'timeout_used_pct': round(100 * elapsed / timeout, 1) if timeout else None,
+                'succeeded': succeeded,
+                'polls': polls
+            })
+        SessionStats.add('waits.count')
+        SessionStats.add('waits.seconds', elapsed)
+        if not succeeded:
+            SessionStats.add('waits.timeouts')
+
+    @classmethod
+    def drain(cls) -> List[Dict[str, Any]]:
+        """Return and forget the records collected so far"""
+        with cls._lock:
+            records = cls._records
+            cls._records = []
+        return records
+
+
+class WaitEngine:
+    """Explicit waits with adaptive polling, meant to be used with implicit wait 0.
+
+    Polling starts at ``initial_poll`` and backs off by ``backoff`` up to
+    ``max_poll``: conditions that are already true return after one check,
+    and long waits do not hammer the driver. The final check happens at the
+    deadline, so a wait never overruns its timeout by more than one command.
+    """
+
+    def __init__(self, driver, initial_poll: float = 0.05, max_poll: float = 0.5,
+                 backoff: float = 1.5, browser_side: bool = True):
+        self.driver = driver
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+        self.browser_side = browser_side
+
+    def until(self, condition: Callable, timeout: float, description: Optional[str] = None):
+        """Wait until ``condition(driver)`` returns a truthy value and return it"""
+        return self._poll(condition, timeout, description or _describe(condition), expect=True)
+
+    def until_not(self, condition: Callable, timeout: float, description: Optional[str] = None):
+        """Wait until ``condition(driver)`` returns a falsy value"""
+        return self._poll(condition, timeout, f"not {description or _describe(condition)}", expect=False)
+
+    def until_app_idle(self, timeout: float) -> bool:
+        """Wait for OrangeHRM's loading spinner and 'Searching...' indicator to disappear"""
+        if self.browser_side:
+            try:
+                return self._run_async("app idle", timeout, APP_IDLE_ASYNC, int(timeout * 1000))
+            except JavascriptException:
+                pass
+        return self.until(lambda driver: driver.execute_script(APP_IDLE_CHECK), timeout, "app idle")
+
+    def until_dom_settled(self, timeout: float, quiet_ms: int = 100) -> bool:
+        """Wait until the DOM has stopped changing for ``quiet_ms`` milliseconds"""
+        return self._run_async("DOM settled", timeout, DOM_SETTLED_ASYNC, quiet_ms, int(timeout * 1000))
+
+    def _poll(self, condition: Callable, timeout: float, description: str, expect: bool):
+        with CommandProfiler.span('wait', description):
+            return self._poll_until_deadline(condition, timeout, description, expect)
+
+    def _poll_until_deadline(self, condition: Callable, timeout: float, description: str, expect: bool):
+        started = time.monotonic()
+        deadline = started + timeout
+        interval = self.initial_poll
+        polls = 0
+
+        while True:
+            polls += 1
+            try:
+                value = condition(self.driver)
+                if bool(value) == expect:
+                    WaitRecorder.record(description, timeout, time.monotonic() - started, True, polls)
+                    return value if expect else True
+            except IGNORED_EXCEPTIONS:
+                if not expect:
+                    WaitRecorder.record(description, timeout, time.monotonic() - started, True, polls)
+                    return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                WaitRecorder.record(description, timeout, time.monotonic() - started, False, polls)
+                raise TimeoutException(f"Timed out after {timeout}s waiting for {description}")
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll)
+
+    def run_async(self, description: str, timeout: float, script: str, *args):
+        """Run a self-resolving async script, allowing it up to ``timeout`` seconds"""
+        self._ensure_script_timeout(timeout + 1)
+
+        started = time.monotonic()
+        try:
+            with CommandProfiler.span('wait', description):
+                result = self.driver.execute_async_script(script, *args)
+            succeeded = True
+        except TimeoutException:
+            result = None
+            succeeded = False
+        WaitRecorder.record(description, timeout, time.monotonic() - started, succeeded, 1)
+        return result
+
+    def _run_async(self, description: str, timeout: float, script: str, *args) -> bool:
+        """Run a browser-side wait; the script resolves itself before its own timeout"""
+        return bool(self.run_async(description, timeout, script, *args))
+
+    def _ensure_script_timeout(self, seconds: float):
+        """Raise the driver's script timeout if needed, without a round-trip when it already suffices"""
+        current = getattr(self.driver, "_wait_engine_script_timeout", 30)
+        if seconds > current:
+            try:
+                self.driver.set_script_timeout(seconds)
+            except WebDriverException:
+                return
+            self.driver._wait_engine_script_timeout = seconds
+
+
+def _describe(condition: Callable) -> str:
+    """Readable name for an expected_conditions predicate, including its locator"""
+    name = getattr(condition, "__qualname__", repr(condition)).split(".<locals>")[0]
+    closure = getattr(condition, "__closure__", None) or ()
+    for cell in closure:
+        value = cell.cell_contents
+        if isinstance(value, tuple) and len(value) == 2:
+            return f"{name}{value}"
+    return name